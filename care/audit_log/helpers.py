@@ -1,5 +1,6 @@
 # ruff: noqa: SLF001
 import re
+from copy import deepcopy
 from fnmatch import fnmatch
 from functools import lru_cache
 from typing import NamedTuple
@@ -25,6 +26,17 @@ def seperate_hashable_dict(d: dict):
     return hashable, non_hashable
 
 
+def take_snapshot(instance) -> dict:
+    """
+    Copies the member fields of the instance, mutable values are copied deeply
+    so that changes made to them in place are not reflected in the snapshot.
+    """
+    return {
+        k: deepcopy(v) if instance_finder(v) else v
+        for k, v in remove_non_member_fields(instance.__dict__).items()
+    }
+
+
 def get_or_create_meta(instance):
     if not hasattr(instance._meta, "dal"):
         instance._meta.dal = MetaDataContainer()
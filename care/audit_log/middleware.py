@@ -18,6 +18,8 @@ class RequestInformation(NamedTuple):
 
 logger = logging.getLogger(__name__)
 
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
 
 class AuditLogMiddleware:
     thread = threading.local()
@@ -78,12 +80,17 @@ class AuditLogMiddleware:
         return environ.request
 
     def __call__(self, request: HttpRequest):
-        if request.method.lower() == "get":
+        # reads are not audited, so instances loaded by them aren't snapshotted
+        if request.method in SAFE_METHODS:
             return self.get_response(request)
 
         self.save(request)
-        response: HttpResponse = self.get_response(request)
-        self.save(request, response)
+        try:
+            response: HttpResponse = self.get_response(request)
+            self.save(request, response)
+        finally:
+            # later requests handled by this thread must not be taken as audited
+            self.cleanup()
 
         current_user_str = f"{request.user.id}|{request.user}" if request.user else None
 
@@ -5,9 +5,12 @@ from typing import NamedTuple
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import transaction
-from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 
 from care.audit_log.enums import Operation
@@ -18,8 +21,10 @@ from care.audit_log.helpers import (
     get_or_create_meta,
     remove_non_member_fields,
     seperate_hashable_dict,
+    take_snapshot,
 )
 from care.audit_log.middleware import AuditLogMiddleware
+from care.audit_log.sink import sink
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +36,46 @@ class Event(NamedTuple):
     changes: dict
 
 
+def _get_previous_state(sender, instance, update_fields) -> dict | None:
+    """
+    Returns the state of the instance as it was last saved in this request,
+    or else as it is in the database, or None if it is being inserted. Only
+    the fields being saved are read from the database.
+    """
+    if instance._state.adding and (
+        instance.pk is None or instance._meta.pk.has_default()
+    ):
+        return None
+
+    snapshot = instance.__dict__.get("_audit_log_snapshot")
+    if (
+        snapshot is not None
+        and not instance._state.adding
+        and all(
+            field.attname in snapshot or field.attname not in instance.__dict__
+            for field in instance._meta.concrete_fields
+        )
+    ):
+        return snapshot
+
+    return (
+        sender._base_manager.filter(pk=instance.pk)
+        .values(
+            *(
+                field.attname
+                for field in instance._meta.concrete_fields
+                if update_fields is None
+                or field.name in update_fields
+                or field.attname in update_fields
+            )
+        )
+        .first()
+    )
+
+
 @receiver(pre_delete, weak=False)
 @receiver(pre_save, weak=False)
-@transaction.atomic
-def pre_save_signal(sender, instance, **kwargs) -> None:
+def pre_save_signal(sender, instance, signal, update_fields=None, **kwargs) -> None:
     if not settings.AUDIT_LOG_ENABLED:
         return
 
@@ -50,23 +91,21 @@ def pre_save_signal(sender, instance, **kwargs) -> None:
     get_or_create_meta(instance)
     instance._meta.dal.event = None
 
-    operation = Operation.UPDATE
-    try:
-        pre = sender.objects.get(pk=instance.pk)
-    except ObjectDoesNotExist:
-        # __dict__ is used on pre, therefore we need to create a function
-        # that uses __dict__ too, but returns nothing.
+    if signal is pre_delete:
+        # deletions are logged with the state of the instance by post_delete
+        return
 
-        pre = lambda _: None  # noqa: E731
-        operation = Operation.INSERT
+    old = _get_previous_state(sender, instance, update_fields)
+    operation = Operation.INSERT if old is None else Operation.UPDATE
 
     changes = {}
 
     if operation not in {Operation.INSERT, Operation.DELETE}:
-        old, new = (
-            remove_non_member_fields(pre.__dict__),
-            remove_non_member_fields(instance.__dict__),
-        )
+        new = {
+            k: v
+            for k, v in remove_non_member_fields(instance.__dict__).items()
+            if k in old
+        }
 
         try:
             changes = dict(set(new.items()).difference(old.items()))
@@ -115,24 +154,27 @@ def _post_processor(instance, event: Event | None, operation: Operation):
 
     try:
         if operation == Operation.DELETE:
-            changes = instance.__dict__
-            if "_state" in changes:
-                del changes["_state"]
+            changes = {
+                k: v
+                for k, v in instance.__dict__.items()
+                if k not in {"_state", "_audit_log_snapshot"}
+            }
         else:
             changes = json.dumps(event.changes if event else {}, cls=LogJsonEncoder)
+        # formatted here as the instance may change once the request moves on
+        record = (
+            request_id,
+            str(actor),
+            operation.value,
+            model_name,
+            str(instance.pk),
+            str(changes),
+        )
     except Exception:
         logger.warning("Failed to log %s", event, exc_info=True)
         return
 
-    logger.info(
-        "AUDIT_LOG::%s|%s|%s|%s|ID:%s|%s",
-        request_id,
-        actor,
-        operation.value,
-        model_name,
-        instance.pk,
-        changes,
-    )
+    sink.put(record)
 
 
 @receiver(post_save, weak=False)
@@ -154,6 +196,8 @@ def post_save_signal(sender, instance, created, update_fields: frozenset, **kwar
 
     event = instance._meta.dal.event
     _post_processor(instance, event, operation)
+    # later saves in the request are diffed against the saved state
+    instance._audit_log_snapshot = take_snapshot(instance)
 
 
 @receiver(post_delete, weak=False)
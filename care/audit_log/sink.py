@@ -0,0 +1,80 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+
+from django.conf import settings
+
+# records keep the logger they were written with before the sink was added
+logger = logging.getLogger("care.audit_log.receivers")
+
+AUDIT_LOG_FORMAT = "AUDIT_LOG::%s|%s|%s|%s|ID:%s|%s"
+
+# maximum number of records written by the background thread in one go
+AUDIT_LOG_BATCH_SIZE = 500
+
+
+class AuditLogSink:
+    """
+    Writes audit log records from a background thread, so that saves only pay
+    for putting the record on a queue. The thread drains the queue in batches
+    and the remaining records are flushed when the process exits.
+    """
+
+    def __init__(self, batch_size: int = AUDIT_LOG_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def _ensure_started(self):
+        # the thread does not survive a fork, workers start their own
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.SimpleQueue()
+            self._thread = threading.Thread(
+                target=self._run, name="audit-log-sink", daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _drain(self, first=None) -> list[tuple]:
+        records = [] if first is None else [first]
+        while len(records) < self.batch_size:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return records
+
+    def _run(self):
+        while True:
+            self.write(self._drain(self._queue.get()))
+
+    def write(self, records: list[tuple]):
+        for record in records:
+            try:
+                logger.info(AUDIT_LOG_FORMAT, *record)
+            except Exception:
+                logger.warning("Failed to write audit log record", exc_info=True)
+
+    def put(self, record: tuple):
+        if not settings.AUDIT_LOG_ASYNC:
+            self.write([record])
+            return
+        self._ensure_started()
+        self._queue.put(record)
+
+    def flush(self):
+        while records := self._drain():
+            self.write(records)
+
+
+sink = AuditLogSink()
+
+atexit.register(sink.flush)
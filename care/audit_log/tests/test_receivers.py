@@ -0,0 +1,123 @@
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from care.audit_log.middleware import AuditLogMiddleware
+from care.facility.models import Facility
+from care.users.models import State
+from care.utils.tests.test_utils import TestUtils
+
+
+@override_settings(AUDIT_LOG_ENABLED=True, AUDIT_LOG_ASYNC=False)
+class AuditLogReceiversTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(
+            cls.user, cls.district, cls.local_body, features=[1]
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        request = RequestFactory().post("/api/v1/state/")
+        request.user = self.user
+        AuditLogMiddleware.save(request)
+
+    def tearDown(self) -> None:
+        AuditLogMiddleware.cleanup()
+        super().tearDown()
+
+    def test_loaded_instances_are_not_snapshotted(self):
+        state = State.objects.get(pk=self.state.pk)
+
+        self.assertFalse(hasattr(state, "_audit_log_snapshot"))
+
+    def test_update_reads_only_the_saved_fields(self):
+        state = State.objects.get(pk=self.state.pk)
+        state.name = "Renamed State"
+
+        with (
+            CaptureQueriesContext(connection) as queries,
+            self.assertLogs("care.audit_log.receivers", "INFO") as logs,
+        ):
+            state.save(update_fields=["name"])
+
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn('"id"', queries[0]["sql"].split("FROM")[0])
+        self.assertIn("|update|users.State|", logs.output[0])
+        self.assertIn('"name": "Renamed State"', logs.output[0])
+
+    def test_consecutive_updates_are_diffed_against_saved_state(self):
+        state = State.objects.get(pk=self.state.pk)
+        state.name = "Renamed State"
+        state.save()
+
+        with self.assertNumQueries(1), self.assertNoLogs("care.audit_log.receivers"):
+            state.save()
+
+    def test_in_place_changes_are_detected(self):
+        facility = Facility.objects.get(pk=self.facility.pk)
+        facility.features.append(2)
+
+        with self.assertLogs("care.audit_log.receivers", "INFO") as logs:
+            facility.save()
+
+        self.assertIn('"features": [1, 2]', logs.output[0])
+
+    def test_instance_not_loaded_in_request_is_fetched(self):
+        state = State(pk=self.state.pk, name="Unloaded State")
+
+        with (
+            self.assertNumQueries(2),
+            self.assertLogs("care.audit_log.receivers", "INFO") as logs,
+        ):
+            state.save()
+
+        self.assertIn("|update|users.State|", logs.output[0])
+
+    def test_insert_does_not_query(self):
+        with (
+            self.assertNumQueries(1),
+            self.assertLogs("care.audit_log.receivers", "INFO") as logs,
+        ):
+            State.objects.create(name="New State")
+
+        self.assertIn("|insert|users.State|", logs.output[0])
+
+
+@override_settings(AUDIT_LOG_ENABLED=True, AUDIT_LOG_ASYNC=False)
+class AuditLogMiddlewareTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.user = cls.create_super_user("su", cls.district)
+
+    def handle(self, request, get_response):
+        request.user = self.user
+        return AuditLogMiddleware(get_response)(request)
+
+    def test_instances_loaded_by_reads_are_not_snapshotted(self):
+        def get_response(request):
+            self.states = list(State.objects.all())
+            return HttpResponse()
+
+        self.handle(RequestFactory().post("/api/v1/state/"), HttpResponse)
+        self.handle(RequestFactory().get("/api/v1/state/"), get_response)
+        self.assertFalse(hasattr(self.states[0], "_audit_log_snapshot"))
+
+    def test_request_is_cleared_after_write_requests(self):
+        def get_response(request):
+            self.assertTrue(AuditLogMiddleware.is_request())
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            self.handle(RequestFactory().post("/api/v1/state/"), get_response)
+        self.assertFalse(AuditLogMiddleware.is_request())
+        self.assertFalse(
+            hasattr(State.objects.get(pk=self.state.pk), "_audit_log_snapshot")
+        )
@@ -1,5 +1,6 @@
 from typing import Any
 
+from django.db.models.manager import BaseManager
 from rest_framework import serializers
 
 from care.facility.models import (
@@ -7,7 +8,10 @@ from care.facility.models import (
     ConsultationDiagnosis,
 )
 from care.facility.models.icd11_diagnosis import ICD11Diagnosis
-from care.facility.static_data.icd11 import get_icd11_diagnosis_object_by_id
+from care.facility.static_data.icd11 import (
+    get_icd11_diagnosis_object_by_id,
+    prefetch_icd11_diagnoses,
+)
 from care.users.api.serializers.user import UserBaseMinimumSerializer
 
 
@@ -23,6 +27,13 @@ class ConsultationCreateDiagnosisSerializer(serializers.ModelSerializer):
         fields = ("diagnosis", "verification_status", "is_principal")
 
 
+class ConsultationDiagnosisListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        diagnoses = list(data.all() if isinstance(data, BaseManager) else data)
+        prefetch_icd11_diagnoses(diagnosis.diagnosis_id for diagnosis in diagnoses)
+        return super().to_representation(diagnoses)
+
+
 class ConsultationDiagnosisSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(source="external_id", read_only=True)
     diagnosis = serializers.PrimaryKeyRelatedField(
@@ -36,6 +47,7 @@ class ConsultationDiagnosisSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ConsultationDiagnosis
+        list_serializer_class = ConsultationDiagnosisListSerializer
         exclude = (
             "consultation",
             "external_id",
@@ -17,6 +17,12 @@ from care.facility.models.bed import Bed
 from care.facility.models.daily_round import DailyRound
 from care.facility.models.notification import Notification
 from care.facility.models.patient_base import SuggestionChoices
+from care.facility.utils.daily_round_analytics import (
+    AGGREGATES,
+    RESOLUTIONS,
+    get_field,
+    is_numeric,
+)
 from care.users.api.serializers.user import UserBaseMinimumSerializer
 from care.utils.notification_handler import NotificationGenerator
 from care.utils.queryset.facility import get_home_facility_queryset
@@ -330,3 +336,27 @@ class DailyRoundSerializer(serializers.ModelSerializer):
             msg = "Cannot create an update in the future"
             raise serializers.ValidationError(msg)
         return value
+
+
+class DailyRoundAnalyticsSerializer(serializers.Serializer):
+    fields = serializers.ListField(
+        child=serializers.CharField(), allow_empty=False, max_length=20
+    )
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    resolution = serializers.ChoiceField(choices=list(RESOLUTIONS))
+    aggregate = serializers.ChoiceField(choices=AGGREGATES, default="last")
+
+    def validate(self, attrs):
+        if "start" in attrs and "end" in attrs and attrs["start"] >= attrs["end"]:
+            raise ValidationError({"end": ["Must be after start."]})
+
+        errors = {}
+        for path in attrs["fields"]:
+            if get_field(path) is None:
+                errors[path] = "Not a valid field"
+            elif attrs["resolution"] != "raw" and not is_numeric(path):
+                errors[path] = "Only numeric fields can be aggregated"
+        if errors:
+            raise ValidationError({"fields": errors})
+        return attrs
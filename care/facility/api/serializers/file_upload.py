@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.db import models
 from django.utils.timezone import localtime, now
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -19,7 +20,7 @@ from care.utils.notification_handler import NotificationGenerator
 from care.utils.serializers.fields import ChoiceField
 
 
-def check_permissions(file_type, associating_id, user, action="create"):  # noqa: PLR0911, PLR0912
+def check_permissions(file_type, associating_id, user, action="create"):  # noqa: PLR0911, PLR0912, PLR0915
     try:
         if file_type == FileUpload.FileType.PATIENT.value:
             patient = PatientRegistration.objects.get(external_id=associating_id)
@@ -115,6 +116,13 @@ def check_permissions(file_type, associating_id, user, action="create"):  # noqa
                 msg = "No Permission"
                 raise Exception(msg)
             return sample.id
+        if file_type == FileUpload.FileType.CSV_EXPORT.value:
+            # exports are uploaded by the export job, only for the user who
+            # requested them
+            if action == "read" and associating_id == str(user.external_id):
+                return associating_id
+            msg = "No Permission"
+            raise Exception(msg)
         if file_type in (
             FileUpload.FileType.CLAIM.value,
             FileUpload.FileType.COMMUNICATION.value,
@@ -216,6 +224,27 @@ class FileUploadListSerializer(serializers.ModelSerializer):
         read_only_fields = ("associating_id", "name", "created_date")
 
 
+class SignedFileUploadListSerializer(serializers.ListSerializer):
+    """
+    Signs the read URLs of all the files being serialized at once.
+    """
+
+    def to_representation(self, data):
+        files = list(
+            data.all() if isinstance(data, models.manager.BaseManager) else data
+        )
+        FileUpload.prefetch_read_signed_urls(files)
+        return super().to_representation(files)
+
+
+class FileUploadSignedListSerializer(FileUploadListSerializer):
+    read_signed_url = serializers.CharField(read_only=True)
+
+    class Meta(FileUploadListSerializer.Meta):
+        fields = (*FileUploadListSerializer.Meta.fields, "read_signed_url")
+        list_serializer_class = SignedFileUploadListSerializer
+
+
 class FileUploadUpdateSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(source="external_id", read_only=True)
     archived_by = UserBaseMinimumSerializer(read_only=True)
@@ -281,3 +310,4 @@ class FileUploadRetrieveSerializer(serializers.ModelSerializer):
             "extension",
         )
         read_only_fields = ("associating_id", "name", "created_date")
+        list_serializer_class = SignedFileUploadListSerializer
@@ -1,3 +1,5 @@
+import re
+
 from django.conf import settings
 from django.db import transaction
 from django.utils.timezone import now
@@ -34,6 +36,11 @@ from care.facility.models.patient_base import (
 )
 from care.facility.models.patient_consultation import PatientConsultation
 from care.facility.models.patient_external_test import PatientExternalTest
+from care.facility.utils.patient_search import (
+    MAX_PHONE_NUMBER_LENGTH,
+    NATIONAL_NUMBER_LENGTH,
+    normalize_phone_number,
+)
 from care.users.api.serializers.lsg import (
     DistrictSerializer,
     LocalBodySerializer,
@@ -87,6 +94,7 @@ class PatientListSerializer(serializers.ModelSerializer):
     source = ChoiceField(choices=PatientRegistration.SourceChoices)
 
     assigned_to_object = UserBaseMinimumSerializer(source="assigned_to", read_only=True)
+    age = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = PatientRegistration
@@ -98,6 +106,8 @@ class PatientListSerializer(serializers.ModelSerializer):
             "countries_travelled_old",
             "allergies",
             "external_id",
+            *PatientRegistration.SEARCH_FIELDS,
+            *PatientRegistration.CONSULTATION_STATE_FIELDS,
         )
         read_only = (*TIMESTAMP_FIELDS, "death_datetime")
 
@@ -181,6 +191,8 @@ class PatientDetailSerializer(PatientListSerializer):
             "deleted",
             "countries_travelled_old",
             "external_id",
+            *PatientRegistration.SEARCH_FIELDS,
+            *PatientRegistration.CONSULTATION_STATE_FIELDS,
         )
         include = ("contacted_patients",)
         read_only = (
@@ -404,6 +416,26 @@ class PatientSearchSerializer(serializers.ModelSerializer):
         )
 
 
+class PatientSearchParamsSerializer(serializers.Serializer):
+    name = serializers.CharField(required=False)
+    phone_number = serializers.CharField(required=False)
+    year_of_birth = serializers.IntegerField(required=False, min_value=1900)
+    date_of_birth = serializers.DateField(required=False)
+    age = serializers.IntegerField(required=False, min_value=0)
+
+    def validate_phone_number(self, value):
+        # only whole numbers are searched, so that patients can't be listed
+        # by the last few digits of their numbers
+        if not (
+            NATIONAL_NUMBER_LENGTH
+            <= len(normalize_phone_number(value))
+            <= MAX_PHONE_NUMBER_LENGTH
+        ) or re.search(r"[^\d\s()+-]", value):
+            msg = "Invalid phone number"
+            raise serializers.ValidationError(msg)
+        return value
+
+
 class PatientTransferSerializer(serializers.ModelSerializer):
     facility_object = FacilityBasicInfoSerializer(source="facility", read_only=True)
     facility = ExternalIdSerializerField(
@@ -880,14 +880,14 @@ class PatientConsentSerializer(serializers.ModelSerializer):
 
     def get_files(self, obj):
         from care.facility.api.serializers.file_upload import (
-            FileUploadListSerializer,
+            FileUploadSignedListSerializer,
             check_permissions,
         )
 
         user = self.context["request"].user
         file_type = FileUpload.FileType.CONSENT_RECORD
         if check_permissions(file_type, obj.external_id, user, "read"):
-            return FileUploadListSerializer(
+            return FileUploadSignedListSerializer(
                 FileUpload.objects.filter(
                     associating_id=obj.external_id, file_type=file_type
                 ),
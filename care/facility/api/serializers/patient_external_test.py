@@ -3,12 +3,13 @@ from rest_framework.exceptions import ValidationError
 
 from care.facility.models import PatientExternalTest
 from care.facility.models.patient import PatientRegistration
+from care.facility.utils.external_test_import import ExternalTestLocations
 from care.users.api.serializers.lsg import (
     DistrictSerializer,
     LocalBodySerializer,
     WardSerializer,
 )
-from care.users.models import REVERSE_LOCAL_BODY_CHOICES, District, LocalBody, Ward
+from care.users.models import REVERSE_LOCAL_BODY_CHOICES, LocalBody, Ward
 
 
 class PatientExternalTestSerializer(serializers.ModelSerializer):
@@ -23,13 +24,18 @@ class PatientExternalTestSerializer(serializers.ModelSerializer):
     )
     result_date = serializers.DateField(input_formats=["%Y-%m-%d"], required=False)
 
+    # locations are resolved to ids by `validate_empty_values`
+    district = serializers.IntegerField(source="district_id")
+    local_body = serializers.IntegerField(source="local_body_id")
+    ward = serializers.IntegerField(source="ward_id", required=False, allow_null=True)
+
     def validate_empty_values(self, data, *args, **kwargs):  # noqa: PLR0912
-        district_obj = None
+        locations = self.context.get("locations") or ExternalTestLocations()
+        district_id = None
         if "district" in data:
-            district = data["district"]
-            district_obj = District.objects.filter(name__icontains=district).first()
-            if district_obj:
-                data["district"] = district_obj.id
+            district_id = locations.get_district_id(data["district"])
+            if district_id:
+                data["district"] = district_id
             else:
                 raise ValidationError({"district": ["District Does not Exist"]})
         else:
@@ -50,38 +56,32 @@ class PatientExternalTestSerializer(serializers.ModelSerializer):
 
         local_body_type = REVERSE_LOCAL_BODY_CHOICES[data["local_body_type"].lower()]
 
-        local_body_obj = None
-        if "local_body" in data and district_obj:
+        local_body_id = None
+        if "local_body" in data and district_id:
             if not data["local_body"]:
                 raise ValidationError({"local_body": ["Local Body Cannot Be Empty"]})
-            local_body = data["local_body"]
-            local_body_obj = LocalBody.objects.filter(
-                name__icontains=local_body,
-                district=district_obj,
-                body_type=local_body_type,
-            ).first()
-            if local_body_obj:
-                data["local_body"] = local_body_obj.id
+            local_body_id = locations.get_local_body_id(
+                data["local_body"], district_id, local_body_type
+            )
+            if local_body_id:
+                data["local_body"] = local_body_id
             else:
                 raise ValidationError({"local_body": ["Local Body Does not Exist"]})
         else:
             raise ValidationError({"local_body": ["Local Body Not Present in Data"]})
 
-        if "ward" in data and local_body_obj:
+        if "ward" in data and local_body_id:
             try:
-                int(data["ward"])
+                ward_number = int(data["ward"])
             except Exception as e:
                 raise ValidationError(
                     {"ward": ["Ward must be an integer value"]}
                 ) from e
-            if data["ward"]:
-                ward_obj = Ward.objects.filter(
-                    number=data["ward"], local_body=local_body_obj
-                ).first()
-                if ward_obj:
-                    data["ward"] = ward_obj.id
-                else:
-                    raise ValidationError({"ward": ["Ward Does not Exist"]})
+            ward_id = locations.get_ward_id(ward_number, local_body_id)
+            if ward_id:
+                data["ward"] = ward_id
+            else:
+                raise ValidationError({"ward": ["Ward Does not Exist"]})
 
         del data["local_body_type"]
 
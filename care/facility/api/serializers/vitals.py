@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from care.facility.models.vitals import vital_name_validator
+from care.facility.utils.daily_round_analytics import AGGREGATES, RESOLUTIONS
+
+
+class VitalsReadingSerializer(serializers.Serializer):
+    vital = serializers.CharField(max_length=50, validators=[vital_name_validator])
+    taken_at = serializers.DateTimeField()
+    value = serializers.FloatField()
+
+    def validate_taken_at(self, value):
+        if value > timezone.now() + timedelta(minutes=2):
+            msg = "Cannot record a reading in the future"
+            raise serializers.ValidationError(msg)
+        return value
+
+
+class VitalsBatchSerializer(serializers.Serializer):
+    readings = serializers.ListField(child=VitalsReadingSerializer(), allow_empty=False)
+
+    def validate_readings(self, value):
+        if len(value) > settings.VITALS_INGEST_MAX_READINGS:
+            msg = f"Must have at most {settings.VITALS_INGEST_MAX_READINGS} readings"
+            raise serializers.ValidationError(msg)
+        return value
+
+
+class VitalsQuerySerializer(serializers.Serializer):
+    # longest range of raw readings returned at once, a day of readings taken
+    # every few seconds; longer ranges have to be downsampled
+    MAX_RAW_RANGE = timedelta(days=1)
+
+    vitals = serializers.ListField(
+        child=serializers.CharField(max_length=50, validators=[vital_name_validator]),
+        allow_empty=False,
+        max_length=20,
+    )
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField(required=False)
+    resolution = serializers.ChoiceField(choices=list(RESOLUTIONS), default="raw")
+    aggregate = serializers.ChoiceField(choices=AGGREGATES, default="last")
+
+    def to_internal_value(self, data):
+        if hasattr(data, "getlist") and len(data.getlist("vitals")) == 1:
+            data = data.copy()
+            data.setlist("vitals", data["vitals"].split(","))
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        attrs.setdefault("end", timezone.now())
+        if attrs["start"] >= attrs["end"]:
+            raise ValidationError({"end": ["Must be after start."]})
+        if (
+            attrs["resolution"] == "raw"
+            and attrs["end"] - attrs["start"] > self.MAX_RAW_RANGE
+        ):
+            raise ValidationError(
+                {"resolution": ["Raw readings can be read a day at a time."]}
+            )
+        return attrs
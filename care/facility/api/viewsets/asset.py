@@ -59,6 +59,7 @@ from care.facility.models.asset import (
     StatusChoices,
 )
 from care.facility.models.bed import AssetBed, ConsultationBed
+from care.facility.utils.availability import latest_availability_status
 from care.users.models import User
 from care.utils.assetintegration.asset_classes import AssetClasses
 from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
@@ -315,16 +316,7 @@ class AssetViewSet(
 
     def get_queryset(self):
         queryset = get_asset_queryset(user=self.request.user, queryset=self.queryset)
-        return queryset.annotate(
-            latest_status=Subquery(
-                AvailabilityRecord.objects.filter(
-                    content_type__model="asset",
-                    object_external_id=OuterRef("external_id"),
-                )
-                .order_by("-created_date")
-                .values("status")[:1]
-            )
-        )
+        return queryset.annotate(latest_status=latest_availability_status(Asset))
 
     def list(self, request, *args, **kwargs):
         if settings.CSV_REQUEST_PARAMETER in request.GET:
@@ -1,6 +1,6 @@
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import IntegrityError, transaction
-from django.db.models import Exists, OuterRef, Subquery
+from django.db.models import Exists, OuterRef, Prefetch, Subquery
 from django_filters import rest_framework as filters
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import filters as drf_filters
@@ -25,8 +25,10 @@ from care.facility.api.serializers.bed import (
     ConsultationBedSerializer,
     PatientAssetBedSerializer,
 )
+from care.facility.models.asset import Asset
 from care.facility.models.bed import AssetBed, Bed, ConsultationBed
 from care.facility.models.patient_base import BedTypeChoices
+from care.facility.utils.availability import latest_availability_status
 from care.users.models import User
 from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
 from care.utils.filters.choicefilter import CareChoiceFilter, inverse_choices
@@ -147,16 +149,25 @@ class AssetBedViewSet(
     DestroyModelMixin,
     GenericViewSet,
 ):
-    queryset = (
-        AssetBed.objects.all().select_related("asset", "bed").order_by("-created_date")
-    )
+    queryset = AssetBed.objects.all().select_related("bed").order_by("-created_date")
     serializer_class = AssetBedSerializer
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = AssetBedFilter
     lookup_field = "external_id"
 
     def get_queryset(self):
-        return get_asset_bed_queryset(user=self.request.user, queryset=self.queryset)
+        queryset = get_asset_bed_queryset(
+            user=self.request.user, queryset=self.queryset
+        )
+        # assets are prefetched to annotate them with their latest status
+        return queryset.prefetch_related(
+            Prefetch(
+                "asset",
+                queryset=Asset.objects.select_related(
+                    "current_location", "current_location__facility"
+                ).annotate(latest_status=latest_availability_status(Asset)),
+            )
+        )
 
 
 class PatientAssetBedFilter(filters.FilterSet):
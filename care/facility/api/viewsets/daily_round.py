@@ -9,9 +9,14 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from care.facility.api.serializers.daily_round import DailyRoundSerializer
+from care.facility.api.serializers.daily_round import (
+    DailyRoundAnalyticsSerializer,
+    DailyRoundSerializer,
+)
 from care.facility.api.viewsets.mixins.access import AssetUserAccessMixin
 from care.facility.models.daily_round import DailyRound
+from care.facility.utils.daily_round_analytics import analyse_daily_rounds
+from care.utils.pagination import LimitOffsetOrCursorPagination
 from care.utils.queryset.consultation import get_consultation_queryset
 
 DailyRoundAttributes = [f.name for f in DailyRound._meta.get_fields()]  # noqa: SLF001
@@ -47,6 +52,8 @@ class DailyRoundsViewSet(
     filterset_class = DailyRoundFilterSet
 
     filter_backends = (filters.DjangoFilterBackend,)
+    pagination_class = LimitOffsetOrCursorPagination
+    cursor_ordering = ("-taken_at", "-id")
 
     FIELDS_KEY = "fields"
     MAX_FIELDS = 20
@@ -72,6 +79,9 @@ class DailyRoundsViewSet(
     @extend_schema(tags=["daily_rounds"])
     @action(methods=["POST"], detail=False)
     def analyse(self, request, **kwargs):
+        if "resolution" in request.data:
+            return self.analyse_columns(request)
+
         # Request Body Validations
 
         if self.FIELDS_KEY not in request.data:
@@ -128,3 +138,28 @@ class DailyRoundsViewSet(
             "page_size": self.PAGE_SIZE,
         }
         return Response(final_data)
+
+    def analyse_columns(self, request):
+        """
+        Returns the requested fields of all rounds in a time range as arrays,
+        either per round or aggregated over buckets of the given resolution.
+        """
+        serializer = DailyRoundAnalyticsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        consultation = get_object_or_404(
+            get_consultation_queryset(request.user).filter(
+                external_id=self.kwargs["consultation_external_id"]
+            )
+        )
+        queryset = DailyRound.objects.filter(consultation=consultation)
+        if "start" in data:
+            queryset = queryset.filter(taken_at__gte=data["start"])
+        if "end" in data:
+            queryset = queryset.filter(taken_at__lt=data["end"])
+        return Response(
+            analyse_daily_rounds(
+                queryset, data["fields"], data["resolution"], data["aggregate"]
+            )
+        )
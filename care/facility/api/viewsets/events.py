@@ -14,6 +14,7 @@ from care.facility.api.serializers.events import (
     PatientConsultationEventDetailSerializer,
 )
 from care.facility.models.events import EventType, PatientConsultationEvent
+from care.utils.pagination import LimitOffsetOrCursorPagination
 from care.utils.queryset.consultation import get_consultation_queryset
 
 
@@ -68,6 +69,8 @@ class PatientConsultationEventViewSet(ReadOnlyModelViewSet):
     )
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = PatientConsultationEventFilterSet
+    pagination_class = LimitOffsetOrCursorPagination
+    cursor_ordering = ("-taken_at", "-id")
 
     def get_consultation_obj(self):
         return get_object_or_404(
@@ -2,7 +2,6 @@ from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django_filters import rest_framework as filters
-from djqscsv import render_to_csv_response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from dry_rest_permissions.generics import DRYPermissionFiltersBase, DRYPermissions
 from rest_framework import filters as drf_filters
@@ -26,6 +25,7 @@ from care.facility.models import (
 )
 from care.facility.models.facility import FacilityHubSpoke, FacilityUser
 from care.users.models import User
+from care.utils.csv_export import CSVExport
 from care.utils.file_uploads.cover_image import delete_cover_image
 from care.utils.queryset.facility import get_facility_queryset
 
@@ -140,9 +140,9 @@ class FacilityViewSet(
                     FacilityPatientStatsHistory.CSV_MAKE_PRETTY.copy()
                 )
             queryset = self.filter_queryset(self.get_queryset()).values(*mapping.keys())
-            return render_to_csv_response(
+            return CSVExport(
                 queryset, field_header_map=mapping, field_serializer_map=pretty_mapping
-            )
+            ).streaming_response()
 
         return super().list(request, *args, **kwargs)
 
@@ -16,6 +16,7 @@ from care.facility.models.notification import Notification
 from care.users.models import User
 from care.utils.filters.choicefilter import CareChoiceFilter, inverse_choices
 from care.utils.notification_handler import NotificationGenerator
+from care.utils.pagination import LimitOffsetOrCursorPagination
 from care.utils.queryset.facility import get_facility_queryset
 
 inverse_event_type_choices = inverse_choices(Notification.EventTypeChoices)
@@ -41,6 +42,8 @@ class NotificationViewSet(
     lookup_field = "external_id"
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = NotificationFilter
+    pagination_class = LimitOffsetOrCursorPagination
+    cursor_ordering = ("-created_date", "-id")
 
     def get_queryset(self):
         user = self.request.user
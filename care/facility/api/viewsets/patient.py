@@ -2,24 +2,18 @@ import json
 from json import JSONDecodeError
 
 from django.conf import settings
-from django.contrib.postgres.search import TrigramSimilarity
-from django.db import models
+from django.db import models, transaction
 from django.db.models import (
     Case,
-    ExpressionWrapper,
     F,
-    Func,
     OuterRef,
     Q,
     Subquery,
-    Value,
     When,
 )
-from django.db.models.functions import Coalesce, ExtractDay, Now
 from django.db.models.query import QuerySet
 from django.utils import timezone
 from django_filters import rest_framework as filters
-from djqscsv import render_to_csv_response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from dry_rest_permissions.generics import DRYPermissionFiltersBase, DRYPermissions
 from rest_framework import filters as rest_framework_filters
@@ -45,6 +39,7 @@ from care.facility.api.serializers.patient import (
     PatientListSerializer,
     PatientNotesEditSerializer,
     PatientNotesSerializer,
+    PatientSearchParamsSerializer,
     PatientSearchSerializer,
     PatientTransferSerializer,
 )
@@ -67,6 +62,7 @@ from care.facility.models import (
 )
 from care.facility.models.base import covert_choice_dict
 from care.facility.models.bed import AssetBed, ConsultationBed
+from care.facility.models.file_upload import FileUpload
 from care.facility.models.icd11_diagnosis import (
     INACTIVE_CONDITION_VERIFICATION_STATUSES,
     ConditionVerificationStatus,
@@ -78,11 +74,16 @@ from care.facility.models.patient_base import (
     NewDischargeReasonEnum,
 )
 from care.facility.models.patient_consultation import PatientConsultation
+from care.facility.static_data.icd11 import ICD11LabelResolver
+from care.facility.tasks.csv_export import export_patients_csv_task
+from care.facility.utils.patient_search import normalize_name, search_patients
 from care.users.models import User
 from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
+from care.utils.csv_export import CSVExport
 from care.utils.filters.choicefilter import CareChoiceFilter
 from care.utils.filters.multiselect import MultiSelectFilter
 from care.utils.notification_handler import NotificationGenerator
+from care.utils.pagination import LimitOffsetOrCursorPagination
 from care.utils.queryset.patient import get_patient_notes_queryset
 from config.authentication import (
     CustomBasicAuthentication,
@@ -108,7 +109,7 @@ class PatientFilterSet(filters.FilterSet):
     phone_number = filters.CharFilter(field_name="phone_number")
     emergency_phone_number = filters.CharFilter(field_name="emergency_phone_number")
     allow_transfer = filters.BooleanFilter(field_name="allow_transfer")
-    name = filters.CharFilter(field_name="name", lookup_expr="icontains")
+    name = filters.CharFilter(method="filter_by_name")
     patient_no = filters.CharFilter(
         field_name=f"{last_consultation_field}__patient_no", lookup_expr="iexact"
     )
@@ -121,23 +122,15 @@ class PatientFilterSet(filters.FilterSet):
         choices=COVID_CATEGORY_CHOICES,
     )
     category = filters.ChoiceFilter(
-        method="filter_by_category",
+        field_name="effective_category",
         choices=CATEGORY_CHOICES,
     )
     ration_card_category = filters.ChoiceFilter(choices=RationCardCategory.choices)
 
-    def filter_by_category(self, queryset, name, value):
-        if value:
-            queryset = queryset.filter(
-                (
-                    Q(last_consultation__last_daily_round__isnull=False)
-                    & Q(last_consultation__last_daily_round__patient_category=value)
-                )
-                | (
-                    Q(last_consultation__last_daily_round__isnull=True)
-                    & Q(last_consultation__category=value)
-                )
-            )
+    def filter_by_name(self, queryset, name, value):
+        # the normalized name has a trigram index that supports substring search
+        if value := normalize_name(value):
+            queryset = queryset.filter(search_name__contains=value)
         return queryset
 
     created_date = filters.DateFromToRangeFilter(field_name="created_date")
@@ -186,7 +179,7 @@ class PatientFilterSet(filters.FilterSet):
         field_name=f"{last_consultation_field}__medico_legal_case"
     )
     last_consultation_current_bed__location = filters.UUIDFilter(
-        field_name=f"{last_consultation_field}__current_bed__bed__location__external_id"
+        field_name="current_location__external_id"
     )
 
     def filter_by_bed_type(self, queryset, name, value):
@@ -197,15 +190,15 @@ class PatientFilterSet(filters.FilterSet):
         filter_q = Q()
 
         if "None" in values:
-            filter_q |= Q(last_consultation__current_bed__isnull=True)
+            filter_q |= Q(current_bed_type__isnull=True)
             values.remove("None")
         if values:
-            filter_q |= Q(last_consultation__current_bed__bed__bed_type__in=values)
+            filter_q |= Q(current_bed_type__in=values)
 
         return queryset.filter(filter_q)
 
     last_consultation_admitted_bed_type = CareChoiceFilter(
-        field_name=f"{last_consultation_field}__current_bed__bed__bed_type",
+        field_name="current_bed_type",
         choice_dict=REVERSE_BED_TYPES,
     )
     last_consultation__new_discharge_reason = filters.ChoiceFilter(
@@ -360,7 +353,7 @@ class PatientCustomOrderingFilter(BaseFilterBackend):
                 for index, (category, _) in enumerate(CATEGORY_CHOICES)
             }
             when_statements = [
-                When(last_consultation__category=cat, then=order)
+                When(effective_category=cat, then=order)
                 for cat, order in category_ordering.items()
             ]
             queryset = queryset.annotate(
@@ -390,61 +383,25 @@ class PatientViewSet(
     ]
     permission_classes = (IsAuthenticated, DRYPermissions)
     lookup_field = "external_id"
-    queryset = (
-        PatientRegistration.objects.all()
-        .select_related(
-            "local_body",
-            "district",
-            "state",
-            "ward",
-            "assigned_to",
-            "facility",
-            "facility__ward",
-            "facility__local_body",
-            "facility__district",
-            "facility__state",
-            # "nearest_facility",
-            # "nearest_facility__local_body",
-            # "nearest_facility__district",
-            # "nearest_facility__state",
-            "last_consultation",
-            "last_consultation__assigned_to",
-            "last_edited",
-            "created_by",
-        )
-        .annotate(
-            coalesced_dob=Coalesce(
-                "date_of_birth",
-                Func(
-                    F("year_of_birth"),
-                    Value(1),
-                    Value(1),
-                    function="MAKE_DATE",
-                    output_field=models.DateField(),
-                ),
-                output_field=models.DateField(),
-            ),
-            age_end=Case(
-                When(death_datetime__isnull=True, then=Now()),
-                default=F("death_datetime__date"),
-            ),
-        )
-        .annotate(
-            age=Func(
-                Value("year"),
-                Func(
-                    F("age_end"),
-                    F("coalesced_dob"),
-                    function="age",
-                ),
-                function="date_part",
-                output_field=models.IntegerField(),
-            ),
-            age_days=ExpressionWrapper(
-                ExtractDay(F("age_end") - F("coalesced_dob")),
-                output_field=models.IntegerField(),
-            ),
-        )
+    queryset = PatientRegistration.objects.all().select_related(
+        "local_body",
+        "district",
+        "state",
+        "ward",
+        "assigned_to",
+        "facility",
+        "facility__ward",
+        "facility__local_body",
+        "facility__district",
+        "facility__state",
+        # "nearest_facility",
+        # "nearest_facility__local_body",
+        # "nearest_facility__district",
+        # "nearest_facility__state",
+        "last_consultation",
+        "last_consultation__assigned_to",
+        "last_edited",
+        "created_by",
     )
     ordering_fields = [
         "facility__name",
@@ -465,6 +422,8 @@ class PatientViewSet(
         PatientCustomOrderingFilter,
     )
     filterset_class = PatientFilterSet
+    pagination_class = LimitOffsetOrCursorPagination
+    cursor_ordering = ("-modified_date", "-id")
 
     date_range_fields = [
         "created_date",
@@ -476,6 +435,7 @@ class PatientViewSet(
         "last_consultation_discharge_date",
     ]
     CSV_EXPORT_LIMIT = 7
+    CSV_BACKGROUND_EXPORT_LIMIT = 92
 
     def get_queryset(self):
         queryset = super().get_queryset().order_by("modified_date")
@@ -520,6 +480,63 @@ class PatientViewSet(
 
         return super().filter_queryset(queryset)
 
+    def validate_csv_export_range(self) -> int:
+        """
+        Returns the number of days of the shortest date range the export is
+        filtered by.
+        """
+        temp = filters.DjangoFilterBackend().get_filterset(
+            self.request, self.queryset, self
+        )
+        temp.is_valid()
+        export_days = None
+        for field in self.date_range_fields:
+            slice_obj = temp.form.cleaned_data.get(field)
+            if slice_obj:
+                if not slice_obj.start or not slice_obj.stop:
+                    raise ValidationError(
+                        {
+                            field: "both starting and ending date must be provided for export"
+                        }
+                    )
+                days_difference = (slice_obj.stop - slice_obj.start).days
+                if days_difference > self.CSV_BACKGROUND_EXPORT_LIMIT:
+                    raise ValidationError(
+                        {
+                            field: f"Cannot export more than {self.CSV_BACKGROUND_EXPORT_LIMIT} days at a time"
+                        }
+                    )
+                if export_days is None or days_difference < export_days:
+                    export_days = days_difference
+        if export_days is None:
+            raise ValidationError(
+                {
+                    "date": f"Atleast one date field must be filtered to be within {self.CSV_BACKGROUND_EXPORT_LIMIT} days"
+                }
+            )
+        return export_days
+
+    def get_csv_export(self) -> CSVExport:
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .annotate(**PatientRegistration.CSV_ANNOTATE_FIELDS)
+            .values(*PatientRegistration.CSV_MAPPING.keys())
+        )
+        diagnoses = ICD11LabelResolver()
+        return CSVExport(
+            queryset,
+            field_header_map=PatientRegistration.CSV_MAPPING,
+            field_serializer_map={
+                **PatientRegistration.CSV_MAKE_PRETTY,
+                **dict.fromkeys(
+                    PatientRegistration.CSV_DIAGNOSES_FIELDS, diagnoses.format
+                ),
+            },
+            prepare_chunk=lambda chunk: diagnoses.prefetch_records(
+                chunk, PatientRegistration.CSV_DIAGNOSES_FIELDS
+            ),
+        )
+
     def list(self, request, *args, **kwargs):
         """
         Patient List
@@ -538,50 +555,31 @@ class PatientViewSet(
 
         """
         if settings.CSV_REQUEST_PARAMETER in request.GET:
-            # Start Date Validation
-            temp = filters.DjangoFilterBackend().get_filterset(
-                self.request, self.queryset, self
-            )
-            temp.is_valid()
-            within_limits = False
-            for field in self.date_range_fields:
-                slice_obj = temp.form.cleaned_data.get(field)
-                if slice_obj:
-                    if not slice_obj.start or not slice_obj.stop:
-                        raise ValidationError(
-                            {
-                                field: "both starting and ending date must be provided for export"
-                            }
-                        )
-                    days_difference = (
-                        temp.form.cleaned_data.get(field).stop
-                        - temp.form.cleaned_data.get(field).start
-                    ).days
-                    if days_difference <= self.CSV_EXPORT_LIMIT:
-                        within_limits = True
-                    else:
-                        raise ValidationError(
-                            {
-                                field: f"Cannot export more than {self.CSV_EXPORT_LIMIT} days at a time"
-                            }
-                        )
-            if not within_limits:
-                raise ValidationError(
+            export_days = self.validate_csv_export_range()
+            if export_days > self.CSV_EXPORT_LIMIT:
+                # exports that would not complete within a request are
+                # uploaded by a background job instead
+                export_file = FileUpload.objects.create(
+                    name="patient_export",
+                    internal_name="patient_export.csv",
+                    file_type=FileUpload.FileType.CSV_EXPORT,
+                    associating_id=str(request.user.external_id),
+                    uploaded_by=request.user,
+                )
+                transaction.on_commit(
+                    lambda: export_patients_csv_task.delay(
+                        export_file.id, dict(request.GET.lists())
+                    )
+                )
+                return Response(
                     {
-                        "date": f"Atleast one date field must be filtered to be within {self.CSV_EXPORT_LIMIT} days"
-                    }
+                        "detail": "The export will be uploaded shortly",
+                        "id": str(export_file.external_id),
+                        "associating_id": export_file.associating_id,
+                    },
+                    status=status.HTTP_202_ACCEPTED,
                 )
-            # End Date Limiting Validation
-            queryset = (
-                self.filter_queryset(self.get_queryset())
-                .annotate(**PatientRegistration.CSV_ANNOTATE_FIELDS)
-                .values(*PatientRegistration.CSV_MAPPING.keys())
-            )
-            return render_to_csv_response(
-                queryset,
-                field_header_map=PatientRegistration.CSV_MAPPING,
-                field_serializer_map=PatientRegistration.CSV_MAKE_PRETTY,
-            )
+            return self.get_csv_export().streaming_response()
 
         return super().list(request, *args, **kwargs)
 
@@ -689,64 +687,28 @@ class FacilityDischargedPatientViewSet(GenericViewSet, mixins.ListModelMixin):
         PatientCustomOrderingFilter,
     )
     filterset_class = DischargePatientFilterSet
-    queryset = (
-        PatientRegistration.objects.annotate(
-            last_discharge_consultation__id=Subquery(
-                PatientConsultation.objects.filter(
-                    patient_id=OuterRef("id"),
-                    discharge_date__isnull=False,
-                )
-                .order_by("-discharge_date")
-                .values("id")[:1]
+    queryset = PatientRegistration.objects.annotate(
+        last_discharge_consultation__id=Subquery(
+            PatientConsultation.objects.filter(
+                patient_id=OuterRef("id"),
+                discharge_date__isnull=False,
             )
+            .order_by("-discharge_date")
+            .values("id")[:1]
         )
-        .select_related(
-            "local_body",
-            "district",
-            "state",
-            "ward",
-            "assigned_to",
-            "facility",
-            "facility__ward",
-            "facility__local_body",
-            "facility__district",
-            "facility__state",
-            "last_edited",
-            "created_by",
-        )
-        .annotate(
-            coalesced_dob=Coalesce(
-                "date_of_birth",
-                Func(
-                    F("year_of_birth"),
-                    Value(1),
-                    Value(1),
-                    function="MAKE_DATE",
-                    output_field=models.DateField(),
-                ),
-                output_field=models.DateField(),
-            ),
-            age_end=Case(
-                When(death_datetime__isnull=True, then=Now()),
-                default=F("death_datetime__date"),
-            ),
-        )
-        .annotate(
-            age=Func(
-                Value("year"),
-                Func(
-                    F("age_end"),
-                    F("coalesced_dob"),
-                    function="age",
-                ),
-                function="date_part",
-                output_field=models.IntegerField(),
-            ),
-            age_days=ExpressionWrapper(
-                ExtractDay(F("age_end") - F("coalesced_dob")),
-                output_field=models.IntegerField(),
-            ),
-        )
+    ).select_related(
+        "local_body",
+        "district",
+        "state",
+        "ward",
+        "assigned_to",
+        "facility",
+        "facility__ward",
+        "facility__local_body",
+        "facility__district",
+        "facility__state",
+        "last_edited",
+        "created_by",
     )
 
     date_range_fields = [
@@ -860,9 +822,7 @@ class PatientSearchViewSet(ListModelMixin, GenericViewSet):
     def get_queryset(self):
         if self.action != "list":
             return super().get_queryset()
-        serializer = PatientSearchSerializer(
-            data=self.request.query_params, partial=True
-        )
+        serializer = PatientSearchParamsSerializer(data=self.request.query_params)
         serializer.is_valid(raise_exception=True)
         if self.request.user.user_type >= User.TYPE_VALUE_MAP["DistrictLabAdmin"]:
             search_keys = [
@@ -893,24 +853,7 @@ class PatientSearchViewSet(ListModelMixin, GenericViewSet):
                 }
             )
 
-        if "age" in search_fields:
-            age = search_fields.pop("age")
-            year_of_birth = timezone.now().year - age
-            search_fields["age__gte"] = year_of_birth - 5
-            search_fields["age__lte"] = year_of_birth + 5
-
-        name = search_fields.pop("name", None)
-
-        queryset = self.queryset.filter(**search_fields)
-
-        if name:
-            queryset = (
-                queryset.annotate(similarity=TrigramSimilarity("name", name))
-                .filter(similarity__gt=0.2)
-                .order_by("-similarity")
-            )
-
-        return queryset
+        return search_patients(self.queryset, **search_fields)
 
     @extend_schema(tags=["patient"])
     def list(self, request, *args, **kwargs):
@@ -994,6 +937,8 @@ class PatientNotesViewSet(
     permission_classes = (IsAuthenticated, DRYPermissions)
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = PatientNotesFilterSet
+    pagination_class = LimitOffsetOrCursorPagination
+    cursor_ordering = ("-created_date", "-id")
 
     def get_queryset(self):
         user = self.request.user
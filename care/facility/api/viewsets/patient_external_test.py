@@ -1,6 +1,11 @@
-from collections import defaultdict
+import json
+from itertools import islice
+from tempfile import SpooledTemporaryFile
+from uuid import uuid4
 
+from celery.result import AsyncResult
 from django.conf import settings
+from django.db import transaction
 from django_filters import Filter
 from django_filters import rest_framework as filters
 from django_filters.filters import DateFromToRangeFilter
@@ -8,7 +13,7 @@ from djqscsv import render_to_csv_response
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.mixins import (
     DestroyModelMixin,
     ListModelMixin,
@@ -25,18 +30,15 @@ from care.facility.api.serializers.patient_external_test import (
     PatientExternalTestUpdateSerializer,
 )
 from care.facility.models import PatientExternalTest
+from care.facility.models.file_upload import FileUpload
+from care.facility.tasks.external_test_import import import_external_tests_task
+from care.facility.utils.external_test_import import (
+    import_external_tests,
+    read_uploaded_tests,
+)
 from care.users.models import User
 
 
-def pretty_errors(errors):
-    pretty_errors = defaultdict(list)
-    for attribute in PatientExternalTest.HEADER_CSV_MAPPING:
-        if attribute in errors:
-            for error in errors.get(attribute, ""):
-                pretty_errors[attribute].append(str(error))
-    return dict(pretty_errors)
-
-
 class MFilter(Filter):
     def filter(self, qs, value):
         if not value:
@@ -142,32 +144,74 @@ class PatientExternalTestViewSet(
     @extend_schema(tags=["external_result"])
     @action(methods=["POST"], detail=False)
     def bulk_upsert(self, request, *args, **kwargs):
+        """
+        Creates external tests from a list of tests in `sample_tests` or from
+        an uploaded CSV or NDJSON `file`. Uploads with more tests than can be
+        imported within a request are imported by a background job, whose
+        outcome is available from `bulk_upsert_status`.
+        """
         if not self.check_upload_permission():
             msg = "Permission to Endpoint Denied"
             raise PermissionDenied(msg)
-        if "sample_tests" not in request.data:
+        limit = settings.EXTERNAL_TEST_IMPORT_SYNC_LIMIT
+        if "file" in request.FILES:
+            file = request.FILES["file"]
+            # only as many tests as can be imported within the request are
+            # read, larger files are streamed by the background job
+            tests = read_uploaded_tests(file, file.name)
+            samples = list(islice(tests, limit + 1))
+            tests.close()
+            if len(samples) > limit:
+                file.seek(0)
+                return self.import_in_background(request, file, file.name)
+        elif "sample_tests" in request.data:
+            samples = request.data["sample_tests"]
+            if not isinstance(samples, list):
+                raise ValidationError(
+                    {"sample_tests": "Data should be provided as a list"}
+                )
+            if len(samples) > limit:
+                with SpooledTemporaryFile(
+                    max_size=settings.CSV_EXPORT_SPOOL_SIZE
+                ) as file:
+                    for sample in samples:
+                        file.write(json.dumps(sample).encode() + b"\n")
+                    file.seek(0)
+                    return self.import_in_background(request, file, "tests.ndjson")
+        else:
             raise ValidationError({"sample_tests": "No Data was provided"})
-        if not isinstance(request.data["sample_tests"], list):
-            raise ValidationError({"sample_tests": "Data should be provided as a list"})
-
-        # check if the user is from same district
-        for data in request.data["sample_tests"]:
-            if str(request.user.district) != data["district"]:
-                raise ValidationError({"Error": "User must belong to same district"})
-
-        errors = []
-        ser_objects = []
-        invalid = False
-        for sample in request.data["sample_tests"]:
-            serializer = PatientExternalTestSerializer(data=sample)
-            valid = serializer.is_valid()
-            current_error = pretty_errors(serializer._errors)  # noqa: SLF001
-            if current_error and (not valid):
-                errors.append(current_error)
-                invalid = True
-            ser_objects.append(serializer)
-        if invalid:
+
+        errors = import_external_tests(samples, str(request.user.district))
+        if errors:
             return Response(errors, status=status.HTTP_400_BAD_REQUEST)
-        for ser_object in ser_objects:
-            ser_object.save()
         return Response(status=status.HTTP_202_ACCEPTED)
+
+    def import_in_background(self, request, file, name):
+        import_file = FileUpload.objects.create(
+            name="external_test_import",
+            internal_name=name,
+            file_type=FileUpload.FileType.EXTERNAL_TEST_IMPORT,
+            associating_id=str(request.user.external_id),
+            uploaded_by=request.user,
+        )
+        import_file.put_object(file)
+        task_id = str(uuid4())
+        transaction.on_commit(
+            lambda: import_external_tests_task.apply_async(
+                (import_file.id,), task_id=task_id
+            )
+        )
+        return Response({"task_id": task_id}, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(tags=["external_result"])
+    @action(methods=["GET"], detail=False)
+    def bulk_upsert_status(self, request, *args, **kwargs):
+        result = AsyncResult(request.query_params.get("task_id", ""))
+        if result.ready():
+            if (
+                not result.successful()
+                or result.result.get("user_id") != request.user.id
+            ):
+                raise NotFound
+            return Response({"status": "completed", "errors": result.result["errors"]})
+        return Response({"status": "pending"})
@@ -0,0 +1,107 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from care.facility.api.serializers.vitals import (
+    VitalsBatchSerializer,
+    VitalsQuerySerializer,
+)
+from care.facility.api.viewsets.mixins.access import AssetUserAccessMixin
+from care.facility.models.bed import AssetBed
+from care.facility.models.mixins.permissions.asset import IsAssetUser
+from care.facility.utils.daily_round_analytics import RESOLUTIONS
+from care.facility.utils.vitals_store import (
+    append_readings,
+    read_downsampled_readings,
+    read_readings,
+)
+from care.utils.queryset.consultation import get_consultation_queryset
+
+
+class VitalsViewSet(AssetUserAccessMixin, GenericViewSet):
+    """
+    Readings of vitals recorded by the monitors and ventilators at the bed of
+    a consultation, pushed by middleware in batches and read as time series.
+    """
+
+    permission_classes = (IsAuthenticated,)
+    asset_permissions = (IsAssetUser,)
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return VitalsBatchSerializer
+        return VitalsQuerySerializer
+
+    def get_permissions(self):
+        if self.action == "create":
+            return (IsAssetUser(),)
+        return super().get_permissions()
+
+    def get_consultation(self):
+        return get_object_or_404(
+            get_consultation_queryset(self.request.user)
+            .select_related("current_bed")
+            .filter(external_id=self.kwargs["consultation_external_id"])
+        )
+
+    @extend_schema(tags=["vitals"])
+    def create(self, request, *args, **kwargs):
+        consultation = self.get_consultation()
+        if not (
+            consultation.current_bed
+            and AssetBed.objects.filter(
+                asset=request.user.asset, bed_id=consultation.current_bed.bed_id
+            ).exists()
+        ):
+            msg = "Asset is not connected to the bed of the consultation"
+            raise PermissionDenied(msg)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        readings = {}
+        for reading in serializer.validated_data["readings"]:
+            readings.setdefault(reading["vital"], []).append(
+                (reading["taken_at"], reading["value"])
+            )
+        stored = sum(
+            append_readings(consultation.id, request.user.asset.id, vital, values)
+            for vital, values in readings.items()
+        )
+        return Response({"stored": stored}, status=status.HTTP_201_CREATED)
+
+    @extend_schema(tags=["vitals"], parameters=[VitalsQuerySerializer])
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        consultation = self.get_consultation()
+
+        if data["resolution"] == "raw":
+            readings = {
+                vital: read_readings(consultation.id, vital, data["start"], data["end"])
+                for vital in data["vitals"]
+            }
+        else:
+            readings = read_downsampled_readings(
+                consultation.id,
+                data["vitals"],
+                data["start"],
+                data["end"],
+                RESOLUTIONS[data["resolution"]],
+                data["aggregate"],
+            )
+        vitals = {
+            vital: {"taken_at": times, "values": values}
+            for vital, (times, values) in readings.items()
+        }
+        return Response(
+            {
+                "resolution": data["resolution"],
+                "aggregate": data["aggregate"],
+                "vitals": vitals,
+            }
+        )
@@ -1,17 +1,65 @@
 from contextlib import suppress
 from datetime import datetime
+from functools import reduce
+from operator import or_
+from threading import Lock
+from uuid import uuid4
 
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist
 from django.db import transaction
-from django.db.models import Model
+from django.db.models import Model, Q
 from django.db.models.query import QuerySet
 from django.utils.timezone import now
 
 from care.facility.models.events import ChangeType, EventType, PatientConsultationEvent
 from care.utils.event_utils import get_changed_fields, serialize_field
 
+EVENT_TYPES_VERSION_CACHE_KEY = "event_types_version"
 
-def create_consultation_event_entry(
+type EventTypeGroups = tuple[tuple[int, tuple[str, ...]], ...]
+
+# model name -> (cache version, active event type groups of the model)
+_event_type_groups: dict[str, tuple[str | None, EventTypeGroups]] = {}
+_event_type_groups_lock = Lock()
+
+
+def invalidate_event_type_groups():
+    """
+    Drops the event type groups cached by this process, and by the other
+    processes sharing the cache the next time they look them up.
+    """
+    cache.set(EVENT_TYPES_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+    with _event_type_groups_lock:
+        _event_type_groups.clear()
+
+
+def get_event_types_version() -> str | None:
+    return cache.get(EVENT_TYPES_VERSION_CACHE_KEY)
+
+
+def get_event_type_groups(model_name: str, version: str | None) -> EventTypeGroups:
+    """
+    Returns the active event type groups of a model, cached by this process
+    for as long as `version`, read with `get_event_types_version`, is current.
+    """
+    with _event_type_groups_lock:
+        cached = _event_type_groups.get(model_name)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    groups = tuple(
+        (group_id, tuple(group_fields))
+        for group_id, group_fields in EventType.objects.filter(
+            model=model_name, fields__len__gt=0, is_active=True
+        ).values_list("id", "fields")
+    )
+    with _event_type_groups_lock:
+        _event_type_groups[model_name] = (version, groups)
+    return groups
+
+
+def build_consultation_event_entries(
     consultation_id: int,
     object_instance: Model,
     caused_by: int,
@@ -19,7 +67,13 @@ def create_consultation_event_entry(
     taken_at: datetime,
     old_instance: Model | None = None,
     fields_to_store: set[str] | None = None,
-):
+    event_type_groups: EventTypeGroups | None = None,
+) -> list[PatientConsultationEvent]:
+    if event_type_groups is None:
+        event_type_groups = get_event_type_groups(
+            object_instance.__class__.__name__, get_event_types_version()
+        )
+
     change_type = ChangeType.UPDATED if old_instance else ChangeType.CREATED
 
     fields: set[str] = (
@@ -31,10 +85,7 @@ def create_consultation_event_entry(
     fields_to_store = fields_to_store & fields if fields_to_store else fields
 
     batch = []
-    groups = EventType.objects.filter(
-        model=object_instance.__class__.__name__, fields__len__gt=0, is_active=True
-    ).values_list("id", "fields")
-    for group_id, group_fields in groups:
+    for group_id, group_fields in event_type_groups:
         if fields_to_store & {field.split("__", 1)[0] for field in group_fields}:
             value = {}
             for field in group_fields:
@@ -44,14 +95,6 @@ def create_consultation_event_entry(
             if all(not v for v in value.values()):
                 continue
 
-            PatientConsultationEvent.objects.select_for_update().filter(
-                consultation_id=consultation_id,
-                event_type=group_id,
-                is_latest=True,
-                object_model=object_instance.__class__.__name__,
-                object_id=object_instance.id,
-                taken_at__lt=taken_at,
-            ).update(is_latest=False)
             batch.append(
                 PatientConsultationEvent(
                     consultation_id=consultation_id,
@@ -70,9 +113,68 @@ def create_consultation_event_entry(
                     },
                 )
             )
+    return batch
 
-    PatientConsultationEvent.objects.bulk_create(batch)
-    return len(batch)
+
+def save_consultation_events(
+    consultation_id: int, taken_at: datetime, events: list[PatientConsultationEvent]
+) -> int:
+    """
+    Marks the previous events of the same objects and event types as no
+    longer latest with a single update, and inserts the new events with a
+    single insert.
+    """
+    if not events:
+        return 0
+
+    event_types: dict[tuple[str, int], set[int]] = {}
+    for event in events:
+        event_types.setdefault((event.object_model, event.object_id), set()).add(
+            event.event_type_id
+        )
+
+    PatientConsultationEvent.objects.filter(
+        reduce(
+            or_,
+            (
+                Q(
+                    object_model=object_model,
+                    object_id=object_id,
+                    event_type_id__in=group_ids,
+                )
+                for (object_model, object_id), group_ids in event_types.items()
+            ),
+        ),
+        consultation_id=consultation_id,
+        is_latest=True,
+        taken_at__lt=taken_at,
+    ).update(is_latest=False)
+    PatientConsultationEvent.objects.bulk_create(events)
+    return len(events)
+
+
+def create_consultation_event_entry(
+    consultation_id: int,
+    object_instance: Model,
+    caused_by: int,
+    created_date: datetime,
+    taken_at: datetime,
+    old_instance: Model | None = None,
+    fields_to_store: set[str] | None = None,
+):
+    return save_consultation_events(
+        consultation_id,
+        taken_at,
+        build_consultation_event_entries(
+            consultation_id,
+            object_instance,
+            caused_by,
+            created_date,
+            taken_at,
+            old_instance,
+            fields_to_store,
+        ),
+    )
 
 
 def create_consultation_events(
@@ -90,27 +192,33 @@ def create_consultation_events(
     if taken_at is None:
         taken_at = created_date
 
-    with transaction.atomic():
-        if isinstance(objects, QuerySet | list | tuple):
-            if old is not None:
-                msg = "diff is not available when objects is a list or queryset"
-                raise ValueError(msg)
-            for obj in objects:
-                create_consultation_event_entry(
-                    consultation_id,
-                    obj,
-                    caused_by,
-                    created_date,
-                    taken_at,
-                    fields_to_store=set(fields_to_store) if fields_to_store else None,
-                )
-        else:
-            create_consultation_event_entry(
+    if isinstance(objects, QuerySet | list | tuple):
+        if old is not None:
+            msg = "diff is not available when objects is a list or queryset"
+            raise ValueError(msg)
+    else:
+        objects = [objects]
+
+    # the event types are looked up once for all the objects of a model
+    version = get_event_types_version()
+    event_type_groups: dict[str, EventTypeGroups] = {}
+    events = []
+    for obj in objects:
+        model_name = obj.__class__.__name__
+        if model_name not in event_type_groups:
+            event_type_groups[model_name] = get_event_type_groups(model_name, version)
+        events.extend(
+            build_consultation_event_entries(
                 consultation_id,
-                objects,
+                obj,
                 caused_by,
                 created_date,
                 taken_at,
                 old,
                 fields_to_store=set(fields_to_store) if fields_to_store else None,
+                event_type_groups=event_type_groups[model_name],
             )
+        )
+
+    with transaction.atomic():
+        save_consultation_events(consultation_id, taken_at, events)
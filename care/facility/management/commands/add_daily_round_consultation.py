@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 
 from care.facility.models import DailyRound, PatientConsultation
+from care.facility.utils.patient_state import update_patient_consultation_state
 
 
 class Command(BaseCommand):
@@ -31,4 +33,8 @@ class Command(BaseCommand):
                 .order_by("-created_date")
                 .first()
             )
+            # the bulk update skips the signals that keep the state in sync
+            update_patient_consultation_state(
+                Q(last_consultation__external_id=consultation_eid[0])
+            )
         self.stdout.write("Operation Completed")
@@ -0,0 +1,137 @@
+import os
+import random
+import statistics
+import time
+from itertools import batched
+
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+
+from care.facility.models import PatientRegistration
+from care.facility.utils.patient_search import (
+    normalize_name,
+    normalize_phone_number,
+    search_patients,
+)
+
+SYLLABLES = [
+    "an", "ra", "vi", "sh", "ma", "ka", "la", "ni", "su", "de", "pr", "ee",
+    "th", "ja", "ya", "bi", "no", "ha", "ri", "ta", "mo", "go", "pa", "ku",
+]  # fmt: skip
+
+
+class Command(BaseCommand):
+    """
+    Management command to benchmark the patient search over a synthetic set
+    of patients. Not for production use.
+    Usage: python manage.py benchmark_patient_search --patients 5000000
+    """
+
+    help = "Benchmarks the patient search over synthetic patients"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--patients",
+            type=int,
+            default=5_000_000,
+            help="Number of synthetic patients to create",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=50,
+            help="Number of searches to run for each kind of search",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of patients created per query",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the synthetic patients instead of rolling them back",
+        )
+
+    def handle(self, *args, **options):
+        env = os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+        if "production" in env or "staging" in env:
+            msg = "This command is not intended to be run in production environment."
+            raise CommandError(msg)
+
+        rng = random.Random(options["seed"])  # noqa: S311
+        with transaction.atomic():
+            self.create_patients(rng, options["patients"], options["batch_size"])
+            self.run_searches(rng, options["queries"])
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+    def random_name(self, rng: random.Random) -> str:
+        return " ".join(
+            "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).title()
+            for _ in range(rng.randint(1, 3))
+        )
+
+    def create_patients(self, rng: random.Random, count: int, batch_size: int):
+        start = time.perf_counter()
+        for batch in batched(range(count), batch_size):
+            patients = []
+            for _ in batch:
+                name = self.random_name(rng)
+                phone_number = f"+91{rng.randint(6000000000, 9999999999)}"
+                patients.append(
+                    PatientRegistration(
+                        name=name,
+                        gender=rng.randint(1, 3),
+                        phone_number=phone_number,
+                        year_of_birth=rng.randint(1930, 2024),
+                        search_name=normalize_name(name),
+                        search_phone_number=normalize_phone_number(phone_number),
+                    )
+                )
+            PatientRegistration.objects.bulk_create(patients)
+        self.stdout.write(
+            f"Created {count} patients in {time.perf_counter() - start:.1f}s"
+        )
+
+    def misspell(self, rng: random.Random, name: str) -> str:
+        index = rng.randrange(len(name))
+        return name[:index] + name[index + 1 :]
+
+    def run_searches(self, rng: random.Random, queries: int):
+        samples = list(
+            PatientRegistration.objects.order_by("?").values(
+                "name", "phone_number", "year_of_birth"
+            )[:queries]
+        )
+        if not samples:
+            return
+        searches = {
+            "name": lambda p: {"name": self.misspell(rng, p["name"])},
+            "name + year of birth": lambda p: {
+                "name": self.misspell(rng, p["name"]),
+                "year_of_birth": p["year_of_birth"],
+            },
+            "phone number": lambda p: {"phone_number": p["phone_number"]},
+            "phone number + name": lambda p: {
+                "phone_number": p["phone_number"][-10:],
+                "name": p["name"],
+            },
+        }
+        for label, get_params in searches.items():
+            durations = []
+            for sample in samples:
+                queryset = search_patients(
+                    PatientRegistration.objects.all(), **get_params(sample)
+                )
+                start = time.perf_counter()
+                list(queryset.values_list("id", flat=True)[:200])
+                durations.append((time.perf_counter() - start) * 1000)
+            durations.sort()
+            self.stdout.write(
+                f"{label}: median {statistics.median(durations):.1f}ms, "
+                f"p95 {durations[int(len(durations) * 0.95) - 1]:.1f}ms, "
+                f"max {durations[-1]:.1f}ms"
+            )
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from care.facility.static_data.icd11_search import build_icd11_search_index
+
+
+class Command(BaseCommand):
+    """
+    Command to build the in-memory ICD11 search index of this host
+    Usage: python manage.py build_icd11_search_index [--force]
+    """
+
+    help = "Builds the ICD11 search index used by the memory search backend"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild the index even if the diagnoses are unchanged",
+        )
+
+    def handle(self, *args, **options):
+        if settings.ICD11_SEARCH_BACKEND != "memory":
+            self.stdout.write("ICD11 search backend is not memory, skipping")
+            return
+        path = build_icd11_search_index(force=options["force"])
+        self.stdout.write(f"ICD11 search index built at {path}")
@@ -1,9 +1,11 @@
 from importlib import import_module
 
+from django.conf import settings
 from django.core.cache import cache
 from django.core.management import BaseCommand
 
 from care.facility.static_data.icd11 import load_icd11_diagnosis
+from care.facility.static_data.icd11_search import build_icd11_search_index
 from care.facility.static_data.medibase import load_medibase_medicines
 from plug_config import manager
 
@@ -11,31 +13,29 @@ from plug_config import manager
 class Command(BaseCommand):
     """
     Command to load static data to redis
-    Usage: python manage.py load_redis_index
+    Usage: python manage.py load_redis_index [--force]
     """
 
     help = "Loads static data to redis"
 
-    def handle(self, *args, **options):
-        try:
-            deleted_count = cache.delete_pattern("care_static_data*", itersize=25_000)
-            self.stdout.write(
-                f"Deleted {deleted_count} keys with prefix 'care_static_data'"
-            )
-        except Exception as e:
-            self.stdout.write(
-                f"Failed to delete keys with prefix 'care_static_data': {e}"
-            )
-            return
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild the indexes even if the source data is unchanged",
+        )
 
+    def handle(self, *args, **options):
         if cache.get("redis_index_loading"):
             self.stdout.write("Redis Index already loading, skipping")
             return
 
         cache.set("redis_index_loading", value=True, timeout=60 * 5)
 
-        load_icd11_diagnosis()
-        load_medibase_medicines()
+        load_icd11_diagnosis(force=options["force"])
+        load_medibase_medicines(force=options["force"])
+        if settings.ICD11_SEARCH_BACKEND == "memory":
+            build_icd11_search_index(force=options["force"])
 
         for plug in manager.plugs:
             try:
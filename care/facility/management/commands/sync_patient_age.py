@@ -1,24 +1,15 @@
 from django.core.management.base import BaseCommand
 
-from care.facility.models import PatientRegistration
+from care.facility.tasks.patient_age import refresh_patient_age
 
 
 class Command(BaseCommand):
     """
-    Management command to sync Date of Birth and Year of Birth and Age.
+    Management command to sync the stored age of Patients.
     """
 
     help = "Syncs the age of Patients based on Date of Birth and Year of Birth"
 
     def handle(self, *args, **options):
-        qs = PatientRegistration.objects.all()
-        failed = 0
-        for patient in qs:
-            try:
-                patient.save()
-            except Exception:
-                failed += 1
-        if failed:
-            self.stdout.write(f"Failed for {failed} Patient")
-        else:
-            self.stdout.write("Successfully Synced Age")
+        updated = refresh_patient_age()
+        self.stdout.write(f"Successfully Synced Age of {updated} Patients")
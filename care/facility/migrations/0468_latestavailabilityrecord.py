@@ -0,0 +1,70 @@
+# Generated by Django 5.1.2 on 2026-10-17 12:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("facility", "0467_alter_hospitaldoctors_area"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LatestAvailabilityRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("object_external_id", models.UUIDField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("Not Monitored", "Not Monitored"),
+                            ("Operational", "Operational"),
+                            ("Down", "Down"),
+                            ("Under Maintenance", "Under Maintenance"),
+                        ],
+                        default="Not Monitored",
+                        max_length=20,
+                    ),
+                ),
+                ("timestamp", models.DateTimeField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("content_type", "object_external_id"),
+                        name="unique_latest_availability_record",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO facility_latestavailabilityrecord
+                (content_type_id, object_external_id, status, timestamp)
+            SELECT DISTINCT ON (content_type_id, object_external_id)
+                content_type_id, object_external_id, status, timestamp
+            FROM facility_availabilityrecord
+            WHERE deleted = false
+            ORDER BY content_type_id, object_external_id, timestamp DESC
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
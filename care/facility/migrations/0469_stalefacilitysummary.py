@@ -0,0 +1,54 @@
+# Generated by Django 5.1.2 on 2026-10-17 12:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0468_latestavailabilityrecord"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StaleFacilitySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "s_type",
+                    models.CharField(
+                        choices=[
+                            ("FacilityCapacity", "FacilityCapacity"),
+                            ("PatientSummary", "PatientSummary"),
+                            ("TestSummary", "TestSummary"),
+                            ("TriageSummary", "TriageSummary"),
+                        ],
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "facility",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="facility.facility",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("s_type", "facility"),
+                        name="unique_stale_facility_summary",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.2 on 2026-10-17 12:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0470_alter_fileupload_file_type"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dailyround",
+            index=models.Index(
+                fields=["consultation", "taken_at"],
+                name="facility_da_consult_2b574f_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["intended_for", "created_date"],
+                name="facility_no_intende_5ae128_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="patientconsultationevent",
+            index=models.Index(
+                fields=["consultation", "taken_at"],
+                name="facility_pa_consult_5a045d_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="patientnotes",
+            index=models.Index(
+                fields=["patient", "created_date"],
+                name="facility_pa_patient_b41fc8_idx",
+            ),
+        ),
+    ]
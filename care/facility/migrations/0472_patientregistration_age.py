@@ -0,0 +1,60 @@
+# Generated by Django 5.1.2 on 2026-10-17 12:51
+
+from django.db import migrations, models
+from django.db.models import Case, F, Func, Value, When
+from django.db.models.functions import Coalesce, Now
+
+
+def populate_age(apps, schema_editor):
+    PatientRegistration = apps.get_model("facility", "PatientRegistration")
+    # a frozen copy of PatientAgeFunc
+    age = Func(
+        Value("year"),
+        Func(
+            Case(
+                When(death_datetime__isnull=True, then=Now()),
+                default=F("death_datetime__date"),
+            ),
+            Coalesce(
+                "date_of_birth",
+                Func(
+                    F("year_of_birth"),
+                    Value(1),
+                    Value(1),
+                    function="MAKE_DATE",
+                    output_field=models.DateField(),
+                ),
+                output_field=models.DateField(),
+            ),
+            function="age",
+        ),
+        function="date_part",
+        output_field=models.IntegerField(),
+    )
+    PatientRegistration.objects.filter(
+        models.Q(date_of_birth__isnull=False) | models.Q(year_of_birth__isnull=False)
+    ).update(age=age)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0471_cursor_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalpatientregistration",
+            name="age",
+            field=models.IntegerField(
+                blank=True, db_index=True, default=None, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="patientregistration",
+            name="age",
+            field=models.IntegerField(
+                blank=True, db_index=True, default=None, null=True
+            ),
+        ),
+        migrations.RunPython(populate_age, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.1.2 on 2026-10-17 12:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Case, F, OuterRef, Subquery, When
+
+
+def populate_consultation_state(apps, schema_editor):
+    PatientConsultation = apps.get_model("facility", "PatientConsultation")
+    PatientRegistration = apps.get_model("facility", "PatientRegistration")
+
+    def last_consultation_value(expression):
+        return Subquery(
+            PatientConsultation.objects.filter(id=OuterRef("last_consultation_id"))
+            .annotate(value=expression)
+            .values("value")[:1]
+        )
+
+    PatientRegistration.objects.filter(last_consultation__isnull=False).update(
+        effective_category=last_consultation_value(
+            Case(
+                When(
+                    last_daily_round__isnull=False,
+                    then=F("last_daily_round__patient_category"),
+                ),
+                default=F("category"),
+            )
+        ),
+        current_bed_type=last_consultation_value(F("current_bed__bed__bed_type")),
+        current_location=last_consultation_value(F("current_bed__bed__location_id")),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0472_patientregistration_age"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="patientregistration",
+            name="current_bed_type",
+            field=models.IntegerField(
+                blank=True,
+                choices=[
+                    (1, "ISOLATION"),
+                    (2, "ICU"),
+                    (3, "ICU_WITH_NON_INVASIVE_VENTILATOR"),
+                    (4, "ICU_WITH_OXYGEN_SUPPORT"),
+                    (5, "ICU_WITH_INVASIVE_VENTILATOR"),
+                    (6, "BED_WITH_OXYGEN_SUPPORT"),
+                    (7, "REGULAR"),
+                ],
+                db_index=True,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="patientregistration",
+            name="current_location",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="facility.assetlocation",
+            ),
+        ),
+        migrations.AddField(
+            model_name="patientregistration",
+            name="effective_category",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("Comfort", "Comfort Care"),
+                    ("Stable", "Mild"),
+                    ("Moderate", "Moderate"),
+                    ("Critical", "Critical"),
+                    ("ActivelyDying", "Actively Dying"),
+                ],
+                db_index=True,
+                max_length=13,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(
+            populate_consultation_state, reverse_code=migrations.RunPython.noop
+        ),
+    ]
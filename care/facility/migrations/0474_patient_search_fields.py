@@ -0,0 +1,77 @@
+# Generated by Django 5.1.2 on 2026-10-17 12:58
+
+import re
+import unicodedata
+from itertools import batched
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+# frozen copies of the normalizers in care.facility.utils.patient_search
+def normalize_name(name):
+    words = (
+        "".join(
+            char for char in word if unicodedata.category(char)[0] in ("L", "M", "N")
+        )
+        for word in unicodedata.normalize("NFKC", name).casefold().split()
+    )
+    return " ".join(word for word in words if word)
+
+
+def normalize_phone_number(phone_number):
+    return re.sub(r"\D", "", phone_number)
+
+
+def populate_search_fields(apps, schema_editor):
+    PatientRegistration = apps.get_model("facility", "PatientRegistration")
+    patients = PatientRegistration.objects.only("id", "name", "phone_number")
+    for batch in batched(patients.iterator(chunk_size=BATCH_SIZE), BATCH_SIZE):
+        for patient in batch:
+            patient.search_name = normalize_name(patient.name)
+            patient.search_phone_number = normalize_phone_number(patient.phone_number)
+        PatientRegistration.objects.bulk_update(
+            batch, ["search_name", "search_phone_number"]
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0473_patient_consultation_state"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="patientregistration",
+            name="search_name",
+            field=models.CharField(blank=True, default="", max_length=200),
+        ),
+        migrations.AddField(
+            model_name="patientregistration",
+            name="search_phone_number",
+            field=models.CharField(blank=True, default="", max_length=14),
+        ),
+        migrations.RunPython(
+            populate_search_fields, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="patientregistration",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_name"],
+                name="patient_search_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="patientregistration",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_phone_number"],
+                name="patient_search_phone_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-17 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0475_vitals_chunk"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="patientregistration",
+            name="patient_search_phone_trgm",
+        ),
+        migrations.AddIndex(
+            model_name="patientregistration",
+            index=models.Index(
+                fields=["search_phone_number"], name="patient_search_phone_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-17 13:48
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0476_patient_search_phone_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stalefacilitysummary",
+            name="marked_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
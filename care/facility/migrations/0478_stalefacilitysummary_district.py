@@ -0,0 +1,26 @@
+# Generated by Django 5.1.2 on 2026-10-17 14:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0477_stalefacilitysummary_marked_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="stalefacilitysummary",
+            name="s_type",
+            field=models.CharField(
+                choices=[
+                    ("FacilityCapacity", "FacilityCapacity"),
+                    ("PatientSummary", "PatientSummary"),
+                    ("TestSummary", "TestSummary"),
+                    ("TriageSummary", "TriageSummary"),
+                    ("DistrictPatientSummary", "DistrictPatientSummary"),
+                ],
+                max_length=100,
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-17 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facility", "0478_stalefacilitysummary_district"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="fileupload",
+            name="file_type",
+            field=models.IntegerField(
+                choices=[
+                    (0, "OTHER"),
+                    (1, "PATIENT"),
+                    (2, "CONSULTATION"),
+                    (3, "SAMPLE_MANAGEMENT"),
+                    (4, "CLAIM"),
+                    (5, "DISCHARGE_SUMMARY"),
+                    (6, "COMMUNICATION"),
+                    (7, "CONSENT_RECORD"),
+                    (8, "ABDM_HEALTH_INFORMATION"),
+                    (9, "CSV_EXPORT"),
+                    (10, "EXTERNAL_TEST_IMPORT"),
+                ],
+                default=1,
+            ),
+        ),
+    ]
@@ -21,3 +21,4 @@ from .prescription import *  # noqa
 from .resources import *  # noqa
 from .shifting import *  # noqa
 from .summary import *  # noqa
+from .vitals import *  # noqa
@@ -2,7 +2,7 @@ import enum
 import uuid
 
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import connection, models
 from django.db.models import JSONField, Q
 
 from care.facility.models import reverse_choices
@@ -246,6 +246,82 @@ class AvailabilityRecord(BaseModel):
         model = self.content_type.model_class()
         return model.objects.get(external_id=self.object_external_id)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        LatestAvailabilityRecord.update_from_records([self])
+
+
+class LatestAvailabilityRecord(models.Model):
+    """
+    The latest availability record of each object, kept in sync as records are
+    written so that the current status of an object is a lookup by its content
+    type and external id instead of a scan of its history.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_external_id = models.UUIDField()
+    status = models.CharField(
+        choices=AvailabilityStatus,
+        default=AvailabilityStatus.NOT_MONITORED,
+        max_length=20,
+    )
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                name="unique_latest_availability_record",
+                fields=["content_type", "object_external_id"],
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.content_type} ({self.object_external_id}) - {self.status}"
+
+    @classmethod
+    def update_from_records(cls, records: list[AvailabilityRecord]):
+        """
+        Upserts the latest of the given records of every object, unless a more
+        recent record of the object is already known.
+
+        The timestamps are compared in the upsert itself, so concurrent updates
+        cannot replace a status with an older one.
+        """
+        latest = {}
+        for record in records:
+            if record.deleted:
+                continue
+            key = (record.content_type_id, record.object_external_id)
+            if key not in latest or record.timestamp > latest[key].timestamp:
+                latest[key] = record
+        if not latest:
+            return
+
+        # bulk_create cannot make the update of a conflicting row conditional
+        table = connection.ops.quote_name(cls._meta.db_table)
+        rows = ", ".join(["(%s, %s, %s, %s)"] * len(latest))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table}
+                    (content_type_id, object_external_id, status, "timestamp")
+                VALUES {rows}
+                ON CONFLICT (content_type_id, object_external_id) DO UPDATE
+                SET status = EXCLUDED.status, "timestamp" = EXCLUDED."timestamp"
+                WHERE EXCLUDED."timestamp" > {table}."timestamp"
+                """,  # noqa: S608
+                [
+                    param
+                    for record in latest.values()
+                    for param in (
+                        record.content_type_id,
+                        record.object_external_id,
+                        record.status,
+                        record.timestamp,
+                    )
+                ],
+            )
+
 
 class UserDefaultAssetLocation(BaseModel):
     user = models.ForeignKey(User, on_delete=models.PROTECT, null=False, blank=False)
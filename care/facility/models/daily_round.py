@@ -499,6 +499,9 @@ class DailyRound(PatientBaseModel):
 
     meta = JSONField(default=dict, validators=[JSONFieldSchemaValidator(META)])
 
+    class Meta:
+        indexes = [models.Index(fields=["consultation", "taken_at"])]
+
     def cztn(self, value):
         """
         Cast null to zero values
@@ -70,7 +70,10 @@ class PatientConsultationEvent(models.Model):
 
     class Meta:
         ordering = ["-created_date"]
-        indexes = [models.Index(fields=["consultation", "is_latest"])]
+        indexes = [
+            models.Index(fields=["consultation", "is_latest"]),
+            models.Index(fields=["consultation", "taken_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.id} - {self.consultation_id} - {self.event_type} - {self.change_type}"
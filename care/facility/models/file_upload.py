@@ -2,11 +2,11 @@ import time
 import uuid
 from uuid import uuid4
 
-import boto3
 from django.contrib.auth import get_user_model
 from django.db import models
 
-from care.utils.csp.config import BucketType, get_client_config
+from care.utils.csp.client import get_client, get_read_signed_urls
+from care.utils.csp.config import BucketType
 from care.utils.models.base import BaseManager
 
 User = get_user_model()
@@ -64,14 +64,16 @@ class BaseFileUpload(models.Model):
         parts = self.internal_name.split(".")
         return f".{parts[-1]}" if len(parts) > 1 else ""
 
+    def get_object_key(self):
+        return f"{self.FileType(self.file_type).name}/{self.internal_name}"
+
     def signed_url(
         self, duration=60 * 60, mime_type=None, bucket_type=BucketType.PATIENT
     ):
-        config, bucket_name = get_client_config(bucket_type, external=True)
-        s3 = boto3.client("s3", **config)
+        s3, bucket_name = get_client(bucket_type, external=True)
         params = {
             "Bucket": bucket_name,
-            "Key": f"{self.FileType(self.file_type).name}/{self.internal_name}",
+            "Key": self.get_object_key(),
         }
         if mime_type:
             params["ContentType"] = mime_type
@@ -82,33 +84,42 @@ class BaseFileUpload(models.Model):
         )
 
     def read_signed_url(self, duration=60 * 60, bucket_type=BucketType.PATIENT):
-        config, bucket_name = get_client_config(bucket_type, external=True)
-        s3 = boto3.client("s3", **config)
-        return s3.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": bucket_name,
-                "Key": f"{self.FileType(self.file_type).name}/{self.internal_name}",
-            },
-            ExpiresIn=duration,  # seconds
+        prefetched = getattr(self, "_prefetched_read_signed_urls", {})
+        if (duration, bucket_type) in prefetched:
+            return prefetched[duration, bucket_type]
+        key = self.get_object_key()
+        return get_read_signed_urls([key], duration, bucket_type)[key]
+
+    @classmethod
+    def prefetch_read_signed_urls(
+        cls, files, duration=60 * 60, bucket_type=BucketType.PATIENT
+    ):
+        """
+        Signs the read URLs of `files` at once, so that `read_signed_url` on
+        each of them does not have to look them up individually.
+        """
+        urls = get_read_signed_urls(
+            [file.get_object_key() for file in files], duration, bucket_type
         )
+        for file in files:
+            file.__dict__.setdefault("_prefetched_read_signed_urls", {})[
+                duration, bucket_type
+            ] = urls[file.get_object_key()]
 
     def put_object(self, file, bucket_type=BucketType.PATIENT, **kwargs):
-        config, bucket_name = get_client_config(bucket_type)
-        s3 = boto3.client("s3", **config)
+        s3, bucket_name = get_client(bucket_type)
         return s3.put_object(
             Body=file,
             Bucket=bucket_name,
-            Key=f"{self.FileType(self.file_type).name}/{self.internal_name}",
+            Key=self.get_object_key(),
             **kwargs,
         )
 
     def get_object(self, bucket_type=BucketType.PATIENT, **kwargs):
-        config, bucket_name = get_client_config(bucket_type)
-        s3 = boto3.client("s3", **config)
+        s3, bucket_name = get_client(bucket_type)
         return s3.get_object(
             Bucket=bucket_name,
-            Key=f"{self.FileType(self.file_type).name}/{self.internal_name}",
+            Key=self.get_object_key(),
             **kwargs,
         )
 
@@ -138,6 +149,8 @@ class FileUpload(BaseFileUpload):
         COMMUNICATION = 6, "COMMUNICATION"
         CONSENT_RECORD = 7, "CONSENT_RECORD"
         ABDM_HEALTH_INFORMATION = 8, "ABDM_HEALTH_INFORMATION"
+        CSV_EXPORT = 9, "CSV_EXPORT"
+        EXTERNAL_TEST_IMPORT = 10, "EXTERNAL_TEST_IMPORT"
 
     file_type = models.IntegerField(choices=FileType, default=FileType.PATIENT)
     is_archived = models.BooleanField(default=False)
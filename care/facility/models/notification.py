@@ -66,3 +66,6 @@ class Notification(FacilityBaseModel):
     event = models.IntegerField(choices=EventChoices, default=Event.MESSAGE.value)
     message = models.TextField(max_length=2000, null=True, default=None)
     caused_objects = JSONField(null=True, blank=True, default=dict)
+
+    class Meta:
+        indexes = [models.Index(fields=["intended_for", "created_date"])]
@@ -3,6 +3,7 @@ from datetime import date
 
 from dateutil.relativedelta import relativedelta
 from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Case, F, Func, JSONField, Value, When
@@ -33,13 +34,16 @@ from care.facility.models.mixins.permissions.patient import (
 )
 from care.facility.models.patient_base import (
     BLOOD_GROUP_CHOICES,
+    CATEGORY_CHOICES,
     DISEASE_STATUS_CHOICES,
     REVERSE_CATEGORY_CHOICES,
     REVERSE_NEW_DISCHARGE_REASON_CHOICES,
     REVERSE_ROUTE_TO_FACILITY_CHOICES,
+    BedTypeChoices,
 )
 from care.facility.models.patient_consultation import PatientConsultation
 from care.facility.static_data.icd11 import get_icd11_diagnoses_objects_by_ids
+from care.facility.utils.patient_search import normalize_name, normalize_phone_number
 from care.users.models import GENDER_CHOICES, REVERSE_GENDER_CHOICES, User
 from care.utils.models.base import BaseManager, BaseModel
 from care.utils.models.validators import mobile_or_landline_number_validator
@@ -51,6 +55,14 @@ class RationCardCategory(models.TextChoices):
     APL = "APL", _("APL")
 
 
+# fields calculated on save, and the fields they are calculated from
+DERIVED_FIELD_DEPENDENCIES = {
+    "age": frozenset({"date_of_birth", "year_of_birth", "death_datetime"}),
+    "search_name": frozenset({"name"}),
+    "search_phone_number": frozenset({"phone_number"}),
+}
+
+
 class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
     # fields in the PatientSearch model
     PATIENT_SEARCH_KEYS = [
@@ -127,6 +139,10 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
     emergency_phone_number = models.CharField(
         max_length=14, validators=[mobile_or_landline_number_validator], default=""
     )
+    # normalized name and phone number, kept in sync on save, for search
+    SEARCH_FIELDS = ("search_name", "search_phone_number")
+    search_name = models.CharField(max_length=200, default="", blank=True)
+    search_phone_number = models.CharField(max_length=14, default="", blank=True)
 
     address = models.TextField(default="")
     permanent_address = models.TextField(default="")
@@ -136,6 +152,9 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
     date_of_birth = models.DateField(default=None, null=True)
     year_of_birth = models.IntegerField(validators=[MinValueValidator(1900)], null=True)
     death_datetime = models.DateTimeField(default=None, null=True)
+    # age in years, kept in sync on save and refreshed daily by
+    # `refresh_patient_age` as birthdays pass
+    age = models.IntegerField(default=None, null=True, blank=True, db_index=True)
 
     nationality = models.CharField(
         max_length=255, default="", verbose_name="Nationality of Patient"
@@ -299,6 +318,26 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
     last_consultation = models.ForeignKey(
         PatientConsultation, on_delete=models.SET_NULL, null=True, default=None
     )
+    # denormalized from the last consultation by `update_patient_consultation_state`
+    # so that the patient list can be filtered and ordered by them without joins
+    CONSULTATION_STATE_FIELDS = (
+        "effective_category",
+        "current_bed_type",
+        "current_location",
+    )
+    effective_category = models.CharField(
+        choices=CATEGORY_CHOICES, max_length=13, null=True, blank=True, db_index=True
+    )
+    current_bed_type = models.IntegerField(
+        choices=BedTypeChoices, null=True, blank=True, db_index=True
+    )
+    current_location = models.ForeignKey(
+        "facility.AssetLocation",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
 
     will_donate_blood = models.BooleanField(
         default=None,
@@ -425,10 +464,24 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
         related_name="root_patient_assigned_to",
     )
 
-    history = HistoricalRecords(excluded_fields=["meta_info"])
+    history = HistoricalRecords(
+        excluded_fields=["meta_info", *SEARCH_FIELDS, *CONSULTATION_STATE_FIELDS]
+    )
 
     objects = BaseManager()
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=["search_name"],
+                opclasses=["gin_trgm_ops"],
+                name="patient_search_name_trgm",
+            ),
+            models.Index(
+                fields=["search_phone_number"], name="patient_search_phone_idx"
+            ),
+        ]
+
     @property
     def is_expired(self) -> bool:
         return self.death_datetime is not None
@@ -465,6 +518,20 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
         if self.date_of_birth:
             self.year_of_birth = self.date_of_birth.year
 
+        self.age = self.calculate_age()
+        self.search_name = normalize_name(self.name)
+        self.search_phone_number = normalize_phone_number(self.phone_number)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields,
+                *(
+                    field
+                    for field, dependencies in DERIVED_FIELD_DEPENDENCIES.items()
+                    if dependencies.intersection(update_fields)
+                ),
+            }
+
         self.date_of_receipt_of_information = (
             self.date_of_receipt_of_information
             if self.date_of_receipt_of_information is not None
@@ -474,11 +541,18 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
         self._alias_recovery_to_recovered()
         super().save(*args, **kwargs)
 
-    def get_age(self) -> str:
+    def get_age_delta(self) -> relativedelta:
         start = self.date_of_birth or date(self.year_of_birth, 1, 1)
         end = (self.death_datetime or timezone.now()).date()
+        return relativedelta(end, start)
 
-        delta = relativedelta(end, start)
+    def calculate_age(self) -> int | None:
+        if not self.date_of_birth and not self.year_of_birth:
+            return None
+        return self.get_age_delta().years
+
+    def get_age(self) -> str:
+        delta = self.get_age_delta()
 
         if delta.years > 0:
             year_str = f"{delta.years} year{pluralize(delta.years)}"
@@ -502,6 +576,14 @@ class PatientRegistration(PatientBaseModel, PatientPermissionMixin):
             filter=models.Q(*args, **kwargs),
         )
 
+    CSV_DIAGNOSES_FIELDS = (
+        "principal_diagnoses",
+        "unconfirmed_diagnoses",
+        "provisional_diagnoses",
+        "differential_diagnoses",
+        "confirmed_diagnoses",
+    )
+
     CSV_ANNOTATE_FIELDS = {
         # Principal Diagnoses
         "principal_diagnoses": annotate_diagnosis_ids(
@@ -807,6 +889,9 @@ class PatientNotes(FacilityBaseModel, ConsultationRelatedPermissionMixin):
     )
     note = models.TextField(default="", blank=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["patient", "created_date"])]
+
     def get_related_consultation(self):
         # This is a temporary hack! this model does not have `assigned_to` field
         # and hence the permission mixin will fail if edit/object_read permissions are checked (although not used as of now)
@@ -844,7 +929,7 @@ class PatientAgeFunc(Func):
     Eg:
 
     ```
-    PatientSample.objects.annotate(patient_age=PatientAgeFunc())
+    PatientRegistration.objects.update(age=PatientAgeFunc())
     ```
     """
 
@@ -855,13 +940,13 @@ class PatientAgeFunc(Func):
             Value("year"),
             Func(
                 Case(
-                    When(patient__death_datetime__isnull=True, then=Now()),
-                    default=F("patient__death_datetime__date"),
+                    When(death_datetime__isnull=True, then=Now()),
+                    default=F("death_datetime__date"),
                 ),
                 Coalesce(
-                    "patient__date_of_birth",
+                    "date_of_birth",
                     Func(
-                        F("patient__year_of_birth"),
+                        F("year_of_birth"),
                         Value(1),
                         Value(1),
                         function="MAKE_DATE",
@@ -1,7 +1,6 @@
 from django.db import models
 
 from care.facility.models import FacilityBaseModel, PatientRegistration, reverse_choices
-from care.facility.models.patient import PatientAgeFunc
 from care.users.models import User
 
 SAMPLE_TYPE_CHOICES = [
@@ -126,10 +125,6 @@ class PatientSample(FacilityBaseModel):
         "date_of_result": "Date of Result",
     }
 
-    CSV_ANNOTATE_FIELDS = {
-        "patient__age": PatientAgeFunc(),
-    }
-
     CSV_MAKE_PRETTY = {
         "sample_type": (lambda x: REVERSE_SAMPLE_TYPE_CHOICES.get(x, "-")),
         "status": (
@@ -3,7 +3,6 @@ from django.db import models
 from care.facility.models import (
     FACILITY_TYPES,
     FacilityBaseModel,
-    PatientAgeFunc,
     pretty_boolean,
     reverse_choices,
 )
@@ -140,10 +139,6 @@ class ShiftingRequest(FacilityBaseModel):
         "reason": "Reason for Shifting",
     }
 
-    CSV_ANNOTATE_FIELDS = {
-        "patient__age": PatientAgeFunc(),
-    }
-
     CSV_MAKE_PRETTY = {
         "status": (lambda x: REVERSE_SHIFTING_STATUS_CHOICES.get(x, "-")),
         "is_up_shift": pretty_boolean,
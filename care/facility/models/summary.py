@@ -2,6 +2,7 @@ from uuid import uuid4
 
 from django.db import models
 from django.db.models import JSONField
+from django.utils.timezone import now
 
 from care.facility.models.facility import Facility
 from care.users.models import District, LocalBody
@@ -118,3 +119,32 @@ class LocalBodyScopedSummary(models.Model):
 
     def __str__(self):
         return f"LocalBodyScopedSummary - {self.lsg} - {self.s_type}"
+
+
+# the district patient summary is marked by the facilities that changed
+STALE_SUMMARY_CHOICES = (
+    *SUMMARY_CHOICES,
+    ("DistrictPatientSummary", "DistrictPatientSummary"),
+)
+
+
+class StaleFacilitySummary(models.Model):
+    """
+    Marks a facility whose summary of the given type is out of date, so that
+    the periodic summarization only recomputes the facilities that changed.
+    """
+
+    facility = models.ForeignKey(Facility, on_delete=models.CASCADE)
+    s_type = models.CharField(choices=STALE_SUMMARY_CHOICES, max_length=100)
+    # the last time the facility changed, to keep marks made during a run
+    marked_at = models.DateTimeField(default=now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["s_type", "facility"], name="unique_stale_facility_summary"
+            )
+        ]
+
+    def __str__(self):
+        return f"StaleFacilitySummary - {self.facility_id} - {self.s_type}"
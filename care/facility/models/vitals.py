@@ -0,0 +1,41 @@
+from django.contrib.postgres.fields import ArrayField
+from django.core.validators import RegexValidator
+from django.db import models
+
+vital_name_validator = RegexValidator(
+    r"^[a-z0-9_]+(\.[a-z0-9_]+)*$",
+    "Vital names are lowercase words separated by dots, such as bp.systolic",
+)
+
+
+class VitalsChunk(models.Model):
+    """
+    A chunk of consecutive readings of a single vital of a consultation, as
+    recorded by a device such as a monitor or a ventilator.
+
+    Readings are stored as arrays rather than a row each: `time_deltas` holds
+    the milliseconds from the previous reading, or from `start` for the first
+    one, and `values` the values read. Chunks only ever grow at their end.
+    """
+
+    consultation = models.ForeignKey(
+        "facility.PatientConsultation",
+        on_delete=models.PROTECT,
+        related_name="vitals_chunks",
+    )
+    asset = models.ForeignKey(
+        "facility.Asset", on_delete=models.PROTECT, null=True, related_name="+"
+    )
+    vital = models.CharField(max_length=50, validators=[vital_name_validator])
+    start = models.DateTimeField()
+    end = models.DateTimeField()
+    time_deltas = ArrayField(models.IntegerField(), default=list)
+    values = ArrayField(models.FloatField(), default=list)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["consultation", "vital", "end"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.consultation_id} - {self.vital} - {self.start}"
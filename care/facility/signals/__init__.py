@@ -1 +1,5 @@
+from .accessible_facilities import *  # noqa
 from .asset_updates import *  # noqa
+from .event_types import *  # noqa
+from .patient_state import *  # noqa
+from .summaries import *  # noqa
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+
+from care.facility.models.facility import FacilityUser
+from care.utils.cache.cache_allowed_facilities import invalidate_accessible_facilities
+
+
+def invalidate_user_facilities(sender, instance, **kwargs):
+    invalidate_accessible_facilities(instance.user_id)
+
+
+post_save.connect(
+    invalidate_user_facilities,
+    sender=FacilityUser,
+    dispatch_uid="accessible_facilities_FacilityUser",
+)
+post_delete.connect(
+    invalidate_user_facilities,
+    sender=FacilityUser,
+    dispatch_uid="accessible_facilities_FacilityUser",
+)
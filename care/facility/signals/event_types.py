@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from care.facility.events.handler import invalidate_event_type_groups
+from care.facility.models.events import EventType
+
+
+@receiver(post_save, sender=EventType)
+@receiver(post_delete, sender=EventType)
+def invalidate_cached_event_types(sender, instance, **kwargs):
+    # invalidated again on commit so that no process caches the groups as
+    # they were before the transaction in the meantime
+    invalidate_event_type_groups()
+    transaction.on_commit(invalidate_event_type_groups)
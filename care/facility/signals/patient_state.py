@@ -0,0 +1,70 @@
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+
+from care.facility.models import (
+    Bed,
+    ConsultationBed,
+    DailyRound,
+    PatientConsultation,
+    PatientRegistration,
+)
+from care.facility.utils.patient_state import update_patient_consultation_state
+
+# the patients whose consultation state is affected by a change to an instance
+AFFECTED_PATIENTS = {
+    PatientRegistration: lambda instance: Q(id=instance.id),
+    PatientConsultation: lambda instance: Q(last_consultation_id=instance.id),
+    DailyRound: lambda instance: Q(last_consultation_id=instance.consultation_id),
+    ConsultationBed: lambda instance: Q(last_consultation__current_bed_id=instance.id),
+    Bed: lambda instance: Q(last_consultation__current_bed__bed_id=instance.id),
+}
+
+
+# the fields of each model that the consultation state is denormalized from,
+# saves that update none of them leave the state as it is
+STATE_FIELDS = {
+    PatientRegistration: {"last_consultation"},
+    PatientConsultation: {"category", "last_daily_round", "current_bed"},
+    DailyRound: {"patient_category"},
+    ConsultationBed: {"bed"},
+    Bed: {"bed_type", "location"},
+}
+
+
+def update_affected_patients_on_save(
+    sender, instance, created, raw, update_fields, **kwargs
+):
+    if raw or (
+        update_fields
+        and not STATE_FIELDS[sender].intersection(
+            sender._meta.get_field(name).name  # noqa: SLF001
+            for name in update_fields
+        )
+    ):
+        return
+
+    patients = AFFECTED_PATIENTS[sender](instance)
+    if sender is DailyRound:
+        # a round only affects the state once it is the last round of its
+        # consultation, which is set by saving the consultation
+        if created:
+            return
+        patients &= Q(last_consultation__last_daily_round_id=instance.id)
+    update_patient_consultation_state(patients)
+
+
+def update_affected_patients_on_delete(sender, instance, **kwargs):
+    update_patient_consultation_state(AFFECTED_PATIENTS[sender](instance))
+
+
+for model in AFFECTED_PATIENTS:
+    post_save.connect(
+        update_affected_patients_on_save,
+        sender=model,
+        dispatch_uid=f"patient_state_{model.__name__}",
+    )
+    post_delete.connect(
+        update_affected_patients_on_delete,
+        sender=model,
+        dispatch_uid=f"patient_state_{model.__name__}",
+    )
@@ -0,0 +1,96 @@
+# ruff: noqa: SLF001
+from django.db.models.signals import post_delete, post_init, post_save
+
+from care.facility.models import (
+    Bed,
+    ConsultationBed,
+    Facility,
+    FacilityCapacity,
+    PatientConsultation,
+    PatientRegistration,
+    PatientSample,
+)
+from care.facility.models.inventory import FacilityInventoryLog
+from care.facility.utils.summarization.stale import mark_facilities_stale
+
+# models whose instances can move to another facility
+MOVABLE_MODELS = (PatientRegistration, PatientConsultation)
+
+
+def record_initial_facilities(sender, instance, **kwargs):
+    # the facilities the instance was counted in as loaded, which are out of
+    # date too if it moves to another facility
+    instance._summarized_facilities = (
+        instance.__dict__.get("facility_id"),
+        instance.__dict__.get("last_consultation_id"),
+    )
+
+
+def get_consultation_facilities(consultation_ids):
+    consultation_ids = {
+        consultation_id for consultation_id in consultation_ids if consultation_id
+    }
+    if not consultation_ids:
+        return []
+    return list(
+        PatientConsultation.objects.filter(id__in=consultation_ids).values_list(
+            "facility_id", flat=True
+        )
+    )
+
+
+def get_patient_facilities(instance):
+    """
+    Returns the facility of the patient and of its last consultation, which
+    patient summaries are grouped by, both as loaded and as saved.
+    """
+    facility_id, last_consultation_id = instance._summarized_facilities
+    consultation_ids = {last_consultation_id, instance.last_consultation_id}
+    facility_ids = [facility_id, instance.facility_id]
+    if PatientRegistration.last_consultation.is_cached(instance):
+        consultation_ids.discard(instance.last_consultation_id)
+        if instance.last_consultation:
+            facility_ids.append(instance.last_consultation.facility_id)
+    return facility_ids + get_consultation_facilities(consultation_ids)
+
+
+# the facilities whose summaries are affected by a change to an instance
+SUMMARIZED_FACILITIES = {
+    Facility: lambda instance: [instance.id],
+    FacilityCapacity: lambda instance: [instance.facility_id],
+    Bed: lambda instance: [instance.facility_id],
+    ConsultationBed: lambda instance: [instance.bed.facility_id],
+    PatientRegistration: get_patient_facilities,
+    PatientConsultation: lambda instance: [
+        instance._summarized_facilities[0],
+        instance.facility_id,
+    ],
+    FacilityInventoryLog: lambda instance: [instance.facility_id],
+    PatientSample: lambda instance: get_consultation_facilities(
+        [instance.consultation_id]
+    ),
+}
+
+
+def mark_summaries_stale(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    mark_facilities_stale(SUMMARIZED_FACILITIES[sender](instance))
+    if sender in MOVABLE_MODELS:
+        record_initial_facilities(sender, instance)
+
+
+for model in SUMMARIZED_FACILITIES:
+    post_save.connect(
+        mark_summaries_stale, sender=model, dispatch_uid=f"summaries_{model.__name__}"
+    )
+    post_delete.connect(
+        mark_summaries_stale, sender=model, dispatch_uid=f"summaries_{model.__name__}"
+    )
+
+for model in MOVABLE_MODELS:
+    post_init.connect(
+        record_initial_facilities,
+        sender=model,
+        dispatch_uid=f"summaries_initial_{model.__name__}",
+    )
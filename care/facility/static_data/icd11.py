@@ -1,11 +1,18 @@
 import logging
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import TypedDict
 
-from django.core.paginator import Paginator
-from redis_om import Field, Migrator
+from redis_om import Field
 
 from care.facility.models.icd11_diagnosis import ICD11Diagnosis
+from care.utils.static_data.loader import (
+    STATIC_DATA_BATCH_SIZE,
+    load_static_data_index,
+    queryset_checksum,
+)
 from care.utils.static_data.models.base import BaseRedisModel
 
 logger = logging.getLogger(__name__)
@@ -36,46 +43,158 @@ class ICD11(BaseRedisModel):
         }
 
 
-def load_icd11_diagnosis():
+def load_icd11_diagnosis(force=False):
     logger.info("Loading ICD11 Diagnosis into the redis cache...")
 
-    icd_objs = ICD11Diagnosis.objects.order_by("id").values_list(
-        "id", "label", "meta_chapter_short"
-    )
-    paginator = Paginator(icd_objs, 5000)
-    for page_number in paginator.page_range:
-        for diagnosis in paginator.page(page_number).object_list:
+    fields = ["id", "label", "meta_chapter_short"]
+    icd_objs = ICD11Diagnosis.objects.order_by("id").values_list(*fields)
+    loaded = load_static_data_index(
+        ICD11,
+        (
             ICD11(
                 id=diagnosis[0],
                 label=diagnosis[1],
                 chapter=diagnosis[2] or "null",
                 has_code=1 if re.match(DISEASE_CODE_PATTERN, diagnosis[1]) else 0,
                 vec=diagnosis[1].replace(".", "\\.", 1),
-            ).save()
-    Migrator().run()
-    logger.info("ICD11 Diagnosis Loaded")
+            )
+            for diagnosis in icd_objs.iterator(chunk_size=STATIC_DATA_BATCH_SIZE)
+        ),
+        checksum=queryset_checksum(ICD11Diagnosis.objects.all(), fields),
+        force=force,
+    )
+    if loaded:
+        logger.info("ICD11 Diagnosis Loaded")
+
+
+# number of diagnosis representations kept in memory by each worker
+ICD11_LOOKUP_CACHE_SIZE = 4096
+
+_lookup_cache: OrderedDict[tuple[int | None, int], ICD11Object] = OrderedDict()
+_lookup_cache_lock = threading.Lock()
+
+
+def _lookup_icd11_diagnoses(diagnoses_ids: Iterable[int]) -> dict[int, ICD11Object]:
+    """
+    Returns the representations of the given diagnoses, keyed by id. Misses of
+    the per-process LRU cache are fetched from redis in a single pipeline.
+
+    The cache is keyed by the live generation of the index, so entries of a
+    replaced generation are never served.
+    """
+    version = ICD11.live_version()
+    found: dict[int, ICD11Object] = {}
+    missing: list[int] = []
+    with _lookup_cache_lock:
+        for diagnosis_id in dict.fromkeys(diagnoses_ids):
+            if (cached := _lookup_cache.get((version, diagnosis_id))) is not None:
+                _lookup_cache.move_to_end((version, diagnosis_id))
+                found[diagnosis_id] = cached
+            else:
+                missing.append(diagnosis_id)
+
+    if not missing:
+        return found
+
+    pipeline = ICD11.db().pipeline(transaction=False)
+    for diagnosis_id in missing:
+        pipeline.hgetall(ICD11.make_primary_key(diagnosis_id))
+    documents = pipeline.execute()
+
+    with _lookup_cache_lock:
+        for diagnosis_id, document in zip(missing, documents, strict=True):
+            if not document:
+                continue
+            found[diagnosis_id] = ICD11.parse_obj(document).get_representation()
+            _lookup_cache[(version, diagnosis_id)] = found[diagnosis_id]
+        while len(_lookup_cache) > ICD11_LOOKUP_CACHE_SIZE:
+            _lookup_cache.popitem(last=False)
+    return found
 
 
 def get_icd11_diagnosis_object_by_id(
     diagnosis_id: int, as_dict=False
 ) -> ICD11 | ICD11Object | None:
     try:
-        diagnosis = ICD11.get(diagnosis_id)
-        return diagnosis.get_representation() if as_dict else diagnosis
+        if as_dict:
+            diagnosis = _lookup_icd11_diagnoses([int(diagnosis_id)]).get(
+                int(diagnosis_id)
+            )
+            return diagnosis and dict(diagnosis)
+        return ICD11.get(diagnosis_id)
     except Exception:
         return None
 
 
-def get_icd11_diagnoses_objects_by_ids(diagnoses_ids: list[int]) -> list[ICD11Object]:
+def get_icd11_diagnoses_objects_by_ids(
+    diagnoses_ids: Iterable[int],
+) -> list[ICD11Object]:
+    """
+    Returns the representations of the given diagnoses in the order of the
+    ids, skipping ids that are not found.
+    """
     if not diagnoses_ids:
         return []
 
-    query = None
-    for diagnosis_id in diagnoses_ids:
-        if query is None:
-            query = ICD11.id == diagnosis_id
-        else:
-            query |= ICD11.id == diagnosis_id
+    diagnoses_ids = [int(diagnosis_id) for diagnosis_id in diagnoses_ids]
+    diagnoses = _lookup_icd11_diagnoses(diagnoses_ids)
+    return [
+        dict(diagnoses[diagnosis_id])
+        for diagnosis_id in diagnoses_ids
+        if diagnosis_id in diagnoses
+    ]
+
 
-    diagnosis_objects: list[ICD11] = list(ICD11.find(query))
-    return [diagnosis.get_representation() for diagnosis in diagnosis_objects]
+def prefetch_icd11_diagnoses(diagnoses_ids: Iterable[int]):
+    """
+    Loads the given diagnoses into the lookup cache with a single round-trip,
+    so that rendering them one by one afterwards does not hit redis.
+    """
+    try:
+        _lookup_icd11_diagnoses(int(diagnosis_id) for diagnosis_id in diagnoses_ids)
+    except Exception:
+        logger.exception("Failed to prefetch ICD11 diagnoses")
+
+
+class ICD11LabelResolver:
+    """
+    Renders the labels of diagnoses for the lifetime of an export. The labels
+    of the diagnoses in a chunk of rows are fetched with a single round-trip
+    by `prefetch`, and kept for the rest of the export, so that rendering
+    the cells afterwards does not hit redis.
+    """
+
+    def __init__(self):
+        self.labels: dict[int, str | None] = {}
+
+    def prefetch(self, diagnoses_ids: Iterable[int]):
+        missing = {int(diagnosis_id) for diagnosis_id in diagnoses_ids}
+        missing.difference_update(self.labels)
+        if not missing:
+            return
+        diagnoses = _lookup_icd11_diagnoses(missing)
+        for diagnosis_id in missing:
+            diagnosis = diagnoses.get(diagnosis_id)
+            self.labels[diagnosis_id] = diagnosis and diagnosis["label"]
+
+    def prefetch_records(self, records: Iterable[dict], fields: Iterable[str]):
+        """
+        Prefetches the diagnoses in the given fields of values records.
+        """
+        fields = tuple(fields)
+        self.prefetch(
+            diagnosis_id
+            for record in records
+            for field in fields
+            for diagnosis_id in record.get(field) or ()
+            if diagnosis_id is not None
+        )
+
+    def format(self, diagnoses_ids: Iterable[int]) -> str:
+        diagnoses_ids = [int(diagnosis_id) for diagnosis_id in diagnoses_ids]
+        self.prefetch(diagnoses_ids)
+        return ", ".join(
+            label
+            for diagnosis_id in diagnoses_ids
+            if (label := self.labels[diagnosis_id]) is not None
+        )
@@ -0,0 +1,161 @@
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from redis_om import FindQuery
+
+from care.facility.models.icd11_diagnosis import ICD11Diagnosis
+from care.facility.static_data.icd11 import (
+    DISEASE_CODE_PATTERN,
+    ICD11,
+    ICD11Object,
+)
+from care.utils.static_data.helpers import query_builder
+from care.utils.static_data.loader import STATIC_DATA_BATCH_SIZE, queryset_checksum
+from care.utils.static_data.prefix_index import (
+    PrefixIndex,
+    PrefixIndexEntry,
+    build_prefix_index,
+    remove_stale_index_files,
+)
+
+logger = logging.getLogger(__name__)
+
+ICD11_INDEX_FIELDS = ["id", "label", "meta_chapter_short"]
+
+
+class ICD11SearchBackend(ABC):
+    @abstractmethod
+    def search(
+        self, query: str | None, limit: int, chapter: str | None = None
+    ) -> list[ICD11Object]:
+        """
+        Returns diagnoses with a disease code whose labels match the query
+        """
+
+
+class RedisICD11SearchBackend(ICD11SearchBackend):
+    def search(self, query, limit, chapter=None):
+        expressions = [ICD11.has_code == 1]
+        if chapter:
+            expressions.append(ICD11.chapter == chapter)
+        if query:
+            expressions.append(ICD11.vec % query_builder(query))
+
+        result = FindQuery(expressions=expressions, model=ICD11, limit=limit).execute(
+            exhaust_results=False
+        )
+        return [diagnosis.get_representation() for diagnosis in result]
+
+
+def build_icd11_search_index(force=False) -> Path:
+    """
+    Builds the prefix index over the ICD11 diagnoses in
+    `ICD11_SEARCH_INDEX_DIR`, unless an index of the current diagnoses is
+    already there, and removes the indexes of previous diagnoses.
+
+    Run at startup and by `load_redis_index`, so that searches never build or
+    check the index themselves.
+    """
+    checksum = queryset_checksum(ICD11Diagnosis.objects.all(), ICD11_INDEX_FIELDS)
+    directory = Path(settings.ICD11_SEARCH_INDEX_DIR)
+    path = directory / f"icd11-{checksum}.idx"
+    if force or not path.exists():
+        logger.info("Building ICD11 search index at %s", path)
+        directory.mkdir(parents=True, exist_ok=True)
+        build_prefix_index(
+            path,
+            (
+                PrefixIndexEntry(
+                    id=diagnosis_id,
+                    label=label,
+                    flag=1 if re.match(DISEASE_CODE_PATTERN, label) else 0,
+                    group=chapter or "",
+                )
+                for diagnosis_id, label, chapter in ICD11Diagnosis.objects.values_list(
+                    *ICD11_INDEX_FIELDS
+                ).iterator(chunk_size=STATIC_DATA_BATCH_SIZE)
+            ),
+        )
+    remove_stale_index_files(directory, "icd11-*.idx", keep=path)
+    return path
+
+
+def get_latest_icd11_search_index_path() -> Path | None:
+    paths = []
+    for path in Path(settings.ICD11_SEARCH_INDEX_DIR).glob("icd11-*.idx"):
+        # indexes may be removed by a build in the meantime
+        with suppress(OSError):
+            paths.append((path.stat().st_mtime, path))
+    return max(paths)[1] if paths else None
+
+
+class InMemoryICD11SearchBackend(ICD11SearchBackend):
+    """
+    Searches a prefix index over the ICD11 diagnoses that is built once per
+    host by `build_icd11_search_index` and memory-mapped by every worker,
+    avoiding a Redis round-trip per keystroke of the diagnosis autocomplete.
+
+    Workers look for a newer index every `ICD11_SEARCH_INDEX_REFRESH_INTERVAL`
+    seconds, and search Redis until an index has been built.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: PrefixIndex | None = None
+        self._path: Path | None = None
+        self._checked_at = 0.0
+        self._fallback = RedisICD11SearchBackend()
+
+    def get_index(self) -> PrefixIndex | None:
+        if (
+            time.monotonic() - self._checked_at
+            < settings.ICD11_SEARCH_INDEX_REFRESH_INTERVAL
+        ):
+            return self._index
+
+        with self._lock:
+            if (
+                time.monotonic() - self._checked_at
+                < settings.ICD11_SEARCH_INDEX_REFRESH_INTERVAL
+            ):
+                return self._index
+            self._checked_at = time.monotonic()
+            path = get_latest_icd11_search_index_path()
+            if path is None:
+                logger.warning("ICD11 search index is not built, searching Redis")
+            elif path != self._path:
+                try:
+                    # the previous index is left to be garbage collected as
+                    # searches in other threads may still be reading from it
+                    self._index = PrefixIndex(path)
+                    self._path = path
+                except OSError:
+                    logger.exception("Failed to open ICD11 search index %s", path)
+            return self._index
+
+    def search(self, query, limit, chapter=None):
+        index = self.get_index()
+        if index is None:
+            return self._fallback.search(query, limit, chapter)
+        return [
+            {"id": entry.id, "label": entry.label, "chapter": entry.group}
+            for entry in index.search(query, limit, flag=1, group=chapter or None)
+        ]
+
+
+ICD11_SEARCH_BACKENDS = {
+    "redis": RedisICD11SearchBackend,
+    "memory": InMemoryICD11SearchBackend,
+}
+
+
+@lru_cache
+def get_icd11_search_backend(name: str) -> ICD11SearchBackend:
+    return ICD11_SEARCH_BACKENDS[name]()
@@ -1,12 +1,16 @@
 import logging
 from typing import TypedDict
 
-from django.core.paginator import Paginator
 from django.db.models import CharField, TextField, Value
 from django.db.models.functions import Coalesce
-from redis_om import Field, Migrator
+from redis_om import Field
 
 from care.facility.models.prescription import MedibaseMedicine as MedibaseMedicineModel
+from care.utils.static_data.loader import (
+    STATIC_DATA_BATCH_SIZE,
+    load_static_data_index,
+    queryset_checksum,
+)
 from care.utils.static_data.models.base import BaseRedisModel
 
 logger = logging.getLogger(__name__)
@@ -48,7 +52,7 @@ class MedibaseMedicine(BaseRedisModel):
         }
 
 
-def load_medibase_medicines():
+def load_medibase_medicines(force=False):
     logger.info("Loading Medibase Medicines into the redis cache...")
 
     medibase_objects = (
@@ -75,9 +79,9 @@ def load_medibase_medicines():
             "atc_classification_pretty",
         )
     )
-    paginator = Paginator(medibase_objects, 5000)
-    for page_number in paginator.page_range:
-        for medicine in paginator.page(page_number).object_list:
+    loaded = load_static_data_index(
+        MedibaseMedicine,
+        (
             MedibaseMedicine(
                 id=str(medicine[0]),
                 name=medicine[1],
@@ -88,6 +92,23 @@ def load_medibase_medicines():
                 cims_class=medicine[6],
                 atc_classification=medicine[7],
                 vec=f"{medicine[1]} {medicine[3]} {medicine[4]}",
-            ).save()
-    Migrator().run()
-    logger.info("Medibase Medicines Loaded")
+            )
+            for medicine in medibase_objects.iterator(chunk_size=STATIC_DATA_BATCH_SIZE)
+        ),
+        checksum=queryset_checksum(
+            MedibaseMedicineModel.objects.all(),
+            [
+                "external_id",
+                "name",
+                "type",
+                "generic",
+                "company",
+                "contents",
+                "cims_class",
+                "atc_classification",
+            ],
+        ),
+        force=force,
+    )
+    if loaded:
+        logger.info("Medibase Medicines Loaded")
@@ -5,6 +5,7 @@ from django.conf import settings
 from care.facility.tasks.asset_monitor import check_asset_status
 from care.facility.tasks.cleanup import delete_old_notifications
 from care.facility.tasks.location_monitor import check_location_status
+from care.facility.tasks.patient_age import refresh_patient_age
 from care.facility.tasks.plausible_stats import capture_goals
 from care.facility.tasks.redis_index import load_redis_index
 from care.facility.tasks.summarisation import (
@@ -23,6 +24,11 @@ def setup_periodic_tasks(sender, **kwargs):
         delete_old_notifications.s(),
         name="delete_old_notifications",
     )
+    sender.add_periodic_task(
+        crontab(hour="0", minute="5"),
+        refresh_patient_age.s(),
+        name="refresh_patient_age",
+    )
     if settings.TASK_SUMMARIZE_TRIAGE:
         sender.add_periodic_task(
             crontab(hour="*/4", minute="59"),
@@ -1,6 +1,7 @@
 import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from celery import shared_task
 from django.contrib.contenttypes.models import ContentType
@@ -8,16 +9,119 @@ from django.db.models import Q
 from django.utils import timezone
 
 from care.facility.models.asset import Asset, AvailabilityRecord, AvailabilityStatus
+from care.facility.utils.availability import (
+    create_availability_records,
+    get_latest_availability_records,
+)
 from care.utils.assetintegration.asset_classes import AssetClasses
+from care.utils.assetintegration.base import BaseAssetIntegration
+from care.utils.assetintegration.client import log_middleware_stats
+from care.utils.assetintegration.poller import poll_middlewares
 
 if TYPE_CHECKING:
-    from care.utils.assetintegration.base import BaseAssetIntegration
+    from care.utils.assetintegration.onvif import OnvifAsset
 
 logger = logging.getLogger(__name__)
 
 
+class Middleware(NamedTuple):
+    hostname: str
+    insecure_connection: bool
+
+
+class MiddlewareStatus(NamedTuple):
+    devices: Any
+    cameras: Any
+
+
+def resolve_middleware(asset: Asset) -> str | None:
+    return (
+        asset.meta.get("middleware_hostname")  # From asset configuration
+        or asset.current_location.middleware_address  # From location configuration
+        or asset.current_location.facility.middleware_address  # From facility configuration
+    )
+
+
+def fetch_middleware_status(
+    middleware: Middleware, cameras: list[dict], fetch_devices: bool
+) -> MiddlewareStatus:
+    """
+    Fetches the status of all devices and cameras behind a middleware, with at
+    most one request each.
+    """
+    client = BaseAssetIntegration(
+        {
+            "middleware_hostname": middleware.hostname,
+            "local_ip_address": "",
+            "insecure_connection": middleware.insecure_connection,
+        }
+    )
+
+    devices = None
+    if fetch_devices:
+        try:
+            devices = client.api_get(client.get_url("devices/status"))
+        except Exception as e:
+            logger.warning("Middleware %s is down: %s", middleware.hostname, e)
+
+    result = None
+    if cameras:
+        try:
+            # TODO: Remove this block after all assets are migrated to the new middleware
+            result = client.api_post(client.get_url("cameras/status"), data=cameras)
+        except Exception:
+            try:
+                result = client.api_get(client.get_url("cameras/status"))
+            except Exception as e:
+                logger.warning("Middleware %s is down: %s", middleware.hostname, e)
+
+    return MiddlewareStatus(devices=devices, cameras=result)
+
+
+def get_new_records(
+    asset: Asset,
+    result: list[dict],
+    last_records: dict,
+    asset_content_type: ContentType,
+) -> list[AvailabilityRecord]:
+    """
+    Returns the records of the status changes of the asset in the status
+    records returned by its middleware, and keeps `last_records` up to date.
+    """
+    new_records = []
+    # Setting new status as down by default
+    new_status = AvailabilityStatus.DOWN
+    for status_record in result:
+        if asset.meta.get("local_ip_address") in status_record.get("status", {}):
+            asset_status = status_record["status"][asset.meta.get("local_ip_address")]
+        else:
+            asset_status = "down"
+
+        last_record = last_records.get(asset.external_id)
+
+        # Setting new status based on the status returned by the device
+        if asset_status == "up":
+            new_status = AvailabilityStatus.OPERATIONAL
+        elif asset_status == "maintenance":
+            new_status = AvailabilityStatus.UNDER_MAINTENANCE
+
+        # Creating a new record if the status has changed
+        timestamp = datetime.fromisoformat(status_record.get("time"))
+        if not last_record or (
+            timestamp > last_record.timestamp and last_record.status != new_status.value
+        ):
+            last_records[asset.external_id] = AvailabilityRecord(
+                content_type=asset_content_type,
+                object_external_id=asset.external_id,
+                status=new_status.value,
+                timestamp=timestamp,
+            )
+            new_records.append(last_records[asset.external_id])
+    return new_records
+
+
 @shared_task
-def check_asset_status():  # noqa: PLR0912
+def check_asset_status():
     logger.info("Checking Asset Status: %s", timezone.now())
 
     assets = (
@@ -36,108 +140,90 @@ def check_asset_status():  # noqa: PLR0912
     )
     asset_content_type = ContentType.objects.get_for_model(Asset)
 
+    # assets are grouped by their middleware so that each middleware is
+    # queried once for all of its devices
+    middleware_assets: defaultdict[Middleware, list[Asset]] = defaultdict(list)
+    middleware_cameras: defaultdict[Middleware, list[dict]] = defaultdict(list)
+    asset_middlewares: dict[Asset, Middleware | None] = {}
+
     for asset in assets:
         # Skipping if local IP address is not present
         if not asset.meta.get("local_ip_address", None):
             continue
+
+        resolved_middleware = resolve_middleware(asset)
+        if not resolved_middleware:
+            logger.warning(
+                "Asset %s does not have a middleware hostname", asset.external_id
+            )
+            continue
+
+        middleware = Middleware(
+            resolved_middleware, bool(asset.meta.get("insecure_connection", False))
+        )
         try:
-            # Fetching middleware hostname
-            resolved_middleware = (
-                asset.meta.get(
-                    "middleware_hostname",
-                )  # From asset configuration
-                or asset.current_location.middleware_address  # From location configuration
-                or asset.current_location.facility.middleware_address  # From facility configuration
+            # Creating an instance of the asset class to validate its configuration
+            asset_class: BaseAssetIntegration = AssetClasses[asset.asset_class].value(
+                {
+                    **asset.meta,
+                    "id": asset.external_id,
+                    "middleware_hostname": resolved_middleware,
+                }
             )
+        except Exception as e:
+            logger.warning("Asset %s is misconfigured: %s", asset.external_id, e)
+            asset_middlewares[asset] = None
+            continue
 
-            if not resolved_middleware:
-                logger.warning(
-                    "Asset %s does not have a middleware hostname", asset.external_id
-                )
-                continue
+        asset_middlewares[asset] = middleware
+        middleware_assets[middleware].append(asset)
+        if asset.asset_class == "ONVIF":
+            camera: OnvifAsset = asset_class
+            middleware_cameras[middleware].append(
+                {
+                    "hostname": camera.host,
+                    "port": 80,
+                    "username": camera.username,
+                    "password": camera.password,
+                }
+            )
 
-            result: Any = None
+    statuses = poll_middlewares(
+        lambda middleware: fetch_middleware_status(
+            middleware,
+            middleware_cameras.get(middleware, []),
+            fetch_devices=any(
+                asset.asset_class != "ONVIF" for asset in middleware_assets[middleware]
+            ),
+        ),
+        middleware_assets,
+    )
 
-            try:
-                # Creating an instance of the asset class
-                asset_class: BaseAssetIntegration = AssetClasses[
-                    asset.asset_class
-                ].value(
-                    {
-                        **asset.meta,
-                        "id": asset.external_id,
-                        "middleware_hostname": resolved_middleware,
-                    }
+    last_records = get_latest_availability_records(
+        asset_content_type, (asset.external_id for asset in asset_middlewares)
+    )
+    new_records = []
+
+    for asset, middleware in asset_middlewares.items():
+        try:
+            status = middleware and statuses.get(middleware)
+            result = None
+            if status:
+                result = (
+                    status.cameras if asset.asset_class == "ONVIF" else status.devices
                 )
-                # Fetching the status of the device
-                if asset.asset_class == "ONVIF":
-                    try:
-                        # TODO: Remove this block after all assets are migrated to the new middleware
-                        asset_config = asset.meta["camera_access_key"].split(":")
-                        assets_config = [
-                            {
-                                "hostname": asset.meta.get("local_ip_address"),
-                                "port": 80,
-                                "username": asset_config[0],
-                                "password": asset_config[1],
-                            }
-                        ]
-
-                        result = asset_class.api_post(
-                            asset_class.get_url("cameras/status"), data=assets_config
-                        )
-                    except Exception:
-                        result = asset_class.api_get(
-                            asset_class.get_url("cameras/status")
-                        )
-                else:
-                    result = asset_class.api_get(asset_class.get_url("devices/status"))
-            except Exception as e:
-                logger.warning("Middleware %s is down: %s", resolved_middleware, e)
 
             # If no status is returned, setting default status as down
             if not result or "error" in result:
                 result = [{"time": timezone.now().isoformat(), "status": []}]
 
-            # Setting new status as down by default
-            new_status = AvailabilityStatus.DOWN
-            for status_record in result:
-                if asset.meta.get("local_ip_address") in status_record.get(
-                    "status", {}
-                ):
-                    asset_status = status_record["status"][
-                        asset.meta.get("local_ip_address")
-                    ]
-                else:
-                    asset_status = "down"
-
-                # Fetching the last record of the asset
-                last_record = (
-                    AvailabilityRecord.objects.filter(
-                        content_type=asset_content_type,
-                        object_external_id=asset.external_id,
-                    )
-                    .order_by("-timestamp")
-                    .first()
-                )
-
-                # Setting new status based on the status returned by the device
-                if asset_status == "up":
-                    new_status = AvailabilityStatus.OPERATIONAL
-                elif asset_status == "maintenance":
-                    new_status = AvailabilityStatus.UNDER_MAINTENANCE
-
-                # Creating a new record if the status has changed
-                if not last_record or (
-                    datetime.fromisoformat(status_record.get("time"))
-                    > last_record.timestamp
-                    and last_record.status != new_status.value
-                ):
-                    AvailabilityRecord.objects.create(
-                        content_type=asset_content_type,
-                        object_external_id=asset.external_id,
-                        status=new_status.value,
-                        timestamp=status_record.get("time", timezone.now()),
-                    )
+            new_records.extend(
+                get_new_records(asset, result, last_records, asset_content_type)
+            )
         except Exception as e:
             logger.error("Error in Asset Status Check: %s", e)
+
+    create_availability_records(new_records)
+    # logged on each poll so that operators can follow the middleware request
+    # stats of the workers in their logs
+    log_middleware_stats()
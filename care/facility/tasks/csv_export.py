@@ -0,0 +1,57 @@
+from io import TextIOWrapper
+from logging import Logger
+from tempfile import SpooledTemporaryFile
+
+from botocore.exceptions import ClientError
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.http import HttpRequest, QueryDict
+from rest_framework.request import Request
+
+from care.facility.models.file_upload import FileUpload
+from care.utils.exceptions import CeleryTaskError
+
+logger: Logger = get_task_logger(__name__)
+
+
+@shared_task(autoretry_for=(ClientError,), retry_kwargs={"max_retries": 3})
+def export_patients_csv_task(file_id: int, query_params: dict[str, list[str]]):
+    """
+    Exports the patients matching the filters of a list request to the file
+    bucket, with the permissions of the user who requested the export.
+    """
+    from care.facility.api.viewsets.patient import PatientViewSet
+
+    try:
+        export_file = FileUpload.objects.select_related("uploaded_by").get(
+            id=file_id, file_type=FileUpload.FileType.CSV_EXPORT
+        )
+    except FileUpload.DoesNotExist as e:
+        msg = f"Export {file_id} does not exist"
+        raise CeleryTaskError(msg) from e
+
+    logger.info("Exporting patients to %s", export_file.external_id)
+    http_request = HttpRequest()
+    http_request.method = "GET"
+    http_request.GET = QueryDict(mutable=True)
+    for key, values in query_params.items():
+        http_request.GET.setlist(key, values)
+    request = Request(http_request)
+    request.user = export_file.uploaded_by
+    view = PatientViewSet(
+        request=request, action="list", args=(), kwargs={}, format_kwarg=None
+    )
+
+    # the export is kept in memory until it outgrows the spool size
+    with SpooledTemporaryFile(max_size=settings.CSV_EXPORT_SPOOL_SIZE) as file:
+        text_file = TextIOWrapper(file, encoding="utf-8", newline="")
+        view.get_csv_export().write(text_file)
+        text_file.flush()
+        file.seek(0)
+        export_file.put_object(file, ContentType="text/csv")
+        text_file.detach()
+
+    export_file.upload_completed = True
+    export_file.save(update_fields=["upload_completed", "modified_date"])
+    return export_file.read_signed_url()
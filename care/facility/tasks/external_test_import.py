@@ -0,0 +1,43 @@
+from contextlib import closing
+from logging import Logger
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from rest_framework.exceptions import ValidationError
+
+from care.facility.models.file_upload import FileUpload
+from care.facility.utils.external_test_import import (
+    import_external_tests,
+    read_uploaded_tests,
+)
+from care.utils.exceptions import CeleryTaskError
+
+logger: Logger = get_task_logger(__name__)
+
+
+@shared_task
+def import_external_tests_task(file_id: int):
+    """
+    Imports the external tests of a file uploaded to the file bucket by
+    `bulk_upsert`, for uploads too large to be imported within a request.
+    The file is streamed from the bucket and imported in batches.
+    """
+    try:
+        import_file = FileUpload.objects.select_related("uploaded_by__district").get(
+            id=file_id, file_type=FileUpload.FileType.EXTERNAL_TEST_IMPORT
+        )
+    except FileUpload.DoesNotExist as e:
+        msg = f"External test import {file_id} does not exist"
+        raise CeleryTaskError(msg) from e
+
+    user = import_file.uploaded_by
+    logger.info("Importing external tests of %s", import_file.external_id)
+    try:
+        with closing(import_file.get_object()["Body"]) as body:
+            errors = import_external_tests(
+                read_uploaded_tests(body, import_file.internal_name),
+                str(user.district),
+            )
+    except ValidationError as e:
+        errors = [e.detail]
+    return {"user_id": user.id, "errors": errors}
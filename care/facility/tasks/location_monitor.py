@@ -1,5 +1,4 @@
 import logging
-from typing import Any
 
 from celery import shared_task
 from django.contrib.contenttypes.models import ContentType
@@ -10,73 +9,76 @@ from care.facility.models.asset import (
     AvailabilityRecord,
     AvailabilityStatus,
 )
+from care.facility.utils.availability import (
+    create_availability_records,
+    get_latest_availability_records,
+)
 from care.utils.assetintegration.base import BaseAssetIntegration
+from care.utils.assetintegration.poller import poll_middlewares
 
 logger = logging.getLogger(__name__)
 
 
+def fetch_middleware_status(middleware: str):
+    # To check for uptime of just the middleware, we do not require a specific asset class
+    location_class = BaseAssetIntegration(
+        {"middleware_hostname": middleware, "local_ip_address": ""}
+    )
+    # Fetching this endpoint to check if the middleware is up
+    return location_class.api_get(location_class.get_url("devices/status"))
+
+
 @shared_task
 def check_location_status():
     location_content_type = ContentType.objects.get_for_model(AssetLocation)
     logger.info("Checking Location Status: %s", timezone.now())
-    locations = AssetLocation.objects.all()
+    locations = AssetLocation.objects.select_related("facility").only(
+        "external_id", "middleware_address", "facility__middleware_address"
+    )
 
+    location_middlewares = {}
     for location in locations:
-        try:
-            # Resolving the middleware hostname from location or facility configuration [ in that order ]
-            resolved_middleware = (
-                location.middleware_address or location.facility.middleware_address
-            )
-
-            if not resolved_middleware:
-                logger.warning(
-                    "No middleware hostname resolved for location %s",
-                    location.external_id,
-                )
-                continue
-
-            result: Any = None
-
-            # Setting new status as down by default
-            new_status = AvailabilityStatus.DOWN
+        # Resolving the middleware hostname from location or facility configuration [ in that order ]
+        resolved_middleware = (
+            location.middleware_address or location.facility.middleware_address
+        )
 
-            try:
-                # To check for uptime of just the middleware, we do not require a specific asset class
-                location_class = BaseAssetIntegration(
-                    {"middleware_hostname": resolved_middleware, "local_ip_address": ""}
-                )
-                # Fetching this endpoint to check if the middleware is up
-                result = location_class.api_get(
-                    location_class.get_url("devices/status")
-                )
-
-                # Setting new status as operational if the middleware is up
-                if result:
-                    new_status = AvailabilityStatus.OPERATIONAL
+        if not resolved_middleware:
+            logger.warning(
+                "No middleware hostname resolved for location %s",
+                location.external_id,
+            )
+            continue
+        location_middlewares[location.external_id] = resolved_middleware
 
-            except Exception as e:
-                logger.warning("Middleware %s is down: %s", resolved_middleware, e)
+    # each middleware is queried once, however many locations it serves
+    results = poll_middlewares(
+        fetch_middleware_status, set(location_middlewares.values())
+    )
+    last_records = get_latest_availability_records(
+        location_content_type, location_middlewares
+    )
 
-            # Fetching the last record of the location
-            last_record = (
-                AvailabilityRecord.objects.filter(
-                    content_type=location_content_type,
-                    object_external_id=location.external_id,
-                )
-                .order_by("-timestamp")
-                .first()
-            )
+    new_records = []
+    for external_id, middleware in location_middlewares.items():
+        # Setting new status as operational if the middleware is up
+        new_status = (
+            AvailabilityStatus.OPERATIONAL
+            if results.get(middleware)
+            else AvailabilityStatus.DOWN
+        )
 
-            # Creating a new record if the status has changed
-            if not last_record or last_record.status != new_status.value:
-                AvailabilityRecord.objects.create(
+        # Creating a new record if the status has changed
+        last_record = last_records.get(external_id)
+        if not last_record or last_record.status != new_status.value:
+            new_records.append(
+                AvailabilityRecord(
                     content_type=location_content_type,
-                    object_external_id=location.external_id,
+                    object_external_id=external_id,
                     status=new_status.value,
                     timestamp=timezone.now(),
                 )
-            logger.info(
-                "Location %s status: %s", location.external_id, new_status.value
             )
-        except Exception as e:
-            logger.error("Error in Location Status Check: %s", e)
+        logger.info("Location %s status: %s", external_id, new_status.value)
+
+    create_availability_records(new_records)
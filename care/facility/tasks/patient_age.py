@@ -0,0 +1,26 @@
+import logging
+
+from celery import shared_task
+from django.db.models import F, Q
+
+from care.facility.models.patient import PatientAgeFunc, PatientRegistration
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_patient_age() -> int:
+    """
+    Updates the stored age of the patients whose age has changed since it was
+    last calculated, which is mostly those who had a birthday.
+    """
+    updated = (
+        PatientRegistration.objects.filter(
+            Q(date_of_birth__isnull=False) | Q(year_of_birth__isnull=False)
+        )
+        .alias(current_age=PatientAgeFunc())
+        .exclude(age=F("current_age"))
+        .update(age=PatientAgeFunc())
+    )
+    logger.info("Refreshed the age of %s patients", updated)
+    return updated
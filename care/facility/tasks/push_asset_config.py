@@ -4,18 +4,18 @@ This module provides helper functions to push changes in asset configuration to
 
 from logging import Logger
 
-import requests
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
-from care.utils.jwks.token_generator import generate_jwt
+from care.utils.assetintegration.client import middleware_request
+from care.utils.jwks.token_generator import get_cached_jwt
 
 logger: Logger = get_task_logger(__name__)
 
 
 def _get_headers() -> dict:
     return {
-        "Authorization": "Care_Bearer " + generate_jwt(),
+        "Authorization": "Care_Bearer " + get_cached_jwt(),
         "Content-Type": "application/json",
     }
 
@@ -24,7 +24,8 @@ def create_asset_on_middleware(hostname: str, data: dict) -> dict:
     if not data.get("ip_address"):
         logger.error("IP Address is required")
     try:
-        response = requests.post(
+        response = middleware_request(
+            "POST",
             f"https://{hostname}/api/assets",
             json=data,
             headers=_get_headers(),
@@ -41,7 +42,8 @@ def create_asset_on_middleware(hostname: str, data: dict) -> dict:
 
 def delete_asset_from_middleware(hostname: str, asset_id: str) -> dict:
     try:
-        response = requests.delete(
+        response = middleware_request(
+            "DELETE",
             f"https://{hostname}/api/assets/{asset_id}",
             headers=_get_headers(),
             timeout=25,
@@ -60,7 +62,8 @@ def update_asset_on_middleware(hostname: str, asset_id: str, data: dict) -> dict
         logger.error("IP Address is required")
         return {"error": "IP Address is required"}
     try:
-        response = requests.put(
+        response = middleware_request(
+            "PUT",
             f"https://{hostname}/api/assets/{asset_id}",
             json=data,
             headers=_get_headers(),
@@ -3,37 +3,32 @@ from logging import Logger
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.core.cache import cache
 
 from care.facility.static_data.icd11 import load_icd11_diagnosis
+from care.facility.static_data.icd11_search import build_icd11_search_index
 from care.facility.static_data.medibase import load_medibase_medicines
-from care.utils.static_data.models.base import index_exists
 from plug_config import manager
 
 logger: Logger = get_task_logger(__name__)
 
 
 @shared_task
-def load_redis_index():
-    try:
-        deleted_count = cache.delete_pattern("care_static_data*", itersize=25_000)
-        logger.info("Deleted %s keys with prefix 'care_static_data'", deleted_count)
-    except Exception as e:
-        logger.error("Failed to delete keys with prefix 'care_static_data': %s", e)
-        return
-
+def load_redis_index(force=False):
     if cache.get("redis_index_loading"):
         logger.info("Redis Index already loading, skipping")
         return
 
-    cache.set("redis_index_loading", value=True, timeout=60 * 2)
+    cache.set("redis_index_loading", value=True, timeout=60 * 5)
     logger.info("Loading Redis Index")
-    if index_exists():
-        logger.info("Index already exists, skipping")
-        return
 
-    load_icd11_diagnosis()
-    load_medibase_medicines()
+    # each loader builds a new generation of its index next to the live one
+    # and skips the rebuild when its source data is unchanged
+    load_icd11_diagnosis(force=force)
+    load_medibase_medicines(force=force)
+    if settings.ICD11_SEARCH_BACKEND == "memory":
+        build_icd11_search_index(force=force)
 
     for plug in manager.plugs:
         try:
@@ -1,5 +1,5 @@
 from celery import shared_task
-from celery.utils.log import get_task_logger
+from django.utils.timezone import localtime, now
 
 from care.facility.utils.summarization.district.patient_summary import (
     district_patient_summary,
@@ -8,37 +8,77 @@ from care.facility.utils.summarization.facility_capacity import (
     facility_capacity_summary,
 )
 from care.facility.utils.summarization.patient_summary import patient_summary
+from care.facility.utils.summarization.runner import run_summarization
+from care.facility.utils.summarization.stale import (
+    summarize_stale_districts,
+    summarize_stale_facilities,
+)
 from care.facility.utils.summarization.tests_summary import tests_summary
 from care.facility.utils.summarization.triage_summary import triage_summary
 
-logger = get_task_logger(__name__)
-
 
 @shared_task
 def summarize_triage():
-    triage_summary()
-    logger.info("Summarized Triages")
+    run_summarization("Triages", triage_summary)
 
 
 @shared_task
-def summarize_tests():
-    tests_summary()
-    logger.info("Summarized Tests")
+def summarize_tests(full=False):
+    if full:
+        run_summarization("Tests", tests_summary)
+        return
+    run_summarization(
+        "Tests",
+        lambda: summarize_stale_facilities(
+            "TestSummary",
+            now().replace(hour=0, minute=0, second=0, microsecond=0),
+            tests_summary,
+        ),
+    )
 
 
 @shared_task
-def summarize_facility_capacity():
-    facility_capacity_summary()
-    logger.info("Summarized Facility Capacities")
+def summarize_facility_capacity(full=False):
+    # only the facilities that changed are summarized again, along with the
+    # ones without a summary for the day, which makes the first run of each
+    # day a full pass
+    if full:
+        run_summarization("Facility Capacities", facility_capacity_summary)
+        return
+    run_summarization(
+        "Facility Capacities",
+        lambda: summarize_stale_facilities(
+            "FacilityCapacity",
+            localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0),
+            facility_capacity_summary,
+        ),
+    )
 
 
 @shared_task
-def summarize_patient():
-    patient_summary()
-    logger.info("Summarized Patients")
+def summarize_patient(full=False):
+    if full:
+        run_summarization("Patients", patient_summary)
+        return
+    run_summarization(
+        "Patients",
+        lambda: summarize_stale_facilities(
+            "PatientSummary",
+            now().replace(hour=0, minute=0, second=0, microsecond=0),
+            patient_summary,
+        ),
+    )
 
 
 @shared_task
-def summarize_district_patient():
-    district_patient_summary()
-    logger.info("Summarized District Patients")
+def summarize_district_patient(full=False):
+    if full:
+        run_summarization("District Patients", district_patient_summary)
+        return
+    run_summarization(
+        "District Patients",
+        lambda: summarize_stale_districts(
+            now().replace(hour=0, minute=0, second=0, microsecond=0),
+            district_patient_summary,
+        ),
+    )
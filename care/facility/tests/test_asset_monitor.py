@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from care.facility.models.asset import (
+    AssetLocation,
+    AvailabilityRecord,
+    AvailabilityStatus,
+)
+from care.facility.tasks.asset_monitor import check_asset_status
+from care.facility.tasks.location_monitor import check_location_status
+from care.utils.tests.test_utils import TestUtils
+
+
+class AssetMonitorTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(
+            cls.super_user,
+            cls.district,
+            cls.local_body,
+            middleware_address="middleware.local",
+        )
+        cls.location = cls.create_asset_location(cls.facility)
+        cls.other_location = cls.create_asset_location(
+            cls.facility, middleware_address="other-middleware.local"
+        )
+        cls.monitors = [
+            cls.create_asset(
+                cls.location,
+                asset_class="HL7MONITOR",
+                meta={"local_ip_address": f"192.168.1.{i}"},
+            )
+            for i in range(1, 4)
+        ]
+
+    def devices_status(self, url, data=None):
+        if "other-middleware" in url:
+            msg = "Middleware is unreachable"
+            raise ConnectionError(msg)
+        return [
+            {
+                "time": timezone.now().isoformat(),
+                "status": {"192.168.1.1": "up", "192.168.1.2": "maintenance"},
+            }
+        ]
+
+    def get_status(self, obj):
+        return (
+            AvailabilityRecord.objects.filter(object_external_id=obj.external_id)
+            .order_by("-timestamp")
+            .first()
+            .status
+        )
+
+    def test_assets_are_polled_once_per_middleware(self):
+        with patch(
+            "care.utils.assetintegration.base.BaseAssetIntegration.api_get",
+            side_effect=self.devices_status,
+        ) as api_get:
+            check_asset_status()
+
+        api_get.assert_called_once()
+        self.assertEqual(
+            [self.get_status(asset) for asset in self.monitors],
+            [
+                AvailabilityStatus.OPERATIONAL,
+                AvailabilityStatus.UNDER_MAINTENANCE,
+                AvailabilityStatus.DOWN,
+            ],
+        )
+
+    def test_unchanged_status_is_not_recorded_again(self):
+        with patch(
+            "care.utils.assetintegration.base.BaseAssetIntegration.api_get",
+            side_effect=self.devices_status,
+        ):
+            check_asset_status()
+            check_asset_status()
+
+        self.assertEqual(
+            AvailabilityRecord.objects.filter(
+                object_external_id__in=[asset.external_id for asset in self.monitors]
+            ).count(),
+            3,
+        )
+
+    def test_locations_are_polled_once_per_middleware(self):
+        with patch(
+            "care.utils.assetintegration.base.BaseAssetIntegration.api_get",
+            side_effect=self.devices_status,
+        ) as api_get:
+            check_location_status()
+            check_location_status()
+
+        self.assertEqual(api_get.call_count, 4)
+        self.assertEqual(self.get_status(self.location), AvailabilityStatus.OPERATIONAL)
+        self.assertEqual(self.get_status(self.other_location), AvailabilityStatus.DOWN)
+        self.assertEqual(
+            AvailabilityRecord.objects.filter(
+                object_external_id__in=AssetLocation.objects.values("external_id")
+            ).count(),
+            2,
+        )
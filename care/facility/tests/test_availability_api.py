@@ -1,10 +1,18 @@
+from datetime import timedelta
+
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from care.facility.models import AvailabilityRecord
-from care.facility.models.asset import Asset, AssetLocation, AvailabilityStatus
+from care.facility.models.asset import (
+    Asset,
+    AssetLocation,
+    AvailabilityStatus,
+    LatestAvailabilityRecord,
+)
+from care.facility.utils.availability import create_availability_records
 from care.utils.tests.test_utils import TestUtils
 
 
@@ -71,3 +79,51 @@ class AvailabilityViewSetTestCase(TestUtils, APITestCase):
             "You do not have access to this asset location's availability records",
         )
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_latest_status_follows_records(self):
+        response = self.client.get(f"/api/v1/asset/{self.asset.external_id}/")
+        self.assertEqual(
+            response.data["latest_status"], AvailabilityStatus.OPERATIONAL.value
+        )
+
+        AvailabilityRecord.objects.create(
+            content_type=ContentType.objects.get_for_model(Asset),
+            object_external_id=self.asset.external_id,
+            status=AvailabilityStatus.DOWN.value,
+            timestamp=timezone.now(),
+        )
+        # records older than the latest known one do not replace it
+        AvailabilityRecord.objects.create(
+            content_type=ContentType.objects.get_for_model(Asset),
+            object_external_id=self.asset.external_id,
+            status=AvailabilityStatus.UNDER_MAINTENANCE.value,
+            timestamp=timezone.now() - timedelta(days=1),
+        )
+
+        response = self.client.get(f"/api/v1/asset/{self.asset.external_id}/")
+        self.assertEqual(response.data["latest_status"], AvailabilityStatus.DOWN.value)
+        self.assertEqual(
+            LatestAvailabilityRecord.objects.get(
+                object_external_id=self.asset.external_id
+            ).status,
+            AvailabilityStatus.DOWN.value,
+        )
+
+    def test_skipped_records_are_not_projected(self):
+        latest = LatestAvailabilityRecord.objects.filter(
+            object_external_id=self.asset.external_id
+        )
+        latest.update(timestamp=self.asset_availability.timestamp - timedelta(days=1))
+
+        create_availability_records(
+            [
+                AvailabilityRecord(
+                    content_type=ContentType.objects.get_for_model(Asset),
+                    object_external_id=self.asset.external_id,
+                    status=AvailabilityStatus.DOWN.value,
+                    timestamp=self.asset_availability.timestamp,
+                )
+            ]
+        )
+
+        self.assertEqual(latest.get().status, AvailabilityStatus.OPERATIONAL.value)
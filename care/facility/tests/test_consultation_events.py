@@ -0,0 +1,110 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from care.facility.events.handler import (
+    create_consultation_events,
+    invalidate_event_type_groups,
+)
+from care.facility.models.encounter_symptom import EncounterSymptom, Symptom
+from care.facility.models.events import EventType, PatientConsultationEvent
+from care.utils.tests.test_utils import TestUtils
+
+
+class ConsultationEventsTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.patient = cls.create_patient(cls.district, cls.facility)
+        cls.consultation = cls.create_consultation(cls.patient, cls.facility)
+        cls.symptom_type = EventType.objects.create(
+            name="TEST_SYMPTOM",
+            model="EncounterSymptom",
+            fields=["symptom", "other_symptom"],
+        )
+        cls.onset_type = EventType.objects.create(
+            name="TEST_SYMPTOM_ONSET",
+            model="EncounterSymptom",
+            fields=["onset_date"],
+        )
+        cls.symptoms = [
+            EncounterSymptom.objects.create(
+                consultation=cls.consultation,
+                symptom=symptom,
+                onset_date=timezone.now(),
+                created_by=cls.super_user,
+            )
+            for symptom in (Symptom.FEVER, Symptom.COUGH, Symptom.MYALGIA)
+        ]
+
+    def tearDown(self) -> None:
+        # event type changes rolled back with the test are not signalled
+        invalidate_event_type_groups()
+
+    def create_events(self, objects, **kwargs):
+        create_consultation_events(
+            self.consultation.id, objects, caused_by=self.super_user.id, **kwargs
+        )
+
+    def test_events_of_objects_are_created_with_constant_queries(self):
+        self.create_events(self.symptoms[:1])
+        with CaptureQueriesContext(connection) as one_object:
+            self.create_events(self.symptoms[:1])
+        with CaptureQueriesContext(connection) as many_objects:
+            self.create_events(self.symptoms)
+
+        self.assertEqual(len(many_objects), len(one_object))
+        self.assertEqual(
+            PatientConsultationEvent.objects.filter(
+                object_model="EncounterSymptom"
+            ).count(),
+            10,
+        )
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_event_types_version_is_read_once_per_call(self):
+        self.create_events(self.symptoms[:1])
+        with patch.object(cache, "get", wraps=cache.get) as cache_get:
+            self.create_events(self.symptoms)
+
+        self.assertEqual(cache_get.call_count, 1)
+
+    def test_only_latest_events_of_changed_groups_are_latest(self):
+        taken_at = timezone.now() - timedelta(hours=1)
+        self.create_events(self.symptoms, taken_at=taken_at)
+        self.create_events(self.symptoms[:1], fields_to_store=["onset_date"])
+
+        latest = PatientConsultationEvent.objects.filter(
+            object_model="EncounterSymptom", is_latest=True
+        )
+        self.assertEqual(latest.count(), 6)
+        self.assertEqual(
+            latest.filter(object_id=self.symptoms[0].id, taken_at__gt=taken_at)
+            .values_list("event_type", flat=True)
+            .get(),
+            self.onset_type.id,
+        )
+
+    def test_changed_event_types_are_used(self):
+        self.create_events(self.symptoms[0])
+        self.onset_type.is_active = False
+        self.onset_type.save()
+        self.create_events(self.symptoms[1])
+
+        self.assertFalse(
+            PatientConsultationEvent.objects.filter(
+                object_id=self.symptoms[1].id, event_type=self.onset_type
+            ).exists()
+        )
@@ -0,0 +1,146 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from care.facility.models.file_upload import FileUpload
+from care.facility.models.icd11_diagnosis import (
+    ConditionVerificationStatus,
+    ICD11Diagnosis,
+)
+from care.utils.tests.test_utils import TestUtils
+
+
+@override_settings(CSV_EXPORT_CHUNK_SIZE=2)
+class CSVExportTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.patients = []
+        for i in range(5):
+            patient = cls.create_patient(
+                cls.district, cls.facility, name=f"Patient {i}"
+            )
+            cls.create_consultation(patient, cls.facility)
+            cls.patients.append(patient)
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def get_patient_export(self, days):
+        today = timezone.now().date()
+        return self.client.get(
+            "/api/v1/patient/",
+            {
+                "csv": "",
+                "is_active": "True",
+                "created_date_after": (today - timedelta(days=days)).isoformat(),
+                "created_date_before": today.isoformat(),
+            },
+        )
+
+    def read_csv(self, content: bytes) -> list[str]:
+        return content.decode("utf-8").removeprefix("﻿").splitlines()
+
+    def test_facility_export_is_streamed_in_chunks(self):
+        for i in range(4):
+            self.create_facility(
+                self.super_user, self.district, self.local_body, name=f"Facility {i}"
+            )
+
+        response = self.client.get("/api/v1/facility/", {"csv": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        rows = self.read_csv(b"".join(response.streaming_content))
+        self.assertIn("Facility Name", rows[0])
+        self.assertEqual(len(rows), 6)
+
+    def test_short_patient_export_is_streamed(self):
+        response = self.get_patient_export(days=7)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = self.read_csv(b"".join(response.streaming_content))
+        self.assertEqual(len(rows), 6)
+        for patient in self.patients:
+            self.assertTrue(any(str(patient.external_id) in row for row in rows[1:]))
+
+    def test_patient_export_resolves_diagnoses_once_per_chunk(self):
+        diagnoses = list(ICD11Diagnosis.objects.order_by("id")[:3])
+        for i, patient in enumerate(self.patients):
+            for diagnosis in (diagnoses[i % 3], diagnoses[(i + 1) % 3]):
+                self.create_consultation_diagnosis(
+                    patient.last_consultation,
+                    diagnosis,
+                    ConditionVerificationStatus.CONFIRMED,
+                )
+        lookups = []
+
+        def lookup(diagnoses_ids):
+            diagnoses_ids = set(diagnoses_ids)
+            lookups.append(diagnoses_ids)
+            return {
+                diagnosis.id: {"id": diagnosis.id, "label": diagnosis.label}
+                for diagnosis in diagnoses
+                if diagnosis.id in diagnoses_ids
+            }
+
+        with patch(
+            "care.facility.static_data.icd11._lookup_icd11_diagnoses",
+            side_effect=lookup,
+        ):
+            response = self.get_patient_export(days=7)
+            rows = self.read_csv(b"".join(response.streaming_content))
+
+        # the first chunk has all three diagnoses, so later chunks need none
+        self.assertEqual(lookups, [{diagnosis.id for diagnosis in diagnoses}])
+        self.assertTrue(
+            any(
+                f"{diagnoses[0].label}, {diagnoses[1].label}" in row
+                or f"{diagnoses[1].label}, {diagnoses[0].label}" in row
+                for row in rows[1:]
+            )
+        )
+
+    def test_long_patient_export_is_uploaded_in_background(self):
+        uploads = []
+        with (
+            patch.object(
+                FileUpload,
+                "put_object",
+                side_effect=lambda file, **kwargs: uploads.append(file.read()),
+            ),
+            patch.object(FileUpload, "read_signed_url", return_value="signed-url"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.get_patient_export(days=31)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        export_file = FileUpload.objects.get(external_id=response.data["id"])
+        self.assertTrue(export_file.upload_completed)
+        self.assertEqual(len(self.read_csv(uploads[0])), 6)
+
+        with patch.object(FileUpload, "read_signed_url", autospec=True) as signed_url:
+            signed_url.return_value = "signed-url"
+            response = self.client.get(
+                f"/api/v1/files/{export_file.external_id}/",
+                {
+                    "file_type": "CSV_EXPORT",
+                    "associating_id": response.data["associating_id"],
+                },
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["read_signed_url"], "signed-url")
+
+    def test_export_range_is_limited(self):
+        response = self.get_patient_export(days=100)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
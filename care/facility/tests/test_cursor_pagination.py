@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from care.facility.models.daily_round import DailyRound
+from care.facility.models.patient import PatientNotes
+from care.utils.tests.test_utils import TestUtils
+
+
+class CursorPaginationTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.patient = cls.create_patient(cls.district, cls.facility)
+        cls.consultation = cls.create_consultation(cls.patient, cls.facility)
+
+        now = timezone.now()
+        cls.notes = []
+        for i in range(7):
+            note = PatientNotes.objects.create(
+                patient=cls.patient,
+                consultation=cls.consultation,
+                facility=cls.facility,
+                created_by=cls.user,
+                note=f"Note {i}",
+            )
+            cls.notes.append(note)
+        # a few notes share their creation time, so that the cursor has to
+        # tell them apart
+        for i, note in enumerate(cls.notes):
+            note.created_date = now - timedelta(minutes=i // 2)
+        PatientNotes.objects.bulk_update(cls.notes, ["created_date"])
+
+        # rounds without a taken_at are listed by offset too
+        cls.rounds = [
+            DailyRound.objects.create(
+                consultation=cls.consultation,
+                created_by=cls.user,
+                taken_at=taken_at,
+            )
+            for taken_at in (now, None, now, now - timedelta(hours=1), None)
+        ]
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def get_notes_url(self):
+        return f"/api/v1/patient/{self.patient.external_id}/notes/"
+
+    def test_notes_are_paginated_by_cursor(self):
+        response = self.client.get(self.get_notes_url(), {"cursor": "", "limit": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+
+        notes = []
+        pages = 0
+        while True:
+            pages += 1
+            notes.extend(note["id"] for note in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(pages, 3)
+        expected = sorted(
+            self.notes, key=lambda note: (note.created_date, note.id), reverse=True
+        )
+        self.assertEqual(notes, [str(note.external_id) for note in expected])
+
+    def get_pages(self, url, params, link):
+        response = self.client.get(url, params)
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([item["id"] for item in response.data["results"]])
+            if not response.data[link]:
+                return pages
+            response = self.client.get(response.data[link])
+
+    def test_rounds_without_taken_at_are_paginated_by_cursor(self):
+        url = f"/api/v1/consultation/{self.consultation.external_id}/daily_rounds/"
+        pages = self.get_pages(url, {"cursor": "", "limit": 2}, "next")
+
+        # rounds without a taken_at come first, as in descending order in the
+        # database
+        expected = sorted(
+            self.rounds,
+            key=lambda daily_round: (
+                daily_round.taken_at is None,
+                daily_round.taken_at or timezone.now(),
+                daily_round.id,
+            ),
+            reverse=True,
+        )
+        self.assertEqual(
+            [daily_round for page in pages for daily_round in page],
+            [str(daily_round.external_id) for daily_round in expected],
+        )
+        offset_response = self.client.get(url, {"limit": 10})
+        self.assertEqual(offset_response.data["count"], len(self.rounds))
+
+        # walking back from the last page returns the same pages
+        last_page = self.client.get(url, {"cursor": "", "limit": 2})
+        while last_page.data["next"]:
+            last_page = self.client.get(last_page.data["next"])
+        previous_pages = self.get_pages(last_page.data["previous"], {}, "previous")
+        self.assertEqual(previous_pages, pages[-2::-1])
+
+    def test_notes_are_paginated_by_offset_without_cursor(self):
+        response = self.client.get(self.get_notes_url(), {"limit": 3, "offset": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 7)
+        self.assertEqual(len(response.data["results"]), 3)
@@ -1,7 +1,18 @@
+import csv
+import io
+import json
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from care.facility.models import PatientExternalTest
+from care.facility.models.file_upload import FileUpload
+from care.facility.tasks.external_test_import import import_external_tests_task
 from care.utils.tests.test_utils import TestUtils
 
 
@@ -144,3 +155,155 @@ class PatientExternalTestViewSetTestCase(TestUtils, APITestCase):
             "/api/v1/external_result/bulk_upsert/", sample_data, format="json"
         )
         self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+    def get_upload_data(self, count, **kwargs):
+        samples = []
+        for i in range(count):
+            data = self.get_patient_external_test_data(
+                str(self.district), self.local_body.name.upper(), self.ward.number
+            ).copy()
+            data.update(
+                {"local_body_type": "municipality", "srf_id": f"SRF/{i}", **kwargs}
+            )
+            samples.append(data)
+        return samples
+
+    def test_bulk_upload_queries_do_not_grow_with_tests(self):
+        query_counts = []
+        for count in (1, 10):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    "/api/v1/external_result/bulk_upsert/",
+                    {"sample_tests": self.get_upload_data(count)},
+                    format="json",
+                )
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+        self.assertEqual(
+            PatientExternalTest.objects.filter(srf_id__startswith="SRF/").count(), 11
+        )
+
+    def test_bulk_upload_csv_file(self):
+        facility = self.create_facility(self.user, self.district, self.local_body)
+        self.create_patient(self.district, facility, srf_id="srf/1")
+        samples = self.get_upload_data(2)
+        file = io.StringIO()
+        writer = csv.DictWriter(
+            file,
+            fieldnames=[
+                PatientExternalTest.HEADER_CSV_MAPPING[field]
+                for field in PatientExternalTest.HEADER_CSV_MAPPING
+            ],
+        )
+        writer.writeheader()
+        for sample in samples:
+            writer.writerow(
+                {
+                    header: sample.get(field, "")
+                    for field, header in PatientExternalTest.HEADER_CSV_MAPPING.items()
+                }
+            )
+
+        response = self.client.post(
+            "/api/v1/external_result/bulk_upsert/",
+            {"file": SimpleUploadedFile("tests.csv", file.getvalue().encode())},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(
+            dict(
+                PatientExternalTest.objects.filter(
+                    srf_id__startswith="SRF/"
+                ).values_list("srf_id", "patient_created")
+            ),
+            {"SRF/0": False, "SRF/1": True},
+        )
+
+    def test_bulk_upload_reports_invalid_tests(self):
+        samples = self.get_upload_data(2)
+        samples[1]["ward"] = self.ward.number + 1
+        response = self.client.post(
+            "/api/v1/external_result/bulk_upsert/",
+            {"sample_tests": samples},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [{"ward": ["Ward Does not Exist"]}])
+        self.assertFalse(
+            PatientExternalTest.objects.filter(srf_id__startswith="SRF/").exists()
+        )
+
+    def upload_in_background(self, data, request_format):
+        uploads = {}
+        with (
+            patch.object(
+                FileUpload,
+                "put_object",
+                autospec=True,
+                side_effect=lambda upload, file, **kwargs: uploads.__setitem__(
+                    upload.internal_name, file.read()
+                ),
+            ),
+            patch.object(
+                FileUpload,
+                "get_object",
+                autospec=True,
+                side_effect=lambda upload, **kwargs: {
+                    "Body": io.BytesIO(uploads[upload.internal_name])
+                },
+            ),
+            patch(
+                "care.facility.api.viewsets.patient_external_test."
+                "import_external_tests_task.apply_async",
+                wraps=import_external_tests_task.apply_async,
+            ) as apply_async,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(
+                "/api/v1/external_result/bulk_upsert/", data, format=request_format
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertIn("task_id", response.data)
+        # the job is given the uploaded file instead of the tests
+        import_file = FileUpload.objects.get(
+            file_type=FileUpload.FileType.EXTERNAL_TEST_IMPORT
+        )
+        self.assertEqual(apply_async.call_args.args[0], (import_file.id,))
+        return response
+
+    @override_settings(EXTERNAL_TEST_IMPORT_SYNC_LIMIT=1)
+    def test_large_ndjson_upload_is_imported_in_background(self):
+        samples = self.get_upload_data(3)
+        file = SimpleUploadedFile(
+            "tests.ndjson",
+            "\n".join(json.dumps(sample) for sample in samples).encode(),
+        )
+        self.upload_in_background({"file": file}, "multipart")
+        self.assertEqual(
+            PatientExternalTest.objects.filter(srf_id__startswith="SRF/").count(), 3
+        )
+
+    @override_settings(
+        EXTERNAL_TEST_IMPORT_SYNC_LIMIT=1, EXTERNAL_TEST_IMPORT_BATCH_SIZE=2
+    )
+    def test_large_test_list_is_imported_in_background_in_batches(self):
+        samples = self.get_upload_data(3)
+        self.upload_in_background({"sample_tests": samples}, "json")
+        self.assertEqual(
+            PatientExternalTest.objects.filter(srf_id__startswith="SRF/").count(), 3
+        )
+
+    @override_settings(EXTERNAL_TEST_IMPORT_BATCH_SIZE=2)
+    def test_invalid_test_in_later_batch_rolls_back_earlier_batches(self):
+        samples = self.get_upload_data(3)
+        samples[2]["ward"] = self.ward.number + 1
+        response = self.client.post(
+            "/api/v1/external_result/bulk_upsert/",
+            {"sample_tests": samples},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            PatientExternalTest.objects.filter(srf_id__startswith="SRF/").exists()
+        )
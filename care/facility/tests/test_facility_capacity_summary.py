@@ -0,0 +1,120 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from care.facility.models import FacilityCapacity, FacilityRelatedSummary, RoomType
+from care.facility.models.inventory import (
+    FacilityInventoryBurnRate,
+    FacilityInventoryItem,
+    FacilityInventoryLog,
+    FacilityInventorySummary,
+    FacilityInventoryUnit,
+)
+from care.facility.utils.summarization.facility_capacity import (
+    facility_capacity_summary,
+)
+from care.utils.tests.test_utils import TestUtils
+
+
+class FacilityCapacitySummaryTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.unit = FacilityInventoryUnit.objects.create(name="Cylinders")
+        cls.item = FacilityInventoryItem.objects.create(
+            name="Oxygen", default_unit=cls.unit, min_quantity=1
+        )
+        cls.facility = cls.create_populated_facility()
+
+    @classmethod
+    def create_populated_facility(cls):
+        facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.create_patient(cls.district, facility)
+        cls.create_patient(cls.district, facility)
+        cls.create_patient(cls.district, facility, is_active=False)
+        cls.create_bed(facility, cls.create_asset_location(facility))
+        FacilityCapacity.objects.create(
+            facility=facility,
+            room_type=RoomType.ICU_BED,
+            total_capacity=10,
+            current_capacity=4,
+        )
+        FacilityInventorySummary.objects.create(
+            facility=facility, item=cls.item, quantity=12
+        )
+        FacilityInventoryBurnRate.objects.create(
+            facility=facility, item=cls.item, burn_rate=1.5
+        )
+        for is_incoming, quantity, current_stock in (
+            (True, 10, 15),
+            (False, 3, 12),
+        ):
+            FacilityInventoryLog.objects.create(
+                facility=facility,
+                item=cls.item,
+                is_incoming=is_incoming,
+                quantity=quantity,
+                quantity_in_default_unit=quantity,
+                current_stock=current_stock,
+            )
+        return facility
+
+    def get_summary(self, facility):
+        return FacilityRelatedSummary.objects.get(
+            s_type="FacilityCapacity", facility=facility
+        ).data
+
+    def test_summary_data(self):
+        facility_capacity_summary()
+
+        data = self.get_summary(self.facility)
+        self.assertEqual(data["id"], str(self.facility.external_id))
+        self.assertEqual(data["actual_live_patients"], 2)
+        self.assertEqual(data["actual_discharged_patients"], 1)
+        self.assertEqual(data["patient_count"], 2)
+        self.assertEqual(data["bed_count"], 1)
+        self.assertEqual(data["facility_flags"], [])
+        self.assertEqual(len(data["availability"]), 1)
+        self.assertEqual(data["availability"][0]["current_capacity"], 4)
+        self.assertEqual(
+            data["inventory"][str(self.item.id)],
+            {
+                **data["inventory"][str(self.item.id)],
+                "item_name": "Oxygen",
+                "unit": "Cylinders",
+                "stock": 12,
+                "burn_rate": 1.5,
+                "start_stock": 5,
+                "end_stock": 12,
+                "total_consumed": 3,
+                "total_added": 10,
+            },
+        )
+
+    def test_summary_is_updated_in_place(self):
+        facility_capacity_summary()
+        self.create_patient(self.district, self.facility)
+        facility_capacity_summary()
+
+        self.assertEqual(self.get_summary(self.facility)["actual_live_patients"], 3)
+
+    def test_query_count_does_not_scale_with_facilities(self):
+        with CaptureQueriesContext(connection) as single_facility:
+            facility_capacity_summary()
+
+        for _ in range(5):
+            self.create_populated_facility()
+        FacilityRelatedSummary.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as many_facilities:
+            facility_capacity_summary()
+
+        self.assertEqual(
+            FacilityRelatedSummary.objects.filter(s_type="FacilityCapacity").count(),
+            6,
+        )
+        self.assertEqual(len(single_facility), len(many_facilities))
@@ -1,7 +1,13 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from care.facility.models.file_upload import FileUpload
+from care.utils.csp.client import get_client
+from care.utils.csp.config import BucketType
 from care.utils.tests.test_utils import TestUtils
 
 
@@ -91,3 +97,77 @@ class ConsentFileUploadApiTestCase(TestUtils, APITestCase):
         self.assertEqual(all_files.status_code, status.HTTP_200_OK)
         self.assertEqual(all_files.data["count"], 1)
         self.assertEqual(all_files.data["results"][0]["name"], "Test File")
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    FILE_UPLOAD_BUCKET="patient-bucket",
+    FILE_UPLOAD_BUCKET_ENDPOINT="http://localstack:4566",
+    FILE_UPLOAD_BUCKET_EXTERNAL_ENDPOINT="http://localhost:4566",
+)
+class ReadSignedUrlTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.user = cls.create_user("nurse", cls.district, home_facility=cls.facility)
+        cls.patient = cls.create_patient(
+            cls.district, cls.facility, local_body=cls.local_body
+        )
+        cls.consultation = cls.create_consultation(cls.patient, cls.facility)
+        cls.consent = cls.create_patient_consent(cls.consultation, created_by=cls.user)
+        cls.files = [
+            FileUpload.objects.create(
+                name=f"Consent {i}",
+                internal_name="consent.pdf",
+                associating_id=str(cls.consent.external_id),
+                file_type=FileUpload.FileType.CONSENT_RECORD,
+                uploaded_by=cls.user,
+                upload_completed=True,
+            )
+            for i in range(2)
+        ]
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_authenticate(user=self.user)
+
+    def test_clients_are_reused(self):
+        self.assertIs(
+            get_client(BucketType.PATIENT)[0], get_client(BucketType.PATIENT)[0]
+        )
+        self.assertIsNot(
+            get_client(BucketType.PATIENT)[0],
+            get_client(BucketType.PATIENT, external=True)[0],
+        )
+
+    def test_read_signed_urls_are_cached(self):
+        FileUpload.prefetch_read_signed_urls(self.files)
+        urls = [file.read_signed_url() for file in self.files]
+        self.assertEqual(len(set(urls)), 2)
+
+        with patch("care.utils.csp.client.get_client") as get_client_mock:
+            self.assertEqual(
+                [
+                    FileUpload.objects.get(id=file.id).read_signed_url()
+                    for file in self.files
+                ],
+                urls,
+            )
+            get_client_mock.assert_not_called()
+        self.assertNotEqual(self.files[0].read_signed_url(duration=60), urls[0])
+
+    def test_consent_files_include_read_signed_urls(self):
+        response = self.client.get(
+            f"/api/v1/consultation/{self.consultation.external_id}/consents/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(
+                file["read_signed_url"] for file in response.data["results"][0]["files"]
+            ),
+            sorted(file.read_signed_url() for file in self.files),
+        )
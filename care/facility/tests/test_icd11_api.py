@@ -1,6 +1,21 @@
+import tempfile
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from care.facility.static_data import icd11
+from care.facility.static_data.icd11 import (
+    ICD11,
+    get_icd11_diagnoses_objects_by_ids,
+    get_icd11_diagnosis_object_by_id,
+)
+from care.facility.static_data.icd11_search import (
+    RedisICD11SearchBackend,
+    build_icd11_search_index,
+    get_icd11_search_backend,
+)
 from care.utils.tests.test_utils import TestUtils
 
 
@@ -54,3 +69,118 @@ class TestICD11Api(TestUtils, APITestCase):
     def test_get_icd11_by_invalid_id(self):
         res = self.client.get("/api/v1/icd/invalid/")
         self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(
+    ICD11_SEARCH_BACKEND="memory", ICD11_SEARCH_INDEX_DIR=tempfile.mkdtemp()
+)
+class TestICD11InMemorySearchApi(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.user = cls.create_user(
+            "icd11_doctor", cls.district, home_facility=cls.facility
+        )
+        build_icd11_search_index()
+
+    def setUp(self) -> None:
+        get_icd11_search_backend.cache_clear()
+        super().setUp()
+
+    def search_icd11(self, query, **params):
+        return self.client.get("/api/v1/icd/", {"query": query, **params})
+
+    def test_search_does_not_query_the_database(self):
+        backend = get_icd11_search_backend("memory")
+        with self.assertNumQueries(0):
+            self.assertTrue(backend.search("cutaneous reactions", 5))
+
+    def test_search_without_index_uses_redis(self):
+        with (
+            override_settings(ICD11_SEARCH_INDEX_DIR=tempfile.mkdtemp()),
+            patch.object(
+                RedisICD11SearchBackend, "search", return_value=[]
+            ) as redis_search,
+        ):
+            get_icd11_search_backend("memory").search("rectum", 5)
+        redis_search.assert_called_once_with("rectum", 5, None)
+
+    def test_search_no_disease_code(self):
+        res = self.search_icd11("14 Diseases of the skin")
+        self.assertNotContains(res, "14 Diseases of the skin")
+
+    def test_search_with_disease_code(self):
+        res = self.search_icd11("aCuTe radiodermatitis following radiotherapy")
+        self.assertContains(res, "EL60 Acute radiodermatitis following radiotherapy")
+
+        res = self.search_icd11("cutaneous reactions")
+        self.assertContains(res, "EK50.0 Cutaneous insect bite reactions")
+
+        res = self.search_icd11("Haemorrhage rectum")
+        self.assertContains(res, "ME24.A1 Haemorrhage of anus and rectum")
+
+        res = self.search_icd11("ME24.A1")
+        self.assertContains(res, "ME24.A1 Haemorrhage of anus and rectum")
+
+        res = self.search_icd11("haemorr rec")
+        self.assertContains(res, "ME24.A1 Haemorrhage of anus and rectum")
+
+    def test_search_limit_and_chapter(self):
+        res = self.search_icd11("", limit=5)
+        self.assertEqual(len(res.data), 5)
+
+        chapter = res.data[0]["chapter"]
+        res = self.search_icd11("", chapter=chapter)
+        self.assertTrue(res.data)
+        self.assertTrue(all(obj["chapter"] == chapter for obj in res.data))
+
+        res = self.search_icd11("", chapter="not a chapter")
+        self.assertEqual(res.data, [])
+
+
+class TestICD11Lookup(TestCase):
+    ids = (990000001, 990000002, 990000003)
+
+    def setUp(self) -> None:
+        icd11._lookup_cache.clear()  # noqa: SLF001
+        for diagnosis_id in self.ids:
+            ICD11(
+                id=diagnosis_id,
+                label=f"XX{diagnosis_id} Lookup test",
+                chapter="null",
+                has_code=1,
+                vec="Lookup test",
+            ).save()
+
+    def tearDown(self) -> None:
+        ICD11.db().delete(*(ICD11.make_primary_key(pk) for pk in self.ids))
+        icd11._lookup_cache.clear()  # noqa: SLF001
+
+    def test_lookup_preserves_order_and_skips_missing(self):
+        result = get_icd11_diagnoses_objects_by_ids(
+            [self.ids[2], 990000999, self.ids[0], self.ids[2]]
+        )
+        self.assertEqual(
+            [diagnosis["id"] for diagnosis in result],
+            [self.ids[2], self.ids[0], self.ids[2]],
+        )
+        self.assertEqual(result[1]["chapter"], "")
+        self.assertEqual(get_icd11_diagnoses_objects_by_ids([]), [])
+
+    def test_lookup_is_served_from_cache(self):
+        get_icd11_diagnoses_objects_by_ids(self.ids)
+        ICD11.db().delete(ICD11.make_primary_key(self.ids[0]))
+
+        diagnosis = get_icd11_diagnosis_object_by_id(self.ids[0], as_dict=True)
+        self.assertEqual(diagnosis["label"], f"XX{self.ids[0]} Lookup test")
+
+        # callers get copies, mutating them does not affect the cache
+        diagnosis["label"] = "changed"
+        self.assertEqual(
+            get_icd11_diagnosis_object_by_id(self.ids[0], as_dict=True)["label"],
+            f"XX{self.ids[0]} Lookup test",
+        )
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from pywebpush import WebPushException
+from requests import Response
+
+from care.facility.models.notification import Notification
+from care.utils.notification_handler import NotificationGenerator
+from care.utils.tests.test_utils import TestUtils
+
+
+class NotificationGeneratorTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.patient = cls.create_patient(cls.district, cls.facility)
+        cls.staff = []
+        for i in range(3):
+            staff = cls.create_user(
+                f"staff{i}",
+                cls.district,
+                home_facility=cls.facility,
+                pf_endpoint=f"https://push.example.com/{i}",
+                pf_p256dh="p256dh",
+                pf_auth="auth",
+            )
+            cls.staff.append(staff)
+
+    def webpush(self, subscription_info, **kwargs):
+        if subscription_info["endpoint"].endswith("/0"):
+            response = Response()
+            response.status_code = 410
+            msg = "Push failed: 410 Gone"
+            raise WebPushException(msg, response=response)
+
+    def generate(self):
+        with (
+            patch(
+                "care.utils.webpush.send_webpush.webpush", side_effect=self.webpush
+            ) as webpush,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            NotificationGenerator(
+                event=Notification.Event.PUSH_MESSAGE,
+                caused_by=self.super_user,
+                caused_object=self.patient,
+                message="Message",
+                facility=self.facility,
+                generate_for_facility=True,
+            ).generate()
+        return webpush
+
+    def test_facility_users_are_notified(self):
+        webpush = self.generate()
+
+        self.assertEqual(
+            set(
+                Notification.objects.values_list("intended_for", flat=True).filter(
+                    message="Message"
+                )
+            ),
+            {staff.id for staff in self.staff},
+        )
+        self.assertEqual(webpush.call_count, 3)
+
+    def test_gone_subscriptions_are_pruned(self):
+        self.generate()
+        webpush = self.generate()
+
+        self.assertEqual(webpush.call_count, 2)
+        self.staff[0].refresh_from_db()
+        self.assertIsNone(self.staff[0].pf_endpoint)
+        self.staff[1].refresh_from_db()
+        self.assertIsNotNone(self.staff[1].pf_endpoint)
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from dateutil.relativedelta import relativedelta
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from care.facility.models import PatientRegistration
+from care.facility.tasks.patient_age import refresh_patient_age
+from care.utils.tests.test_utils import TestUtils
+
+
+class PatientAgeTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        today = timezone.now().date()
+        cls.child = cls.create_patient(
+            cls.district, cls.facility, date_of_birth=today - relativedelta(years=8)
+        )
+        cls.adult = cls.create_patient(
+            cls.district,
+            cls.facility,
+            date_of_birth=None,
+            year_of_birth=today.year - 40,
+        )
+        cls.elder = cls.create_patient(
+            cls.district,
+            cls.facility,
+            date_of_birth=today - relativedelta(years=70, days=1),
+        )
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def test_age_is_stored_on_save(self):
+        self.assertEqual(self.child.age, 8)
+        self.assertEqual(self.adult.age, self.adult.calculate_age())
+        self.assertEqual(self.elder.age, 70)
+
+        self.elder.death_datetime = timezone.now() - relativedelta(years=10)
+        self.elder.save(update_fields=["death_datetime"])
+        self.elder.refresh_from_db()
+        self.assertEqual(self.elder.age, 60)
+
+    def test_refresh_updates_only_stale_ages(self):
+        PatientRegistration.objects.filter(id=self.child.id).update(
+            age=7, date_of_birth=self.child.date_of_birth - timedelta(days=1)
+        )
+
+        self.assertEqual(refresh_patient_age(), 1)
+        self.child.refresh_from_db()
+        self.assertEqual(self.child.age, 8)
+        self.assertEqual(refresh_patient_age(), 0)
+
+    def test_patients_are_filtered_by_stored_age(self):
+        response = self.client.get(
+            "/api/v1/patient/", {"age_min": 18, "age_max": 65, "is_active": "true"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [patient["id"] for patient in response.data["results"]],
+            [str(self.adult.external_id)],
+        )
+        self.assertEqual(response.data["results"][0]["age"], self.adult.age)
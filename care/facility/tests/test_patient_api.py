@@ -12,6 +12,7 @@ from care.facility.models.icd11_diagnosis import (
 )
 from care.facility.models.patient_base import NewDischargeReasonEnum
 from care.facility.models.patient_consultation import ConsentType, PatientCodeStatusType
+from care.facility.utils.patient_search import normalize_name, normalize_phone_number
 from care.utils.tests.test_utils import TestUtils
 
 
@@ -1024,3 +1025,62 @@ class PatientSearchTestCase(TestUtils, APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 1)
+
+    def test_patient_search_by_phone_number_without_country_code(self):
+        response = self.client.get(
+            "/api/v1/patient/search/",
+            {"phone_number": self.patient.phone_number.removeprefix("+91")},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_patient_search_by_partial_phone_number_is_rejected(self):
+        for phone_number in ("0", self.patient.phone_number[-6:], "+91abcdefghij"):
+            with self.subTest(phone_number=phone_number):
+                response = self.client.get(
+                    "/api/v1/patient/search/", {"phone_number": phone_number}
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_patient_search_matches_whole_phone_numbers(self):
+        response = self.client.get(
+            "/api/v1/patient/search/",
+            {"phone_number": "+1" + self.patient.phone_number.removeprefix("+91")},
+        )
+        self.assertEqual(response.data["count"], 1)
+
+        response = self.client.get(
+            "/api/v1/patient/search/",
+            {"phone_number": "1" + self.patient.phone_number[-9:] + "0"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_patient_search_by_year_of_birth_and_age(self):
+        for params, count in (
+            ({"year_of_birth": self.patient.year_of_birth}, 1),
+            ({"year_of_birth": self.patient.year_of_birth + 1}, 0),
+            ({"age": now().year - self.patient.year_of_birth + 4}, 1),
+            ({"age": now().year - self.patient.year_of_birth + 6}, 0),
+        ):
+            with self.subTest(params=params):
+                response = self.client.get("/api/v1/patient/search/", params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data["count"], count)
+
+    def test_patient_search_by_name_ranks_similar_names(self):
+        similar_patient = self.create_patient(
+            self.district, self.facility, name="Fooo Bar"
+        )
+        self.create_patient(self.district, self.facility, name="Unrelated")
+        self.client.force_authenticate(user=self.super_user)
+        response = self.client.get("/api/v1/patient/search/", {"name": "foo bar"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [patient["patient_id"] for patient in response.data["results"]],
+            [str(similar_patient.external_id), str(self.patient.external_id)],
+        )
+
+    def test_patient_name_is_normalized_for_search(self):
+        self.assertEqual(normalize_name("  Ánna-Marie   O'Neil. "), "ánnamarie oneil")
+        self.assertEqual(normalize_phone_number("+91 98765-43210"), "919876543210")
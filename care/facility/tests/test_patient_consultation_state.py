@@ -0,0 +1,129 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from care.facility.models import DailyRound, PatientRegistration
+from care.facility.models.bed import BedType
+from care.utils.tests.test_utils import TestUtils
+
+
+class PatientConsultationStateTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.location = cls.create_asset_location(cls.facility)
+        cls.icu_bed = cls.create_bed(
+            cls.facility, cls.location, bed_type=BedType.ICU.value, name="ICU 1"
+        )
+
+        cls.patient = cls.create_patient(cls.district, cls.facility)
+        cls.consultation = cls.create_consultation(
+            cls.patient, cls.facility, category="Moderate"
+        )
+        cls.other_patient = cls.create_patient(cls.district, cls.facility)
+        cls.create_consultation(cls.other_patient, cls.facility, category="Stable")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.user)
+
+    def get_patient(self, patient):
+        return PatientRegistration.objects.get(id=patient.id)
+
+    def test_state_follows_the_last_consultation(self):
+        patient = self.get_patient(self.patient)
+        self.assertEqual(patient.effective_category, "Moderate")
+        self.assertIsNone(patient.current_bed_type)
+        self.assertIsNone(patient.current_location)
+
+        daily_round = DailyRound.objects.create(
+            consultation=self.consultation,
+            patient_category="Critical",
+            taken_at=timezone.now(),
+        )
+        self.consultation.last_daily_round = daily_round
+        self.consultation.current_bed = self.create_consultation_bed(
+            self.consultation, self.icu_bed
+        )
+        self.consultation.save()
+
+        patient = self.get_patient(self.patient)
+        self.assertEqual(patient.effective_category, "Critical")
+        self.assertEqual(patient.current_bed_type, BedType.ICU.value)
+        self.assertEqual(patient.current_location_id, self.location.id)
+
+        daily_round.patient_category = "Stable"
+        daily_round.save()
+        self.consultation.current_bed = None
+        self.consultation.save(update_fields=["current_bed"])
+
+        patient = self.get_patient(self.patient)
+        self.assertEqual(patient.effective_category, "Stable")
+        self.assertIsNone(patient.current_bed_type)
+        self.assertIsNone(patient.current_location)
+
+    def test_state_is_only_refreshed_by_changes_it_depends_on(self):
+        with patch(
+            "care.facility.signals.patient_state.update_patient_consultation_state"
+        ) as update_state:
+            self.patient.save(update_fields=["review_time"])
+            daily_round = DailyRound.objects.create(
+                consultation=self.consultation,
+                patient_category="Critical",
+                taken_at=timezone.now(),
+            )
+            update_state.assert_not_called()
+
+            self.consultation.last_daily_round = daily_round
+            self.consultation.save(update_fields=["last_daily_round"])
+            update_state.assert_called_once()
+
+        daily_round.save()
+        self.assertEqual(self.get_patient(self.patient).effective_category, "Critical")
+
+    def test_state_is_updated_with_the_last_daily_rounds(self):
+        DailyRound.objects.create(
+            consultation=self.consultation,
+            patient_category="Critical",
+            taken_at=timezone.now(),
+        )
+
+        call_command("add_daily_round_consultation", stdout=StringIO())
+
+        self.assertEqual(self.get_patient(self.patient).effective_category, "Critical")
+
+    def test_patients_are_filtered_by_state(self):
+        self.consultation.current_bed = self.create_consultation_bed(
+            self.consultation, self.icu_bed
+        )
+        self.consultation.save()
+
+        for params, expected in (
+            ({"category": "Moderate"}, [self.patient]),
+            ({"last_consultation_admitted_bed_type": "ICU"}, [self.patient]),
+            (
+                {"last_consultation_admitted_bed_type_list": "None"},
+                [self.other_patient],
+            ),
+            (
+                {"last_consultation_current_bed__location": self.location.external_id},
+                [self.patient],
+            ),
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(
+                    "/api/v1/patient/", {**params, "is_active": "true"}
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [patient["id"] for patient in response.data["results"]],
+                    [str(patient.external_id) for patient in expected],
+                )
@@ -4,7 +4,7 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from care.facility.models import PatientRegistration
+from care.facility.models import DailyRound, PatientRegistration
 from care.facility.models.patient_consultation import PatientConsultation
 from care.utils.tests.test_utils import TestUtils
 
@@ -324,3 +324,79 @@ class TestDailyRoundApi(TestUtils, APITestCase):
             data,
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def create_rounds(self):
+        start = timezone.localtime().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=1)
+        for minutes, pulse, bp in (
+            (10, 80, {"systolic": 120, "diastolic": 80}),
+            (40, 90, {"systolic": 130}),
+            (70, None, {"systolic": 110, "diastolic": 70}),
+            (100, 70, {}),
+        ):
+            DailyRound.objects.create(
+                consultation=self.consultation_with_bed,
+                taken_at=start + timedelta(minutes=minutes),
+                pulse=pulse,
+                bp=bp,
+            )
+        return start
+
+    def test_analyse_columns_of_raw_rounds(self):
+        start = self.create_rounds()
+        response = self.client.post(
+            self.get_url(self.consultation_with_bed.external_id),
+            data={
+                "fields": ["pulse", "bp.systolic", "bp.diastolic"],
+                "resolution": "raw",
+                "start": (start + timedelta(minutes=30)).isoformat(),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["taken_at"]), 3)
+        self.assertEqual(
+            response.data["fields"],
+            {
+                "pulse": [90, None, 70],
+                "bp.systolic": [130, 110, None],
+                "bp.diastolic": [None, 70, None],
+            },
+        )
+
+    def test_analyse_columns_aggregated_over_buckets(self):
+        start = self.create_rounds()
+        url = self.get_url(self.consultation_with_bed.external_id)
+        data = {"fields": ["pulse", "bp.systolic"], "resolution": "1h"}
+
+        response = self.client.post(url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["taken_at"], [start, start + timedelta(hours=1)])
+        self.assertEqual(
+            response.data["fields"],
+            {"pulse": [90, 70], "bp.systolic": [130, 110]},
+        )
+
+        response = self.client.post(
+            url, data={**data, "aggregate": "mean"}, format="json"
+        )
+        self.assertEqual(
+            response.data["fields"],
+            {"pulse": [85, 70], "bp.systolic": [125, 110]},
+        )
+
+    def test_analyse_columns_with_invalid_fields(self):
+        response = self.client.post(
+            self.get_url(self.consultation_with_bed.external_id),
+            data={"fields": ["consultation", "other_details"], "resolution": "1d"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["fields"],
+            {
+                "consultation": "Not a valid field",
+                "other_details": "Only numeric fields can be aggregated",
+            },
+        )
@@ -0,0 +1,112 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from care.facility.models import (
+    DistrictScopedSummary,
+    FacilityRelatedSummary,
+)
+from care.facility.models.patient_base import BedType
+from care.facility.utils.summarization.district.patient_summary import (
+    district_patient_summary,
+)
+from care.facility.utils.summarization.patient_summary import patient_summary
+from care.utils.tests.test_utils import TestUtils
+
+
+class PatientSummaryTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_populated_facility()
+
+    @classmethod
+    def create_populated_facility(cls):
+        facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        bed = cls.create_bed(
+            facility, cls.create_asset_location(facility), bed_type=BedType.ICU.value
+        )
+        patient = cls.create_patient(cls.district, facility, local_body=cls.local_body)
+        consultation = cls.create_consultation(patient, facility, suggestion="A")
+        consultation.current_bed = cls.create_consultation_bed(consultation, bed)
+        consultation.save()
+
+        patient = cls.create_patient(cls.district, facility, local_body=cls.local_body)
+        cls.create_consultation(patient, facility, suggestion="HI")
+        cls.create_patient(
+            cls.district, facility, local_body=cls.local_body, is_active=False
+        )
+        return facility
+
+    def test_patient_summary(self):
+        patient_summary()
+
+        data = FacilityRelatedSummary.objects.get(
+            s_type="PatientSummary", facility=self.facility
+        ).data
+        self.assertEqual(data["facility_external_id"], str(self.facility.external_id))
+        self.assertEqual(data["district"], self.district.name)
+        self.assertEqual(data["total_patients_icu"], 1)
+        self.assertEqual(data["today_patients_icu"], 1)
+        self.assertEqual(data["total_patients_regular"], 0)
+        self.assertEqual(data["total_patients_home_quarantine"], 1)
+        self.assertIn("modified_date", data)
+
+    def test_district_patient_summary(self):
+        district_patient_summary()
+
+        data = DistrictScopedSummary.objects.get(
+            s_type="PatientSummary", district=self.district
+        ).data
+        self.assertEqual(data["id"], self.district.id)
+        local_body_data = data[str(self.local_body.id)]
+        self.assertEqual(local_body_data["total_inactive"], 1)
+        self.assertEqual(local_body_data["total_patients_icu"], 1)
+        self.assertEqual(local_body_data["total_patients_home_quarantine"], 1)
+
+    def test_summaries_are_refreshed_in_place(self):
+        patient_summary()
+        district_patient_summary()
+        self.create_consultation(
+            self.create_patient(
+                self.district, self.facility, local_body=self.local_body
+            ),
+            self.facility,
+            suggestion="HI",
+        )
+        patient_summary()
+        district_patient_summary()
+
+        self.assertEqual(
+            FacilityRelatedSummary.objects.get(
+                s_type="PatientSummary", facility=self.facility
+            ).data["total_patients_home_quarantine"],
+            2,
+        )
+        self.assertEqual(
+            DistrictScopedSummary.objects.get(
+                s_type="PatientSummary", district=self.district
+            ).data[str(self.local_body.id)]["total_patients_home_quarantine"],
+            2,
+        )
+
+    def test_query_count_does_not_scale_with_facilities(self):
+        with CaptureQueriesContext(connection) as single_facility:
+            patient_summary()
+            district_patient_summary()
+
+        for _ in range(3):
+            self.create_populated_facility()
+        self.create_local_body(self.district)
+        FacilityRelatedSummary.objects.all().delete()
+        DistrictScopedSummary.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as many_facilities:
+            patient_summary()
+            district_patient_summary()
+
+        self.assertEqual(len(single_facility), len(many_facilities))
@@ -0,0 +1,181 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from care.facility.models import (
+    DistrictScopedSummary,
+    FacilityRelatedSummary,
+    PatientRegistration,
+    StaleFacilitySummary,
+)
+from care.facility.tasks.summarisation import (
+    summarize_district_patient,
+    summarize_facility_capacity,
+    summarize_patient,
+)
+from care.utils.tests.test_utils import TestUtils
+
+
+class StaleSummariesTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.other_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body
+        )
+        cls.other_district = cls.create_district(cls.state)
+        cls.other_local_body = cls.create_local_body(cls.other_district)
+        cls.other_district_facility = cls.create_facility(
+            cls.super_user, cls.other_district, cls.other_local_body
+        )
+
+    def get_summary(self, s_type, facility):
+        return FacilityRelatedSummary.objects.get(s_type=s_type, facility=facility)
+
+    def test_changes_mark_facility_stale_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            patient = self.create_patient(self.district, self.facility)
+            self.create_consultation(patient, self.facility)
+
+        self.assertEqual(
+            set(StaleFacilitySummary.objects.values_list("facility_id", "s_type")),
+            {
+                (self.facility.id, "FacilityCapacity"),
+                (self.facility.id, "PatientSummary"),
+                (self.facility.id, "TestSummary"),
+                (self.facility.id, "DistrictPatientSummary"),
+            },
+        )
+
+    def test_sample_changes_mark_facility_of_consultation_stale(self):
+        patient = self.create_patient(self.district, self.other_facility)
+        consultation = self.create_consultation(patient, self.facility)
+        StaleFacilitySummary.objects.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_patient_sample(
+                patient, consultation, self.other_facility, self.user
+            )
+
+        self.assertEqual(
+            set(StaleFacilitySummary.objects.values_list("facility_id", flat=True)),
+            {self.facility.id},
+        )
+
+    def test_moving_patients_marks_both_facilities_stale(self):
+        patient = self.create_patient(self.district, self.facility)
+        consultation = self.create_consultation(patient, self.facility)
+        patient.last_consultation = consultation
+        patient.save()
+        StaleFacilitySummary.objects.all().delete()
+
+        patient = PatientRegistration.objects.get(id=patient.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            patient.facility = self.other_facility
+            patient.last_consultation = self.create_consultation(
+                patient, self.other_facility
+            )
+            patient.save()
+
+        self.assertEqual(
+            set(StaleFacilitySummary.objects.values_list("facility_id", flat=True)),
+            {self.facility.id, self.other_facility.id},
+        )
+
+    def test_only_stale_facilities_are_summarized_again(self):
+        summarize_patient()
+        summarize_facility_capacity()
+        other_summary = self.get_summary("PatientSummary", self.other_facility)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            patient = self.create_patient(self.district, self.facility)
+            self.create_consultation(patient, self.facility)
+        summarize_patient()
+        summarize_facility_capacity()
+
+        self.assertEqual(
+            self.get_summary("PatientSummary", self.facility).data[
+                "total_patients_home_quarantine"
+            ],
+            1,
+        )
+        self.assertEqual(
+            self.get_summary("FacilityCapacity", self.facility).data[
+                "actual_live_patients"
+            ],
+            1,
+        )
+        self.assertEqual(
+            self.get_summary("PatientSummary", self.other_facility).modified_date,
+            other_summary.modified_date,
+        )
+        self.assertFalse(
+            StaleFacilitySummary.objects.filter(
+                s_type__in=["PatientSummary", "FacilityCapacity"]
+            ).exists()
+        )
+
+    def test_only_districts_of_stale_facilities_are_summarized_again(self):
+        summarize_district_patient()
+        other_summary = DistrictScopedSummary.objects.get(district=self.other_district)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_patient(
+                self.district,
+                self.facility,
+                local_body=self.local_body,
+                is_active=False,
+            )
+        summarize_district_patient()
+
+        self.assertEqual(
+            DistrictScopedSummary.objects.get(district=self.district).data[
+                str(self.local_body.id)
+            ]["total_inactive"],
+            1,
+        )
+        self.assertEqual(
+            DistrictScopedSummary.objects.get(
+                district=self.other_district
+            ).modified_date,
+            other_summary.modified_date,
+        )
+
+    def test_marks_are_kept_when_summarization_fails(self):
+        summarize_facility_capacity()
+        with self.captureOnCommitCallbacks(execute=True):
+            patient = self.create_patient(self.district, self.facility)
+            self.create_consultation(patient, self.facility)
+
+        with (
+            patch(
+                "care.facility.tasks.summarisation.facility_capacity_summary",
+                side_effect=ValueError,
+            ),
+            self.assertRaises(ValueError),
+        ):
+            summarize_facility_capacity()
+
+        self.assertTrue(
+            StaleFacilitySummary.objects.filter(
+                s_type="FacilityCapacity", facility=self.facility
+            ).exists()
+        )
+
+    def test_full_pass_summarizes_all_facilities(self):
+        summarize_patient()
+        other_summary = self.get_summary("PatientSummary", self.other_facility)
+
+        patient = self.create_patient(self.district, self.other_facility)
+        self.create_consultation(patient, self.other_facility)
+        summarize_patient(full=True)
+
+        self.assertNotEqual(
+            self.get_summary("PatientSummary", self.other_facility).data,
+            other_summary.data,
+        )
@@ -0,0 +1,100 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from care.facility.models import (
+    FacilityPatientStatsHistory,
+    FacilityRelatedSummary,
+    PatientSample,
+)
+from care.facility.utils.summarization.runner import run_summarization
+from care.facility.utils.summarization.tests_summary import tests_summary
+from care.facility.utils.summarization.triage_summary import triage_summary
+from care.utils.tests.test_utils import TestUtils
+
+
+class TestsTriageSummaryTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.user = cls.super_user
+        cls.facility = cls.create_populated_facility()
+
+    @classmethod
+    def create_populated_facility(cls):
+        facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        patient = cls.create_patient(cls.district, facility)
+        consultation = cls.create_consultation(patient, facility)
+        cls.create_consultation(patient, facility)
+        for result in ("POSITIVE", "POSITIVE", "NEGATIVE"):
+            cls.create_patient_sample(
+                patient,
+                consultation,
+                facility,
+                cls.super_user,
+                result=PatientSample.SAMPLE_TEST_RESULT_MAP[result],
+            )
+        for day, visited in ((1, 4), (2, 7)):
+            FacilityPatientStatsHistory.objects.create(
+                facility=facility,
+                entry_date=date(2024, 1, day),
+                num_patients_visited=visited,
+                num_patients_isolation=1,
+            )
+        return facility
+
+    def get_summary(self, s_type, facility=None):
+        return FacilityRelatedSummary.objects.get(
+            s_type=s_type, facility=facility or self.facility
+        ).data
+
+    def test_tests_summary(self):
+        empty_facility = self.create_facility(
+            self.super_user, self.district, self.local_body
+        )
+        tests_summary()
+
+        data = self.get_summary("TestSummary")
+        self.assertEqual(data["total_patients"], 1)
+        self.assertEqual(data["total_tests"], 3)
+        self.assertEqual(data["result_positive"], 2)
+        self.assertEqual(data["result_negative"], 1)
+        self.assertEqual(data["result_awaited"], 0)
+        self.assertIn("modified_date", data)
+        self.assertEqual(
+            self.get_summary("TestSummary", empty_facility)["total_tests"], 0
+        )
+
+    def test_triage_summary(self):
+        triage_summary()
+        triage_summary()
+
+        data = self.get_summary("TriageSummary")
+        self.assertEqual(data["total_patients_visited"], 11)
+        self.assertEqual(data["avg_patients_visited"], 5)
+        self.assertEqual(data["total_patients_isolation"], 2)
+        self.assertEqual(data["avg_patients_isolation"], 1)
+        self.assertEqual(data["total_patients_confirmed_positive"], 0)
+
+    def test_summaries_are_computed_with_constant_queries(self):
+        for summarize in (tests_summary, triage_summary):
+            with CaptureQueriesContext(connection) as one_facility:
+                summarize()
+            FacilityRelatedSummary.objects.all().delete()
+            self.create_populated_facility()
+            with CaptureQueriesContext(connection) as two_facilities:
+                summarize()
+            self.assertEqual(len(one_facility), len(two_facilities))
+
+    def test_run_summarization_counts_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            run = run_summarization("Tests", tests_summary)
+
+        self.assertEqual(run.name, "Tests")
+        self.assertEqual(run.queries, len(queries))
+        self.assertGreaterEqual(run.duration, 0)
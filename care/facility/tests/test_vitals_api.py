@@ -0,0 +1,161 @@
+from datetime import timedelta
+
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from care.facility.models import VitalsChunk
+from care.utils.tests.test_utils import TestUtils
+
+
+class VitalsApiTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.user = cls.create_user("staff1", cls.district, home_facility=cls.facility)
+        cls.patient = cls.create_patient(district=cls.district, facility=cls.facility)
+        cls.location = cls.create_asset_location(cls.facility)
+        cls.bed = cls.create_bed(facility=cls.facility, location=cls.location)
+        cls.asset = cls.create_asset(cls.location)
+        cls.create_asset_bed(cls.asset, cls.bed)
+        cls.asset_user = cls.create_user(
+            "asset1", cls.district, home_facility=cls.facility, asset=cls.asset
+        )
+        cls.consultation = cls.create_consultation(
+            facility=cls.facility, patient=cls.patient
+        )
+        cls.consultation.current_bed = cls.create_consultation_bed(
+            cls.consultation, cls.bed
+        )
+        cls.consultation.save()
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(user=self.asset_user)
+        self.start = timezone.localtime().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=1)
+
+    def get_url(self):
+        return f"/api/v1/consultation/{self.consultation.external_id}/vitals/"
+
+    def push_readings(self, vital, readings):
+        return self.client.post(
+            self.get_url(),
+            data={
+                "readings": [
+                    {
+                        "vital": vital,
+                        "taken_at": (self.start + timedelta(seconds=s)).isoformat(),
+                        "value": value,
+                    }
+                    for s, value in readings
+                ]
+            },
+            format="json",
+        )
+
+    def read_readings(self, **params):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            self.get_url(), {"start": self.start.isoformat(), **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["vitals"]
+
+    @override_settings(VITALS_CHUNK_SIZE=3)
+    def test_readings_are_appended_in_chunks(self):
+        response = self.push_readings("spo2", [(5, 98), (0, 97), (10, 96.5)])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["stored"], 3)
+
+        # readings already stored are dropped when resent
+        response = self.push_readings("spo2", [(10, 96.5), (15, 95), (4000, 94)])
+        self.assertEqual(response.data["stored"], 2)
+
+        chunks = VitalsChunk.objects.filter(consultation=self.consultation)
+        self.assertEqual(
+            [(chunk.time_deltas, chunk.values) for chunk in chunks.order_by("start")],
+            [([0, 5000, 5000], [97, 98, 96.5]), ([0], [95]), ([0], [94])],
+        )
+
+        vitals = self.read_readings(
+            vitals="spo2", end=(self.start + timedelta(seconds=15)).isoformat()
+        )
+        self.assertEqual(
+            vitals["spo2"],
+            {
+                "taken_at": [self.start + timedelta(seconds=s) for s in (0, 5, 10)],
+                "values": [97, 98, 96.5],
+            },
+        )
+
+    def test_read_downsampled_readings(self):
+        self.push_readings("pulse", [(0, 80), (60, 90), (3600, 70)])
+        self.push_readings("bp.systolic", [(30, 120)])
+
+        vitals = self.read_readings(
+            vitals="pulse,bp.systolic", resolution="1h", aggregate="mean"
+        )
+        self.assertEqual(
+            vitals,
+            {
+                "pulse": {
+                    "taken_at": [self.start, self.start + timedelta(hours=1)],
+                    "values": [85, 70],
+                },
+                "bp.systolic": {"taken_at": [self.start], "values": [120]},
+            },
+        )
+
+    @override_settings(VITALS_CHUNK_SIZE=2)
+    def test_downsampled_readings_are_aggregated_across_chunks(self):
+        self.push_readings("spo2", [(0, 97), (600, 95), (1200, 96), (5400, 94)])
+
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                self.get_url(),
+                {
+                    "start": (self.start + timedelta(minutes=5)).isoformat(),
+                    "vitals": "spo2",
+                    "resolution": "1h",
+                    "aggregate": "last",
+                },
+            )
+        self.assertEqual(
+            response.data["vitals"]["spo2"],
+            {
+                "taken_at": [self.start, self.start + timedelta(hours=1)],
+                "values": [96, 94],
+            },
+        )
+
+    def test_readings_are_only_pushed_by_assets_of_the_bed(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.push_readings("pulse", [(0, 80)])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(
+            user=self.create_user(
+                "asset2",
+                self.district,
+                home_facility=self.facility,
+                asset=self.create_asset(self.location),
+            )
+        )
+        response = self.push_readings("pulse", [(0, 80)])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(VitalsChunk.objects.exists())
+
+    def test_raw_readings_are_read_a_day_at_a_time(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            self.get_url(),
+            {"vitals": "pulse", "start": (self.start - timedelta(days=1)).isoformat()},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
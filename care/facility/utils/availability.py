@@ -0,0 +1,56 @@
+from collections.abc import Iterable
+from itertools import batched
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model, OuterRef, Subquery
+
+from care.facility.models.asset import AvailabilityRecord, LatestAvailabilityRecord
+
+AVAILABILITY_BATCH_SIZE = 1000
+
+
+def get_latest_availability_records(
+    content_type: ContentType, external_ids: Iterable[UUID]
+) -> dict[UUID, LatestAvailabilityRecord]:
+    """
+    Returns the latest availability record of each of the given objects, with
+    a single query.
+    """
+    return {
+        record.object_external_id: record
+        for record in LatestAvailabilityRecord.objects.filter(
+            content_type=content_type, object_external_id__in=list(external_ids)
+        )
+    }
+
+
+def latest_availability_status(model: type[Model], outer_ref="external_id"):
+    """
+    Returns an expression for annotating a queryset with the latest
+    availability status of the objects of `model` referenced by `outer_ref`.
+    """
+    return Subquery(
+        LatestAvailabilityRecord.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            object_external_id=OuterRef(outer_ref),
+        ).values("status")[:1]
+    )
+
+
+def create_availability_records(records: list[AvailabilityRecord]):
+    for batch in batched(records, AVAILABILITY_BATCH_SIZE):
+        # records conflicting with an existing (object, timestamp) pair are
+        # skipped instead of failing the whole batch
+        AvailabilityRecord.objects.bulk_create(batch, ignore_conflicts=True)
+        # the pks of the inserted records are not returned when conflicts are
+        # ignored, so they are told apart by their generated external ids
+        inserted = set(
+            AvailabilityRecord.objects.filter(
+                external_id__in=[record.external_id for record in batch]
+            ).values_list("external_id", flat=True)
+        )
+        # bulk_create does not call save, which keeps the projection in sync
+        LatestAvailabilityRecord.update_from_records(
+            [record for record in batch if record.external_id in inserted]
+        )
@@ -0,0 +1,192 @@
+from datetime import datetime, timedelta
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    Avg,
+    Case,
+    CharField,
+    DateTimeField,
+    F,
+    FloatField,
+    Func,
+    Max,
+    Min,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast
+from django.db.models.lookups import Exact
+from django.utils import timezone
+
+from care.facility.models.daily_round import DailyRound
+
+# the width of the buckets rounds are grouped in, for each resolution
+RESOLUTIONS = {
+    "raw": None,
+    "15m": timedelta(minutes=15),
+    "1h": timedelta(hours=1),
+    "6h": timedelta(hours=6),
+    "1d": timedelta(days=1),
+}
+
+AGGREGATES = ("last", "min", "max", "mean")
+
+NUMERIC_FIELD_TYPES = (
+    "IntegerField",
+    "PositiveIntegerField",
+    "SmallIntegerField",
+    "FloatField",
+    "DecimalField",
+)
+
+
+class LastValue(Func):
+    """
+    The first element of an array aggregate, ie. the latest non null value
+    of a bucket when the aggregate is ordered by the latest round first.
+    """
+
+    template = "(%(expressions)s)[1]"
+
+
+def get_field(path: str):
+    """
+    Returns the model field a field path such as `pulse` or `bp.systolic`
+    starts with, or None if it is not a plain or JSON field of rounds.
+    """
+    name, *keys = path.split(".")
+    try:
+        field = DailyRound._meta.get_field(name)  # noqa: SLF001
+    except FieldDoesNotExist:
+        return None
+    if not field.concrete or field.is_relation:
+        return None
+    if keys and field.get_internal_type() != "JSONField":
+        return None
+    return field
+
+
+def is_numeric(path: str) -> bool:
+    field = get_field(path)
+    return field is not None and (
+        "." in path or field.get_internal_type() in NUMERIC_FIELD_TYPES
+    )
+
+
+def field_expression(path: str):
+    """
+    Returns an expression for the value of a field path. Values nested in
+    JSON fields are returned as numbers, and as null when they are not.
+    """
+    name, *keys = path.split(".")
+    if not keys:
+        return F(name)
+    parent = F(name)
+    for key in keys[:-1]:
+        parent = KeyTransform(key, parent)
+    return Case(
+        When(
+            Exact(
+                Func(
+                    KeyTransform(keys[-1], parent),
+                    function="jsonb_typeof",
+                    output_field=CharField(),
+                ),
+                "number",
+            ),
+            then=Cast(KeyTextTransform(keys[-1], parent), FloatField()),
+        ),
+        output_field=FloatField(),
+    )
+
+
+def aggregate_expression(alias: str, aggregate: str):
+    if aggregate == "min":
+        return Min(alias)
+    if aggregate == "max":
+        return Max(alias)
+    if aggregate == "mean":
+        return Avg(alias)
+    return LastValue(
+        ArrayAgg(alias, filter=Q(**{f"{alias}__isnull": False}), ordering="-taken_at"),
+        output_field=FloatField(),
+    )
+
+
+def analyse_daily_rounds(
+    queryset: QuerySet,
+    fields: list[str],
+    resolution: str = "raw",
+    aggregate: str = "last",
+) -> dict:
+    """
+    Returns the values of the given field paths of the rounds in `queryset`
+    as arrays aligned with a `taken_at` array.
+
+    At the raw resolution there is an element per round. Otherwise rounds
+    are grouped by the database in buckets of the resolution's width,
+    aligned to local midnight, and each field is aggregated over the rounds
+    of a bucket, leaving out rounds where it is null.
+    """
+    aliases = {f"field_{i}": path for i, path in enumerate(fields)}
+    queryset = queryset.filter(taken_at__isnull=False)
+    bucket_width = RESOLUTIONS[resolution]
+
+    if bucket_width is None:
+        rows = (
+            queryset.annotate(
+                **{alias: field_expression(path) for alias, path in aliases.items()}
+            )
+            .order_by("taken_at")
+            .values_list("taken_at", "external_id", *aliases)
+        )
+        columns = list(zip(*rows, strict=True)) or [()] * (len(aliases) + 2)
+        return {
+            "resolution": resolution,
+            "taken_at": list(columns[0]),
+            "id": list(columns[1]),
+            "fields": {
+                path: list(column)
+                for path, column in zip(aliases.values(), columns[2:], strict=True)
+            },
+        }
+
+    origin = timezone.make_aware(datetime(2000, 1, 1))  # noqa: DTZ001
+    rows = (
+        queryset.alias(
+            **{
+                alias: Cast(field_expression(path), FloatField())
+                for alias, path in aliases.items()
+            }
+        )
+        .annotate(
+            bucket=Func(
+                Value(bucket_width),
+                F("taken_at"),
+                Value(origin),
+                function="date_bin",
+                output_field=DateTimeField(),
+            )
+        )
+        .values("bucket")
+        .annotate(
+            **{
+                f"{alias}_value": aggregate_expression(alias, aggregate)
+                for alias in aliases
+            }
+        )
+        .order_by("bucket")
+    )
+    return {
+        "resolution": resolution,
+        "aggregate": aggregate,
+        "taken_at": [row["bucket"] for row in rows],
+        "fields": {
+            path: [row[f"{alias}_value"] for row in rows]
+            for alias, path in aliases.items()
+        },
+    }
@@ -0,0 +1,197 @@
+import csv
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from io import TextIOWrapper
+from itertools import batched
+from typing import BinaryIO
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Upper
+from rest_framework.exceptions import ValidationError
+
+from care.facility.models import PatientExternalTest, PatientRegistration
+from care.users.models import District, LocalBody, Ward
+
+# the fields of external tests keyed by their headers in uploaded CSV files
+CSV_HEADER_FIELDS = {
+    header: field for field, header in PatientExternalTest.HEADER_CSV_MAPPING.items()
+}
+
+
+def pretty_errors(errors):
+    pretty_errors = defaultdict(list)
+    for attribute in PatientExternalTest.HEADER_CSV_MAPPING:
+        if attribute in errors:
+            for error in errors.get(attribute, ""):
+                pretty_errors[attribute].append(str(error))
+    return dict(pretty_errors)
+
+
+def normalize_location_name(name) -> str:
+    return " ".join(str(name).split()).casefold()
+
+
+class ExternalTestLocations:
+    """
+    Resolves the names of districts and local bodies and the numbers of wards
+    in uploaded external tests to their ids. The districts are loaded once,
+    and the local bodies and wards of a district the first time a name in
+    the district is resolved, so resolving the locations of any number of
+    tests takes a handful of queries.
+
+    Names are matched like a case insensitive `icontains` lookup: the
+    location with the lowest id whose name contains the given name wins.
+    """
+
+    def __init__(self):
+        self.districts = None
+        self.local_bodies = {}
+        self.wards = {}
+        self.resolved = {}
+
+    def find(self, name, candidates, scope) -> int | None:
+        key = (normalize_location_name(name), scope)
+        if key not in self.resolved:
+            self.resolved[key] = next(
+                (
+                    candidate_id
+                    for candidate_id, candidate_name in candidates
+                    if key[0] in candidate_name
+                ),
+                None,
+            )
+        return self.resolved[key]
+
+    def get_district_id(self, name) -> int | None:
+        if self.districts is None:
+            self.districts = [
+                (district_id, normalize_location_name(district_name))
+                for district_id, district_name in District.objects.order_by(
+                    "id"
+                ).values_list("id", "name")
+            ]
+        return self.find(name, self.districts, None)
+
+    def load_district(self, district_id):
+        local_bodies = self.local_bodies[district_id] = {}
+        for local_body_id, name, body_type in (
+            LocalBody.objects.filter(district_id=district_id)
+            .order_by("id")
+            .values_list("id", "name", "body_type")
+        ):
+            local_bodies.setdefault(body_type, []).append(
+                (local_body_id, normalize_location_name(name))
+            )
+        for ward_id, local_body_id, number in (
+            Ward.objects.filter(local_body__district_id=district_id)
+            .order_by("-id")
+            .values_list("id", "local_body_id", "number")
+        ):
+            self.wards[local_body_id, number] = ward_id
+
+    def get_local_body_id(self, name, district_id, body_type) -> int | None:
+        if district_id not in self.local_bodies:
+            self.load_district(district_id)
+        return self.find(
+            name,
+            self.local_bodies[district_id].get(body_type, []),
+            (district_id, body_type),
+        )
+
+    def get_ward_id(self, number, local_body_id) -> int | None:
+        return self.wards.get((local_body_id, number))
+
+
+def read_uploaded_tests(file: BinaryIO, name: str) -> Iterator[dict]:
+    """
+    Reads external tests from an NDJSON file, with one test per line, or a
+    CSV file, with either the field names or their headers as columns, as
+    told by its `name`. The file is read a line at a time, and empty CSV
+    cells are left out.
+    """
+    text = TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if name.endswith((".ndjson", ".jsonl")):
+            for line_number, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValidationError(
+                        {"file": f"Line {line_number} is not valid JSON"}
+                    ) from e
+            return
+        for row in csv.DictReader(text):
+            yield {
+                CSV_HEADER_FIELDS.get(header.strip(), header.strip()): value
+                for header, value in row.items()
+                if header and value not in (None, "")
+            }
+    finally:
+        # the file is left open for the caller
+        text.detach()
+
+
+def validate_external_tests(
+    samples: Iterable[dict],
+    district_name: str,
+    locations: ExternalTestLocations,
+    errors: list[dict],
+) -> list[PatientExternalTest]:
+    from care.facility.api.serializers.patient_external_test import (
+        PatientExternalTestSerializer,
+    )
+
+    tests = []
+    for sample in samples:
+        if not isinstance(sample, dict):
+            raise ValidationError({"sample_tests": "Each test should be an object"})
+        if district_name != sample.get("district"):
+            raise ValidationError({"Error": "User must belong to same district"})
+        serializer = PatientExternalTestSerializer(
+            data=sample, context={"locations": locations}
+        )
+        if not serializer.is_valid():
+            errors.append(pretty_errors(serializer.errors) or serializer.errors)
+            continue
+        if not errors:
+            tests.append(PatientExternalTest(**serializer.validated_data))
+    return tests
+
+
+def create_external_tests(tests: list[PatientExternalTest]):
+    srf_ids = {test.srf_id.upper() for test in tests if test.srf_id}
+    registered_srf_ids = set(
+        PatientRegistration.objects.annotate(srf_id_upper=Upper("srf_id"))
+        .filter(srf_id_upper__in=srf_ids)
+        .values_list("srf_id_upper", flat=True)
+    )
+    for test in tests:
+        test.patient_created = test.srf_id.upper() in registered_srf_ids
+    PatientExternalTest.objects.bulk_create(tests)
+
+
+def import_external_tests(samples: Iterable[dict], district_name: str) -> list[dict]:
+    """
+    Validates the external tests in `samples` and creates them if all of them
+    are valid. Returns the errors of the invalid tests, if any.
+
+    The tests are validated and inserted in batches of
+    `EXTERNAL_TEST_IMPORT_BATCH_SIZE`, so that only a batch of them is held
+    in memory, and the inserted ones are rolled back if any test is invalid.
+    Locations are resolved through a lookup table shared by all tests, and
+    the SRF IDs of a batch are matched against patients with a single query.
+    """
+    locations = ExternalTestLocations()
+    errors = []
+    with transaction.atomic():
+        for batch in batched(samples, settings.EXTERNAL_TEST_IMPORT_BATCH_SIZE):
+            tests = validate_external_tests(batch, district_name, locations, errors)
+            if not errors:
+                create_external_tests(tests)
+        if errors:
+            transaction.set_rollback(True)
+    return errors
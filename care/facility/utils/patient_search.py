@@ -0,0 +1,109 @@
+import re
+import unicodedata
+from datetime import date
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils import timezone
+
+# the range of years of birth searched around the age of a patient
+AGE_SEARCH_RANGE = 5
+
+# the number of digits of a phone number after its country code, and the
+# country code of numbers searched without one
+NATIONAL_NUMBER_LENGTH = 10
+DEFAULT_COUNTRY_CODE = "91"
+# the most digits a phone number has, as per E.164
+MAX_PHONE_NUMBER_LENGTH = 15
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalizes a name for search by case folding it and dropping
+    punctuation and repeated whitespace. Letters, combining marks and digits
+    of any script are kept.
+    """
+    words = (
+        "".join(
+            char for char in word if unicodedata.category(char)[0] in ("L", "M", "N")
+        )
+        for word in unicodedata.normalize("NFKC", name).casefold().split()
+    )
+    return " ".join(word for word in words if word)
+
+
+def normalize_phone_number(phone_number: str) -> str:
+    """
+    Normalizes a phone number for search by keeping only its digits.
+    """
+    return re.sub(r"\D", "", phone_number)
+
+
+def get_phone_number_variants(phone_number: str) -> set[str]:
+    """
+    Returns the normalized numbers a phone number is matched against: the
+    number as given, and its national number with and without the default
+    country code.
+    """
+    digits = normalize_phone_number(phone_number)
+    national_number = digits[-NATIONAL_NUMBER_LENGTH:]
+    return {digits, national_number, DEFAULT_COUNTRY_CODE + national_number}
+
+
+def set_similarity_threshold(threshold: float) -> None:
+    """
+    Sets the similarity threshold of the trigram `%` operator for the rest of
+    the current transaction.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+            [str(threshold)],
+        )
+
+
+def search_patients(
+    queryset: QuerySet,
+    name: str | None = None,
+    phone_number: str | None = None,
+    year_of_birth: int | None = None,
+    date_of_birth: date | None = None,
+    age: int | None = None,
+) -> QuerySet:
+    """
+    Searches the patients of `queryset`.
+
+    The phone number, year of birth, date of birth and age narrow down the
+    candidates, after which the candidates whose names are similar to `name`
+    are ranked by similarity. The phone number only matches whole numbers,
+    with or without the country code.
+
+    Names are matched with the trigram `%` operator on the normalized name,
+    which can use its trigram index, with `PATIENT_SEARCH_SIMILARITY_THRESHOLD`
+    set as its threshold for the current transaction.
+    """
+    if phone_number:
+        queryset = queryset.filter(
+            search_phone_number__in=get_phone_number_variants(phone_number)
+        )
+    if year_of_birth:
+        queryset = queryset.filter(year_of_birth=year_of_birth)
+    if date_of_birth:
+        queryset = queryset.filter(date_of_birth=date_of_birth)
+    if age:
+        year_of_birth = timezone.now().year - age
+        queryset = queryset.filter(
+            year_of_birth__gte=year_of_birth - AGE_SEARCH_RANGE,
+            year_of_birth__lte=year_of_birth + AGE_SEARCH_RANGE,
+        )
+
+    if name and (name := normalize_name(name)):
+        set_similarity_threshold(settings.PATIENT_SEARCH_SIMILARITY_THRESHOLD)
+        queryset = (
+            queryset.filter(search_name__trigram_similar=name)
+            .annotate(similarity=TrigramSimilarity("search_name", name))
+            .order_by("-similarity", "id")
+        )
+    return queryset
@@ -0,0 +1,40 @@
+from django.db.models import Case, F, OuterRef, Q, Subquery, When
+
+from care.facility.models import PatientConsultation, PatientRegistration
+
+
+def last_consultation_value(expression):
+    """
+    Returns an expression for `expression` evaluated on the last consultation
+    of the patient.
+    """
+    return Subquery(
+        PatientConsultation.objects.filter(id=OuterRef("last_consultation_id"))
+        .annotate(value=expression)
+        .values("value")[:1]
+    )
+
+
+def update_patient_consultation_state(patients: Q) -> int:
+    """
+    Updates the fields of the patients matching `patients` that are
+    denormalized from their last consultation, with a single query:
+
+    - `effective_category`, the category of the last daily round of the
+      consultation or the category of the consultation if it has no rounds
+    - `current_bed_type` and `current_location`, of the current bed of the
+      consultation
+    """
+    return PatientRegistration.objects.filter(patients).update(
+        effective_category=last_consultation_value(
+            Case(
+                When(
+                    last_daily_round__isnull=False,
+                    then=F("last_daily_round__patient_category"),
+                ),
+                default=F("category"),
+            )
+        ),
+        current_bed_type=last_consultation_value(F("current_bed__bed__bed_type")),
+        current_location=last_consultation_value(F("current_bed__bed__location_id")),
+    )
@@ -30,7 +30,7 @@ from care.facility.models.icd11_diagnosis import (
     ACTIVE_CONDITION_VERIFICATION_STATUSES,
     ConditionVerificationStatus,
 )
-from care.facility.static_data.icd11 import get_icd11_diagnosis_object_by_id
+from care.facility.static_data.icd11 import get_icd11_diagnoses_objects_by_ids
 
 logger = logging.getLogger(__name__)
 
@@ -67,17 +67,21 @@ def get_diagnoses_data(consultation: PatientConsultation):
     )
 
     # retrieve diagnosis objects
-    diagnoses = []
-    for entry in entries:
-        diagnose = get_icd11_diagnosis_object_by_id(entry[0])
-        if diagnose:
-            diagnoses.append(diagnose)
+    diagnoses = {
+        diagnosis["id"]: diagnosis
+        for diagnosis in get_icd11_diagnoses_objects_by_ids(
+            [entry[0] for entry in entries]
+        )
+    }
     principal, unconfirmed, provisional, differential, confirmed = [], [], [], [], []
 
-    for diagnosis, record in zip(diagnoses, entries, strict=False):
-        _, verification_status, is_principal = record
-
-        diagnosis.verification_status = verification_status
+    for diagnosis_id, verification_status, is_principal in entries:
+        if diagnosis_id not in diagnoses:
+            continue
+        diagnosis = {
+            **diagnoses[diagnosis_id],
+            "verification_status": verification_status,
+        }
 
         if is_principal:
             principal.append(diagnosis)
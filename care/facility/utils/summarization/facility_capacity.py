@@ -1,11 +1,15 @@
-from django.db.models import Sum
+from collections import defaultdict
+
+from django.db.models import Count, Q, QuerySet, Sum
 from django.utils.timezone import localtime, now
 
 from care.facility.api.serializers.facility import FacilitySerializer
 from care.facility.api.serializers.facility_capacity import FacilityCapacitySerializer
 from care.facility.models import (
+    Bed,
     Facility,
     FacilityCapacity,
+    FacilityFlag,
     FacilityRelatedSummary,
     PatientRegistration,
 )
@@ -14,108 +18,175 @@ from care.facility.models.inventory import (
     FacilityInventoryLog,
     FacilityInventorySummary,
 )
+from care.facility.utils.summarization.store import save_summaries
 
 
-def facility_capacity_summary():
-    capacity_objects = FacilityCapacity.objects.all()
-    capacity_summary = {}
-    current_date = localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0)
+class FacilitySummarySerializer(FacilitySerializer):
+    """
+    Reads the per facility counts and flags from the serializer context, which
+    are computed for all facilities at once by `facility_capacity_summary`.
+    """
 
-    for facility_obj in Facility.objects.all():
-        # Calculate Actual Patients Discharged and Live in this Facility
-        patients_in_facility = PatientRegistration.objects.filter(
-            facility_id=facility_obj.id
-        ).select_related("state", "district", "local_body")
-        capacity_summary[facility_obj.id] = FacilitySerializer(facility_obj).data
-        capacity_summary[facility_obj.id]["features"] = list(
-            capacity_summary[facility_obj.id]["features"]
-        )
-        capacity_summary[facility_obj.id]["actual_live_patients"] = (
-            patients_in_facility.filter(is_active=True).count()
+    def get_bed_count(self, facility):
+        return self.context["bed_counts"].get(facility.id, 0)
+
+    def get_patient_count(self, facility):
+        return self.context["patient_counts"].get(facility.id, {}).get("live", 0)
+
+    def get_facility_flags(self, facility):
+        return self.context["facility_flags"].get(facility.id, ())
+
+
+def for_facilities(queryset: QuerySet, facility_ids: set[int] | None) -> QuerySet:
+    if facility_ids is None:
+        return queryset
+    return queryset.filter(facility_id__in=facility_ids)
+
+
+def get_patient_counts(
+    facility_ids: set[int] | None = None,
+) -> dict[int, dict[str, int]]:
+    return {
+        row["facility_id"]: row
+        for row in for_facilities(
+            PatientRegistration.objects.filter(facility__isnull=False), facility_ids
         )
-        discharge_patients = patients_in_facility.filter(is_active=False)
-        capacity_summary[facility_obj.id]["actual_discharged_patients"] = (
-            discharge_patients.count()
+        .order_by()
+        .values("facility_id")
+        .annotate(
+            live=Count("id", filter=Q(is_active=True)),
+            discharged=Count("id", filter=Q(is_active=False)),
         )
-        capacity_summary[facility_obj.id]["availability"] = []
+    }
+
+
+def get_bed_counts(facility_ids: set[int] | None = None) -> dict[int, int]:
+    return dict(
+        for_facilities(Bed.objects.all(), facility_ids)
+        .order_by()
+        .values("facility_id")
+        .annotate(count=Count("id"))
+        .values_list("facility_id", "count")
+    )
+
+
+def get_facility_flags(
+    facility_ids: set[int] | None = None,
+) -> dict[int, tuple[str, ...]]:
+    flags = defaultdict(list)
+    for facility_id, flag in for_facilities(
+        FacilityFlag.objects.all(), facility_ids
+    ).values_list("facility_id", "flag"):
+        flags[facility_id].append(flag)
+    return {facility_id: tuple(values) for facility_id, values in flags.items()}
 
-        temp_inventory_summary_obj = {}
-        summary_objs = FacilityInventorySummary.objects.filter(
-            facility_id=facility_obj.id
+
+def get_inventory_summaries(
+    current_date, facility_ids: set[int] | None = None
+) -> dict[int, dict]:
+    """
+    Summarises the inventory of every facility for the current day, with the
+    stock movements of the day aggregated per facility and item.
+    """
+    burn_rates = {
+        (facility_id, item_id): burn_rate
+        for facility_id, item_id, burn_rate in for_facilities(
+            FacilityInventoryBurnRate.objects.all(), facility_ids
+        ).values_list("facility_id", "item_id", "burn_rate")
+    }
+
+    logs = for_facilities(
+        FacilityInventoryLog.objects.filter(
+            created_date__gte=current_date, probable_accident=False
+        ),
+        facility_ids,
+    ).order_by()
+    movements = {
+        (row["facility_id"], row["item_id"]): row
+        for row in logs.values("facility_id", "item_id").annotate(
+            total_consumed=Sum("quantity_in_default_unit", filter=Q(is_incoming=False)),
+            total_added=Sum("quantity_in_default_unit", filter=Q(is_incoming=True)),
         )
-        for summary_obj in summary_objs:
-            burn_rate = FacilityInventoryBurnRate.objects.filter(
-                facility_id=facility_obj.id, item_id=summary_obj.item.id
-            ).first()
-            log_query = FacilityInventoryLog.objects.filter(
-                facility_id=facility_obj.id,
-                item_id=summary_obj.item.id,
-                created_date__gte=current_date,
-                probable_accident=False,
-            )
-            end_log = log_query.order_by("-created_date").first()
-            end_stock = summary_obj.quantity
-            if end_log:
-                end_stock = end_log.current_stock
-            total_consumed = 0
-            temp1 = log_query.filter(is_incoming=False).aggregate(
-                Sum("quantity_in_default_unit")
-            )
-            if temp1:
-                total_consumed = temp1.get("quantity_in_default_unit__sum", 0) or 0
-            total_added = 0
-            temp2 = log_query.filter(is_incoming=True).aggregate(
-                Sum("quantity_in_default_unit")
-            )
-            if temp2:
-                total_added = temp2.get("quantity_in_default_unit__sum", 0) or 0
-
-            start_stock = end_stock - total_added + total_consumed
-
-            if burn_rate:
-                burn_rate = burn_rate.burn_rate
-            temp_inventory_summary_obj[summary_obj.item.id] = {
-                "item_name": summary_obj.item.name,
-                "stock": summary_obj.quantity,
-                "unit": summary_obj.item.default_unit.name,
-                "is_low": summary_obj.is_low,
-                "burn_rate": burn_rate,
-                "start_stock": start_stock,
-                "end_stock": end_stock,
-                "total_consumed": total_consumed,
-                "total_added": total_added,
-                "modified_date": summary_obj.modified_date.astimezone().isoformat(),
-            }
-        capacity_summary[facility_obj.id]["inventory"] = temp_inventory_summary_obj
-
-    for capacity_object in capacity_objects:
-        facility_id = capacity_object.facility_id
-        if facility_id not in capacity_summary:
-            # This facility is either deleted or not active
-            continue
-        if "availability" not in capacity_summary[facility_id]:
-            capacity_summary[facility_id]["availability"] = []
-        capacity_summary[facility_id]["availability"].append(
+    }
+    end_stocks = {
+        (facility_id, item_id): current_stock
+        for facility_id, item_id, current_stock in logs.order_by(
+            "facility_id", "item_id", "-created_date"
+        )
+        .distinct("facility_id", "item_id")
+        .values_list("facility_id", "item_id", "current_stock")
+    }
+
+    inventory = defaultdict(dict)
+    for summary_obj in for_facilities(
+        FacilityInventorySummary.objects.filter(item__isnull=False), facility_ids
+    ).select_related("item__default_unit"):
+        key = (summary_obj.facility_id, summary_obj.item_id)
+        movement = movements.get(key, {})
+        end_stock = end_stocks.get(key, summary_obj.quantity)
+        total_consumed = movement.get("total_consumed") or 0
+        total_added = movement.get("total_added") or 0
+        default_unit = summary_obj.item.default_unit
+
+        inventory[summary_obj.facility_id][summary_obj.item_id] = {
+            "item_name": summary_obj.item.name,
+            "stock": summary_obj.quantity,
+            "unit": default_unit.name if default_unit else None,
+            "is_low": summary_obj.is_low,
+            "burn_rate": burn_rates.get(key),
+            "start_stock": end_stock - total_added + total_consumed,
+            "end_stock": end_stock,
+            "total_consumed": total_consumed,
+            "total_added": total_added,
+            "modified_date": summary_obj.modified_date.astimezone().isoformat(),
+        }
+    return inventory
+
+
+def get_capacity_availability(facility_ids: set[int] | None = None) -> dict[int, list]:
+    availability = defaultdict(list)
+    for capacity_object in for_facilities(FacilityCapacity.objects.all(), facility_ids):
+        availability[capacity_object.facility_id].append(
             FacilityCapacitySerializer(capacity_object).data
         )
+    return availability
+
+
+def facility_capacity_summary(facility_ids: set[int] | None = None):
+    """
+    Summarizes the capacity of the given facilities, or of all facilities
+    when none are given.
+    """
+    current_date = localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    patient_counts = get_patient_counts(facility_ids)
+    inventory = get_inventory_summaries(current_date, facility_ids)
+    availability = get_capacity_availability(facility_ids)
+    context = {
+        "patient_counts": patient_counts,
+        "bed_counts": get_bed_counts(facility_ids),
+        "facility_flags": get_facility_flags(facility_ids),
+    }
+
+    facilities = Facility.objects.select_related(
+        "ward", "local_body", "district", "state"
+    )
+    if facility_ids is not None:
+        facilities = facilities.filter(id__in=facility_ids)
+
+    capacity_summary = {}
+    for facility_obj in facilities:
+        summary = FacilitySummarySerializer(facility_obj, context=context).data
+        summary["features"] = list(summary["features"] or [])
+        counts = patient_counts.get(facility_obj.id, {})
+        summary["actual_live_patients"] = counts.get("live", 0)
+        summary["actual_discharged_patients"] = counts.get("discharged", 0)
+        summary["availability"] = availability.get(facility_obj.id, [])
+        summary["inventory"] = inventory.get(facility_obj.id, {})
+        capacity_summary[facility_obj.id] = summary
 
-    for i in capacity_summary:
-        facility_summary_obj = None
-        if FacilityRelatedSummary.objects.filter(
-            s_type="FacilityCapacity",
-            facility_id=i,
-            created_date__gte=current_date,
-        ).exists():
-            facility_summary_obj = FacilityRelatedSummary.objects.get(
-                s_type="FacilityCapacity",
-                facility_id=i,
-                created_date__gte=current_date,
-            )
-        else:
-            facility_summary_obj = FacilityRelatedSummary(
-                s_type="FacilityCapacity", facility_id=i
-            )
-        facility_summary_obj.data = capacity_summary[i]
-        facility_summary_obj.save()
+    save_summaries(
+        FacilityRelatedSummary, "FacilityCapacity", capacity_summary, current_date
+    )
 
     return True
@@ -1,103 +1,75 @@
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils.timezone import now
 
 from care.facility.models import Facility, FacilityRelatedSummary, PatientRegistration
 from care.facility.models.patient_base import BedTypeChoices
+from care.facility.utils.summarization.store import save_summaries
 
+ACTIVE_PATIENTS = Q(is_active=True, last_consultation__discharge_date__isnull=True)
 
-def patient_summary():
-    facility_objects = Facility.objects.all()
-    patient_summary = {}
-    for facility_object in facility_objects:
-        facility_id = facility_object.id
-        if facility_id not in patient_summary:
-            patient_summary[facility_id] = {
-                "facility_name": facility_object.name,
-                "district": facility_object.district.name,
-                "facility_external_id": str(facility_object.external_id),
-            }
 
-            patients = PatientRegistration.objects.filter(
-                is_active=True,
-                last_consultation__discharge_date__isnull=True,
-                last_consultation__facility=facility_object,
-            )
-
-            # Get Total Counts
-
-            for bed_type_choice in BedTypeChoices:
-                db_value, text = bed_type_choice
-                patient_filters = {
-                    "last_consultation__" + "current_bed__bed__bed_type": db_value
-                }
-                count = patients.filter(**patient_filters).count()
-                clean_name = "total_patients_" + "_".join(text.lower().split())
-                patient_summary[facility_id][clean_name] = count
-
-            home_quarantine = Q(last_consultation__suggestion="HI")
-
-            total_patients_home_quarantine = patients.filter(home_quarantine).count()
-            patient_summary[facility_id]["total_patients_home_quarantine"] = (
-                total_patients_home_quarantine
-            )
-
-            # Apply Date Filters
-
-            patients_today = patients.filter(
-                last_consultation__created_date__startswith=now().date()
+def patient_count_annotations(condition: Q | None = None) -> dict[str, Count]:
+    """
+    Returns the conditional counts of patients by bed type and home quarantine,
+    in total and for consultations created today, keyed by their summary name.
+    """
+    condition = condition or Q()
+    periods = {
+        "total": Q(),
+        "today": Q(last_consultation__created_date__startswith=now().date()),
+    }
+    annotations = {}
+    for prefix, period in periods.items():
+        for db_value, text in BedTypeChoices:
+            clean_name = f"{prefix}_patients_" + "_".join(text.lower().split())
+            annotations[clean_name] = Count(
+                "id",
+                filter=condition
+                & period
+                & Q(last_consultation__current_bed__bed__bed_type=db_value),
             )
+        annotations[f"{prefix}_patients_home_quarantine"] = Count(
+            "id", filter=condition & period & Q(last_consultation__suggestion="HI")
+        )
+    return annotations
 
-            # Get Todays Counts
 
-            today_patients_home_quarantine = patients_today.filter(
-                home_quarantine
-            ).count()
+def patient_summary(facility_ids: set[int] | None = None):
+    """
+    Summarizes the patients of the given facilities, or of all facilities
+    when none are given.
+    """
+    patients = PatientRegistration.objects.filter(
+        ACTIVE_PATIENTS, last_consultation__facility__isnull=False
+    )
+    facilities = Facility.objects.select_related("district")
+    if facility_ids is not None:
+        patients = patients.filter(last_consultation__facility_id__in=facility_ids)
+        facilities = facilities.filter(id__in=facility_ids)
 
-            for bed_type_choice in BedTypeChoices:
-                db_value, text = bed_type_choice
-                patient_filters = {
-                    "last_consultation__" + "current_bed__bed__bed_type": db_value
-                }
-                count = patients_today.filter(**patient_filters).count()
-                clean_name = "today_patients_" + "_".join(text.lower().split())
-                patient_summary[facility_id][clean_name] = count
+    counts = {
+        row.pop("last_consultation__facility_id"): row
+        for row in patients.order_by()
+        .values("last_consultation__facility_id")
+        .annotate(**patient_count_annotations())
+    }
+    empty_counts = dict.fromkeys(patient_count_annotations(), 0)
 
-            # Update Anything Extra
-            patient_summary[facility_id]["today_patients_home_quarantine"] = (
-                today_patients_home_quarantine
-            )
+    patient_summary = {
+        facility_object.id: {
+            "facility_name": facility_object.name,
+            "district": facility_object.district.name,
+            "facility_external_id": str(facility_object.external_id),
+            **counts.get(facility_object.id, empty_counts),
+        }
+        for facility_object in facilities
+    }
 
-    for i in list(patient_summary.keys()):
-        object_filter = Q(s_type="PatientSummary") & Q(
-            created_date__startswith=now().date()
-        )
-        if (
-            FacilityRelatedSummary.objects.filter(facility_id=i)
-            .filter(object_filter)
-            .exists()
-        ):
-            facility = FacilityRelatedSummary.objects.filter(object_filter).get(
-                facility_id=i
-            )
-            facility.created_date = now()
-            facility.data.pop("modified_date")
-            if facility.data != patient_summary[i]:
-                facility.data = patient_summary[i]
-                latest_modification_date = now()
-                facility.data.update(
-                    {
-                        "modified_date": latest_modification_date.strftime(
-                            "%d-%m-%Y %H:%M"
-                        )
-                    }
-                )
-                facility.save()
-        else:
-            modified_date = now()
-            patient_summary[i].update(
-                {"modified_date": modified_date.strftime("%d-%m-%Y %H:%M")}
-            )
-            FacilityRelatedSummary(
-                s_type="PatientSummary", facility_id=i, data=patient_summary[i]
-            ).save()
+    save_summaries(
+        FacilityRelatedSummary,
+        "PatientSummary",
+        patient_summary,
+        now().replace(hour=0, minute=0, second=0, microsecond=0),
+        stamp_changes=True,
+    )
     return True
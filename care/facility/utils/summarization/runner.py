@@ -0,0 +1,36 @@
+import logging
+from collections.abc import Callable
+from time import perf_counter
+from typing import NamedTuple
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class SummarizationRun(NamedTuple):
+    name: str
+    duration: float
+    queries: int
+
+
+def run_summarization(name: str, summarize: Callable[[], object]) -> SummarizationRun:
+    """
+    Runs a summarization, and logs how long it took and how many queries it
+    made so that the expensive summaries can be told apart.
+    """
+    queries = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    start = perf_counter()
+    with connection.execute_wrapper(count_queries):
+        summarize()
+    run = SummarizationRun(name, perf_counter() - start, queries)
+    logger.info(
+        "Summarized %s in %.3fs with %d queries", run.name, run.duration, run.queries
+    )
+    return run
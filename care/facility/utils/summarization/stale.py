@@ -0,0 +1,130 @@
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+from django.db import transaction
+from django.utils.timezone import now
+
+from care.facility.models import (
+    DistrictScopedSummary,
+    Facility,
+    FacilityRelatedSummary,
+    PatientRegistration,
+    StaleFacilitySummary,
+)
+from care.users.models import District
+
+# summaries that are recomputed only for the facilities that changed, the
+# district summary being recomputed for their districts
+INCREMENTAL_SUMMARY_TYPES = (
+    "FacilityCapacity",
+    "PatientSummary",
+    "TestSummary",
+    "DistrictPatientSummary",
+)
+
+
+def mark_facilities_stale(facility_ids: Iterable[int | None]):
+    """
+    Marks the incremental summaries of the facilities as out of date once the
+    current transaction commits, so that the summarization reading the marks
+    also sees the changes that caused them.
+    """
+    facility_ids = {facility_id for facility_id in facility_ids if facility_id}
+    if not facility_ids:
+        return
+
+    # marking an already stale facility again moves its mark forward, so a
+    # run that read the earlier mark leaves it in place
+    transaction.on_commit(
+        lambda: StaleFacilitySummary.objects.bulk_create(
+            [
+                StaleFacilitySummary(facility_id=facility_id, s_type=s_type)
+                for facility_id in facility_ids
+                for s_type in INCREMENTAL_SUMMARY_TYPES
+            ],
+            update_conflicts=True,
+            unique_fields=["s_type", "facility"],
+            update_fields=["marked_at"],
+        )
+    )
+
+
+@contextmanager
+def read_stale_marks(s_type: str) -> Iterator[set[int]]:
+    """
+    Yields the facilities marked stale for the given summary type, and clears
+    the marks that were read in the same transaction as the summaries are
+    saved in the block, so if the summarization fails the facilities are
+    summarized again by the next run. Marks made in the meantime are kept
+    for it.
+    """
+    read_at = now()
+    marks = list(
+        StaleFacilitySummary.objects.filter(
+            s_type=s_type, marked_at__lte=read_at
+        ).values_list("id", "facility_id")
+    )
+    with transaction.atomic():
+        yield {facility_id for _, facility_id in marks}
+        StaleFacilitySummary.objects.filter(
+            id__in=[mark_id for mark_id, _ in marks], marked_at__lte=read_at
+        ).delete()
+
+
+def summarize_stale_facilities(
+    s_type: str,
+    summarized_since: datetime,
+    summarize: Callable[[set[int]], object],
+):
+    """
+    Summarizes the facilities whose summary of the given type is out of date,
+    or missing since `summarized_since`.
+    """
+    with read_stale_marks(s_type) as facility_ids:
+        # facilities without a summary for the current period, which makes
+        # the first run of each day a full pass
+        facility_ids.update(
+            Facility.objects.exclude(
+                id__in=FacilityRelatedSummary.objects.filter(
+                    s_type=s_type,
+                    facility__isnull=False,
+                    created_date__gte=summarized_since,
+                ).values("facility_id")
+            ).values_list("id", flat=True)
+        )
+        summarize(facility_ids)
+
+
+def summarize_stale_districts(
+    summarized_since: datetime, summarize: Callable[[set[int]], object]
+):
+    """
+    Summarizes the patients of the districts of the facilities that changed,
+    and of the districts their patients live in, along with the districts
+    without a summary since `summarized_since`.
+    """
+    with read_stale_marks("DistrictPatientSummary") as facility_ids:
+        district_ids = set(
+            Facility.objects.filter(id__in=facility_ids).values_list(
+                "district_id", flat=True
+            )
+        )
+        district_ids.update(
+            PatientRegistration.objects.filter(
+                facility_id__in=facility_ids, local_body__isnull=False
+            )
+            .order_by()
+            .values_list("local_body__district_id", flat=True)
+            .distinct()
+        )
+        district_ids.update(
+            District.objects.exclude(
+                id__in=DistrictScopedSummary.objects.filter(
+                    s_type="PatientSummary",
+                    district__isnull=False,
+                    created_date__gte=summarized_since,
+                ).values("district_id")
+            ).values_list("id", flat=True)
+        )
+        summarize(district_ids)
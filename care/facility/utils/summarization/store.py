@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from django.db.models import Model
+from django.utils.timezone import now
+
+SUMMARY_BATCH_SIZE = 1000
+
+
+def save_summaries(
+    model: type[Model],
+    s_type: str,
+    summaries: dict[int, dict],
+    since: datetime,
+    scope_field: str = "facility_id",
+    *,
+    stamp_changes: bool = False,
+):
+    """
+    Saves the summaries of the given type, keyed by their scope (eg. facility),
+    in bulk. The summary of a scope created since `since` is updated, or a new
+    one created if there is none.
+
+    With `stamp_changes`, summaries keep the time their data last changed in
+    their data as `modified_date`, and those whose data is unchanged are left
+    as they are.
+    """
+    # the first summary of a scope in the period is the one kept up to date
+    existing = {
+        getattr(summary, scope_field): summary
+        for summary in model.objects.filter(
+            s_type=s_type,
+            created_date__gte=since,
+            **{f"{scope_field}__in": summaries.keys()},
+        ).order_by("-id")
+    }
+    current_time = now()
+    modified_date = current_time.strftime("%d-%m-%Y %H:%M")
+    to_update, to_create = [], []
+    for scope_id, scope_data in summaries.items():
+        summary = existing.get(scope_id)
+        data = scope_data
+        if stamp_changes:
+            if summary is not None:
+                summary.data.pop("modified_date", None)
+                if summary.data == data:
+                    continue
+                summary.created_date = current_time
+            data = {**data, "modified_date": modified_date}
+
+        if summary is None:
+            to_create.append(model(s_type=s_type, data=data, **{scope_field: scope_id}))
+        else:
+            summary.data = data
+            summary.modified_date = current_time
+            to_update.append(summary)
+
+    model.objects.bulk_update(
+        to_update,
+        ["data", "created_date", "modified_date"],
+        batch_size=SUMMARY_BATCH_SIZE,
+    )
+    model.objects.bulk_create(to_create, batch_size=SUMMARY_BATCH_SIZE)
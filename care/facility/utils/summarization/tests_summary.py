@@ -1,64 +1,71 @@
-from django.core.exceptions import ObjectDoesNotExist
-from django.utils import timezone
+from django.db.models import Count, Q
+from django.utils.timezone import now
 
-from care.facility.models import Facility, FacilityRelatedSummary, PatientSample
+from care.facility.models import (
+    Facility,
+    FacilityRelatedSummary,
+    PatientConsultation,
+    PatientSample,
+)
+from care.facility.utils.summarization.store import save_summaries
 
+SAMPLE_RESULT_COUNTS = {
+    "result_positive": "POSITIVE",
+    "result_awaited": "AWAITING",
+    "result_negative": "NEGATIVE",
+    "test_discarded": "INVALID",
+}
 
-def tests_summary():
-    facilities = Facility.objects.all()
-    for facility in facilities:
-        facility_total_patients_count = (
-            facility.consultations.all().distinct("patient_id").count()
-        )
-        facility_patients_samples = PatientSample.objects.filter(
-            consultation__facility_id=facility.id
+
+def tests_summary(facility_ids: set[int] | None = None):
+    """
+    Summarizes the patients and samples tested by the given facilities, or by
+    all facilities when none are given.
+    """
+    consultations = PatientConsultation.objects.all()
+    samples = PatientSample.objects.all()
+    facilities = Facility.objects.select_related("district")
+    if facility_ids is not None:
+        consultations = consultations.filter(facility_id__in=facility_ids)
+        samples = samples.filter(consultation__facility_id__in=facility_ids)
+        facilities = facilities.filter(id__in=facility_ids)
+
+    patient_counts = dict(
+        consultations.order_by()
+        .values("facility_id")
+        .annotate(total_patients=Count("patient_id", distinct=True))
+        .values_list("facility_id", "total_patients")
+    )
+    sample_counts = {
+        row.pop("consultation__facility_id"): row
+        for row in samples.order_by()
+        .values("consultation__facility_id")
+        .annotate(
+            total_tests=Count("id"),
+            **{
+                name: Count(
+                    "id", filter=Q(result=PatientSample.SAMPLE_TEST_RESULT_MAP[result])
+                )
+                for name, result in SAMPLE_RESULT_COUNTS.items()
+            },
         )
-        total_tests_count = facility_patients_samples.count()
-        results_positive_count = facility_patients_samples.filter(
-            result=PatientSample.SAMPLE_TEST_RESULT_MAP["POSITIVE"]
-        ).count()
-        results_awaited_count = facility_patients_samples.filter(
-            result=PatientSample.SAMPLE_TEST_RESULT_MAP["AWAITING"]
-        ).count()
-        results_negative_count = facility_patients_samples.filter(
-            result=PatientSample.SAMPLE_TEST_RESULT_MAP["NEGATIVE"]
-        ).count()
-        test_discarded_count = facility_patients_samples.filter(
-            result=PatientSample.SAMPLE_TEST_RESULT_MAP["INVALID"]
-        ).count()
-        facility_tests_summarised_data = {
+    }
+    empty_sample_counts = dict.fromkeys(["total_tests", *SAMPLE_RESULT_COUNTS], 0)
+
+    tests_summary = {
+        facility.id: {
             "facility_name": facility.name,
             "district": facility.district.name,
-            "total_patients": facility_total_patients_count,
-            "total_tests": total_tests_count,
-            "result_positive": results_positive_count,
-            "result_awaited": results_awaited_count,
-            "result_negative": results_negative_count,
-            "test_discarded": test_discarded_count,
+            "total_patients": patient_counts.get(facility.id, 0),
+            **sample_counts.get(facility.id, empty_sample_counts),
         }
+        for facility in facilities
+    }
 
-        try:
-            facility_test_summary = FacilityRelatedSummary.objects.get(
-                s_type="TestSummary",
-                created_date__startswith=timezone.now().date(),
-                facility=facility,
-            )
-            facility_test_summary.created_date = timezone.now()
-            facility_test_summary.data.pop("modified_date")
-            if facility_test_summary.data != facility_tests_summarised_data:
-                facility_test_summary.data = facility_tests_summarised_data
-                latest_modification_date = timezone.now()
-                facility_test_summary.data["modified_date"] = (
-                    latest_modification_date.strftime("%d-%m-%Y %H:%M")
-                )
-                facility_test_summary.save()
-        except ObjectDoesNotExist:
-            modified_date = timezone.now()
-            facility_tests_summarised_data["modified_date"] = modified_date.strftime(
-                "%d-%m-%Y %H:%M"
-            )
-            FacilityRelatedSummary.objects.create(
-                s_type="TestSummary",
-                facility=facility,
-                data=facility_tests_summarised_data,
-            )
+    save_summaries(
+        FacilityRelatedSummary,
+        "TestSummary",
+        tests_summary,
+        now().replace(hour=0, minute=0, second=0, microsecond=0),
+        stamp_changes=True,
+    )
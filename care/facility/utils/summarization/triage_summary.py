@@ -6,80 +6,50 @@ from care.facility.models import (
     FacilityPatientStatsHistory,
     FacilityRelatedSummary,
 )
+from care.facility.utils.summarization.store import save_summaries
+
+TRIAGE_FIELDS = {
+    "patients_home_quarantine": "num_patients_home_quarantine",
+    "patients_referred": "num_patient_referred",
+    "patients_isolation": "num_patients_isolation",
+    "patients_visited": "num_patients_visited",
+    "patients_confirmed_positive": "num_patient_confirmed_positive",
+}
+
+
+def get_triage_summary(totals: dict) -> dict:
+    total_count = totals["total_count"]
+    summary = {f"total_{name}": totals[f"total_{name}"] for name in TRIAGE_FIELDS}
+    for name in TRIAGE_FIELDS:
+        summary[f"avg_{name}"] = (
+            int(totals[f"total_{name}"] / total_count) if total_count else 0
+        )
+    return summary
 
 
 def triage_summary():
-    facilities = Facility.objects.all()
     current_date = localtime(now()).replace(hour=0, minute=0, second=0, microsecond=0)
-    for facility in facilities:
-        facility_patient_data = FacilityPatientStatsHistory.objects.filter(
-            facility=facility
-        ).aggregate(
-            total_patients_visited=Sum("num_patients_visited"),
-            total_patients_home_quarantine=Sum("num_patients_home_quarantine"),
-            total_patients_isolation=Sum("num_patients_isolation"),
-            total_patients_referred=Sum("num_patient_referred"),
-            total_patients_confirmed_positive=Sum("num_patient_confirmed_positive"),
+    stats = {
+        row.pop("facility_id"): row
+        for row in FacilityPatientStatsHistory.objects.order_by()
+        .values("facility_id")
+        .annotate(
             total_count=Count("id"),
+            **{f"total_{name}": Sum(field) for name, field in TRIAGE_FIELDS.items()},
         )
-        total_count = facility_patient_data.get("total_count", 0)
-        total_patients_home_quarantine = facility_patient_data.get(
-            "total_patients_home_quarantine", 0
-        )
-        total_patients_referred = facility_patient_data.get(
-            "total_patients_referred", 0
-        )
-        total_patients_isolation = facility_patient_data.get(
-            "total_patients_visited", 0
-        )
-        total_patients_visited = facility_patient_data.get(
-            "total_patients_isolation", 0
-        )
-        total_patients_confirmed_positive = facility_patient_data.get(
-            "num_patient_confirmed_positive", 0
-        )
-        if total_count:
-            avg_patients_home_quarantine = int(
-                total_patients_home_quarantine / total_count
-            )
-            avg_patients_referred = int(total_patients_referred / total_count)
-            avg_patients_isolation = int(total_patients_isolation / total_count)
-            avg_patients_visited = int(total_patients_visited / total_count)
-            avg_patients_confirmed_positive = int(
-                total_patients_confirmed_positive / total_count
-            )
-        else:
-            avg_patients_home_quarantine = 0
-            avg_patients_referred = 0
-            avg_patients_isolation = 0
-            avg_patients_visited = 0
-            avg_patients_confirmed_positive = 0
+    }
+    empty_stats = dict.fromkeys(
+        ["total_count", *(f"total_{name}" for name in TRIAGE_FIELDS)], 0
+    )
 
-        facility_triage_summarised_data = {
+    triage_summary = {
+        facility.id: {
             "facility_name": facility.name,
             "district": facility.district.name,
-            "total_patients_home_quarantine": total_patients_home_quarantine,
-            "total_patients_referred": total_patients_referred,
-            "total_patients_isolation": total_patients_isolation,
-            "total_patients_visited": total_patients_visited,
-            "total_patients_confirmed_positive": total_patients_confirmed_positive,
-            "avg_patients_home_quarantine": avg_patients_home_quarantine,
-            "avg_patients_referred": avg_patients_referred,
-            "avg_patients_isolation": avg_patients_isolation,
-            "avg_patients_visited": avg_patients_visited,
-            "avg_patients_confirmed_positive": avg_patients_confirmed_positive,
+            **get_triage_summary(stats.get(facility.id, empty_stats)),
         }
-
-        facility_triage_summary = FacilityRelatedSummary.objects.filter(
-            s_type="TriageSummary", facility=facility, created_date__gte=current_date
-        ).first()
-
-        if facility_triage_summary:
-            facility_triage_summary.data = facility_triage_summarised_data
-        else:
-            facility_triage_summary = FacilityRelatedSummary(
-                s_type="TriageSummary",
-                facility=facility,
-                data=facility_triage_summarised_data,
-            )
-        facility_triage_summary.save()
+        for facility in Facility.objects.select_related("district")
+    }
+    save_summaries(
+        FacilityRelatedSummary, "TriageSummary", triage_summary, current_date
+    )
@@ -0,0 +1,160 @@
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from care.facility.models.vitals import VitalsChunk
+
+# the longest time a chunk spans, which keeps its time deltas small and bounds
+# the readings outside of a range fetched along with the readings in it
+CHUNK_DURATION = timedelta(hours=1)
+
+ONE_MS = timedelta(milliseconds=1)
+
+
+def decode_chunk(chunk: VitalsChunk) -> tuple[list[datetime], list[float]]:
+    times = []
+    taken_at = chunk.start
+    for delta in chunk.time_deltas:
+        taken_at += delta * ONE_MS
+        times.append(taken_at)
+    return times, chunk.values
+
+
+def append_readings(
+    consultation_id: int, asset_id: int | None, vital: str, readings: Iterable
+) -> int:
+    """
+    Appends `(taken_at, value)` readings of a vital to the chunks of a
+    consultation and returns the number of readings stored.
+
+    Storage is append only: readings taken at or before the last stored
+    reading of the vital, such as those resent by a device, are dropped.
+    The last chunk is filled up to `VITALS_CHUNK_SIZE` readings and
+    `CHUNK_DURATION`, and the rest of the readings go into new chunks, so a
+    batch takes a couple of queries whatever its size.
+    """
+    readings = sorted(
+        (taken_at.replace(microsecond=taken_at.microsecond // 1000 * 1000), value)
+        for taken_at, value in readings
+    )
+    with transaction.atomic():
+        last_chunk = (
+            VitalsChunk.objects.select_for_update()
+            .filter(consultation_id=consultation_id, vital=vital)
+            .order_by("-end")
+            .first()
+        )
+        chunk = last_chunk
+        new_chunks = []
+        stored = 0
+        for taken_at, value in readings:
+            if chunk and taken_at <= chunk.end:
+                continue
+            if (
+                chunk is None
+                or len(chunk.values) >= settings.VITALS_CHUNK_SIZE
+                or taken_at - chunk.start >= CHUNK_DURATION
+            ):
+                chunk = VitalsChunk(
+                    consultation_id=consultation_id,
+                    asset_id=asset_id,
+                    vital=vital,
+                    start=taken_at,
+                    end=taken_at,
+                )
+                new_chunks.append(chunk)
+            chunk.time_deltas.append((taken_at - chunk.end) // ONE_MS)
+            chunk.values.append(value)
+            chunk.end = taken_at
+            stored += 1
+
+        if last_chunk and stored > sum(len(c.values) for c in new_chunks):
+            last_chunk.save(update_fields=["end", "time_deltas", "values"])
+        VitalsChunk.objects.bulk_create(new_chunks)
+    return stored
+
+
+def read_readings(
+    consultation_id: int, vital: str, start: datetime, end: datetime
+) -> tuple[list[datetime], list[float]]:
+    """
+    Returns the times and values of the readings of a vital of a consultation
+    taken in `[start, end)`, in the order they were taken.
+    """
+    times = []
+    values = []
+    chunks = VitalsChunk.objects.filter(
+        consultation_id=consultation_id,
+        vital=vital,
+        end__gte=start,
+        start__lt=end,
+    ).order_by("start")
+    for chunk in chunks.iterator():
+        chunk_times, chunk_values = decode_chunk(chunk)
+        first = bisect_left(chunk_times, start)
+        last = bisect_left(chunk_times, end)
+        times.extend(chunk_times[first:last])
+        values.extend(chunk_values[first:last])
+    return times, values
+
+
+# the aggregates of the values of a bucket of readings, in SQL
+BUCKET_AGGREGATES = {
+    "last": "(array_agg(value ORDER BY taken_at DESC))[1]",
+    "min": "min(value)",
+    "max": "max(value)",
+    "mean": "avg(value)",
+}
+
+
+def read_downsampled_readings(
+    consultation_id: int,
+    vitals: list[str],
+    start: datetime,
+    end: datetime,
+    width: timedelta,
+    aggregate: str = "last",
+) -> dict[str, tuple[list[datetime], list[float]]]:
+    """
+    Returns the readings of vitals of a consultation taken in `[start, end)`
+    grouped in buckets of `width` aligned to local midnight, like the buckets
+    of daily round analytics, with the values of each bucket aggregated with
+    last, min, max or mean.
+
+    The chunks are decoded and the buckets aggregated by the database with a
+    single query, so only the buckets are sent over, however many readings
+    fall in them.
+    """
+    origin = timezone.make_aware(datetime(2000, 1, 1))  # noqa: DTZ001
+    table = connection.ops.quote_name(VitalsChunk._meta.db_table)  # noqa: SLF001
+    readings = {vital: ([], []) for vital in vitals}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT vital, date_bin(%s, taken_at, %s) AS bucket,
+                {BUCKET_AGGREGATES[aggregate]}
+            FROM (
+                SELECT chunk.vital, reading.value,
+                    chunk.start + sum(reading.time_delta) OVER (
+                        PARTITION BY chunk.id ORDER BY reading.position
+                    ) * interval '1 millisecond' AS taken_at
+                FROM {table} chunk,
+                    unnest(chunk.time_deltas, chunk.values)
+                    WITH ORDINALITY AS reading(time_delta, value, position)
+                WHERE chunk.consultation_id = %s AND chunk.vital = ANY(%s)
+                    AND chunk."end" >= %s AND chunk.start < %s
+            ) readings
+            WHERE taken_at >= %s AND taken_at < %s
+            GROUP BY vital, bucket
+            ORDER BY vital, bucket
+            """,
+            [width, origin, consultation_id, list(vitals), start, end, start, end],
+        )
+        for vital, bucket, value in cursor:
+            readings[vital][0].append(bucket)
+            readings[vital][1].append(value)
+    return readings
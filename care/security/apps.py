@@ -7,5 +7,4 @@ class SecurityConfig(AppConfig):
     verbose_name = _("Security Management")
 
     def ready(self):
-        # import care.security.signals  # noqa F401
-        pass
+        import care.security.signals  # noqa F401
@@ -1,7 +1,14 @@
 import enum
 from dataclasses import dataclass
 
-from care.security.models import RoleAssociation, RolePermission
+from django.db.models import QuerySet
+
+from care.security.models import RoleAssociation, RoleModel, RolePermission
+from care.users.models import User
+from care.utils.cache.request_cache import get_cached, invalidate_cached
+
+ROLE_PERMISSIONS_CACHE_KEY = "security:role_permissions:{context}"
+USER_ROLES_CACHE_KEY = "security:user_roles:{user_id}:{context}"
 
 
 class PermissionContext(enum.Enum):
@@ -54,27 +61,105 @@ class PermissionController:
                 cls.cache[permission.name] = permission.value
 
     @classmethod
-    def has_permission(cls, user, permission, context, context_id):
-        # TODO : Cache permissions and invalidate when they change
+    def get_role_permissions(cls, context) -> dict:
+        """
+        Returns the slugs of the permissions of `context` granted to each role
+        keyed by role id, and the ids of all roles keyed by name and context.
+        """
+
+        def fetch():
+            permissions = {}
+            for role_id, slug in RolePermission.objects.filter(
+                permission__context=context
+            ).values_list("role_id", "permission__slug"):
+                permissions.setdefault(role_id, set()).add(slug)
+            roles = {
+                (name, role_context): role_id
+                for role_id, name, role_context in RoleModel.objects.values_list(
+                    "id", "name", "context"
+                )
+            }
+            return {"permissions": permissions, "roles": roles}
+
+        return get_cached(ROLE_PERMISSIONS_CACHE_KEY.format(context=context), fetch)
+
+    @classmethod
+    def get_user_roles(cls, user, context) -> list[tuple[int, int]]:
+        """
+        Returns the (context id, role id) pairs of the roles associated with
+        the user in `context`.
+        """
+        return get_cached(
+            USER_ROLES_CACHE_KEY.format(user_id=user.id, context=context),
+            lambda: list(
+                RoleAssociation.objects.filter(user=user, context=context).values_list(
+                    "context_id", "role_id"
+                )
+            ),
+        )
+
+    @classmethod
+    def get_permitted_context_ids(cls, user, permission, context) -> set[int]:
+        """
+        Returns the ids of the objects of `context` on which the roles
+        associated with the user grant `permission`.
+        """
+        permissions = cls.get_role_permissions(context)["permissions"]
+        return {
+            context_id
+            for context_id, role_id in cls.get_user_roles(user, context)
+            if permission in permissions.get(role_id, ())
+        }
+
+    @classmethod
+    def has_user_type_permission(cls, user, permission, context) -> bool:
+        """
+        Returns whether the role mapped from the user type of the user grants
+        `permission` on all objects of `context`.
+        """
         # TODO : Fetch the user role from the previous role management implementation as well.
         #        Need to maintain some sort of mapping from previous generation to new generation of roles
         from care.security.roles.role import RoleController
 
-        mapped_role = RoleController.map_old_role_to_new(user.role)
-        permission_roles = RolePermission.objects.filter(
-            permission__slug=permission, permission__context=context
-        ).values("role_id")
-        if RoleAssociation.objects.filter(
-            context_id=context_id, context=context, role__in=permission_roles, user=user
-        ).exists():
+        mapped_role = RoleController.map_old_role_to_new(
+            User.REVERSE_TYPE_MAP[user.user_type]
+        )
+        role_permissions = cls.get_role_permissions(context)
+        role_id = role_permissions["roles"].get(
+            (mapped_role.name, mapped_role.context.value)
+        )
+        return permission in role_permissions["permissions"].get(role_id, ())
+
+    @classmethod
+    def has_permission(cls, user, permission, context, context_id):
+        if int(context_id) in cls.get_permitted_context_ids(user, permission, context):
             return True
         # Check for old cases
-        return RolePermission.objects.filter(
-            permission__slug=permission,
-            permission__context=context,
-            role__name=mapped_role.name,
-            role__context=mapped_role.context.value,
-        ).exists()
+        return cls.has_user_type_permission(user, permission, context)
+
+    @classmethod
+    def filter_permitted(cls, user, permission, objects):
+        """
+        Returns the objects on which the user has `permission`, resolving the
+        roles of the user once for all of them. `objects` can be a queryset,
+        which is filtered by id, or an iterable of objects.
+        """
+        context = cls.get_permissions()[permission].context.value
+        if cls.has_user_type_permission(user, permission, context):
+            return objects
+        context_ids = cls.get_permitted_context_ids(user, permission, context)
+        if isinstance(objects, QuerySet):
+            return objects.filter(id__in=context_ids)
+        return [obj for obj in objects if obj.id in context_ids]
+
+    @classmethod
+    def invalidate_role_permissions(cls):
+        for context in PermissionContext:
+            invalidate_cached(ROLE_PERMISSIONS_CACHE_KEY.format(context=context.value))
+
+    @classmethod
+    def invalidate_user_roles(cls, user_id, context):
+        invalidate_cached(USER_ROLES_CACHE_KEY.format(user_id=user_id, context=context))
 
     @classmethod
     def get_permissions(cls):
@@ -0,0 +1,41 @@
+from django.db.models.signals import post_delete, post_save
+
+from care.security.models import (
+    PermissionModel,
+    RoleAssociation,
+    RoleModel,
+    RolePermission,
+)
+from care.security.permissions.base import PermissionController
+
+
+def invalidate_role_permissions(sender, instance, **kwargs):
+    PermissionController.invalidate_role_permissions()
+
+
+def invalidate_user_roles(sender, instance, **kwargs):
+    PermissionController.invalidate_user_roles(instance.user_id, instance.context)
+
+
+for model in (PermissionModel, RoleModel, RolePermission):
+    post_save.connect(
+        invalidate_role_permissions,
+        sender=model,
+        dispatch_uid=f"role_permissions_{model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_role_permissions,
+        sender=model,
+        dispatch_uid=f"role_permissions_{model.__name__}",
+    )
+
+post_save.connect(
+    invalidate_user_roles,
+    sender=RoleAssociation,
+    dispatch_uid="user_roles_RoleAssociation",
+)
+post_delete.connect(
+    invalidate_user_roles,
+    sender=RoleAssociation,
+    dispatch_uid="user_roles_RoleAssociation",
+)
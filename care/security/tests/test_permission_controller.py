@@ -0,0 +1,101 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from care.facility.models import Facility
+from care.security.models import (
+    PermissionModel,
+    RoleAssociation,
+    RoleModel,
+    RolePermission,
+)
+from care.security.permissions.base import PermissionContext, PermissionController
+from care.utils.cache.request_cache import RequestCacheMiddleware
+from care.utils.tests.test_utils import TestUtils
+
+FACILITY = PermissionContext.FACILITY.value
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class PermissionControllerTestCase(TestUtils, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.other_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body
+        )
+        cls.user = cls.create_user("nurse", cls.district)
+
+        cls.read_permission = PermissionModel.objects.create(
+            slug="can_read_facility", context=FACILITY
+        )
+        cls.doctor_role = RoleModel.objects.create(name="Doctor", context=FACILITY)
+        cls.staff_role = RoleModel.objects.create(name="Staff", context=FACILITY)
+        RolePermission.objects.create(
+            role=cls.doctor_role, permission=cls.read_permission
+        )
+        cls.association = RoleAssociation.objects.create(
+            user=cls.user,
+            context=FACILITY,
+            context_id=cls.facility.id,
+            role=cls.doctor_role,
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def has_permission(self, facility):
+        return PermissionController.has_permission(
+            self.user, "can_read_facility", FACILITY, facility.id
+        )
+
+    def test_permissions_are_resolved_once(self):
+        def get_response(request):
+            with self.assertNumQueries(3):
+                self.assertTrue(self.has_permission(self.facility))
+                self.assertFalse(self.has_permission(self.other_facility))
+                self.assertEqual(
+                    list(
+                        PermissionController.filter_permitted(
+                            self.user,
+                            "can_read_facility",
+                            [self.facility, self.other_facility],
+                        )
+                    ),
+                    [self.facility],
+                )
+
+        RequestCacheMiddleware(get_response)(RequestFactory().get("/"))
+        with self.assertNumQueries(0):
+            self.assertTrue(self.has_permission(self.facility))
+
+    def test_cache_is_invalidated_when_roles_change(self):
+        facilities = Facility.objects.filter(
+            id__in=[self.facility.id, self.other_facility.id]
+        )
+        self.assertQuerySetEqual(
+            PermissionController.filter_permitted(
+                self.user, "can_read_facility", facilities
+            ),
+            [self.facility],
+        )
+
+        self.association.delete()
+        self.assertFalse(self.has_permission(self.facility))
+
+        RolePermission.objects.create(
+            role=self.staff_role, permission=self.read_permission
+        )
+        self.assertTrue(self.has_permission(self.other_facility))
+        self.assertQuerySetEqual(
+            PermissionController.filter_permitted(
+                self.user, "can_read_facility", facilities
+            ),
+            facilities,
+            ordered=False,
+        )
@@ -12,6 +12,7 @@ from care.users.api.serializers.lsg import (
 )
 from care.users.api.serializers.skill import UserSkillSerializer
 from care.users.models import GENDER_CHOICES, User
+from care.utils.cache.cache_allowed_facilities import invalidate_accessible_facilities
 from care.utils.file_uploads.cover_image import upload_cover_image
 from care.utils.models.validators import (
     cover_image_validator,
@@ -275,6 +276,8 @@ class UserCreateSerializer(SignUpSerializer):
                     for facility in facility_objs
                 ]
                 FacilityUser.objects.bulk_create(facility_user_objs)
+                # bulk_create does not send the signals that invalidate this
+                invalidate_accessible_facilities(user.id)
             return user
 
 
@@ -5,7 +5,11 @@ from django.conf import settings
 from rest_framework import status
 from rest_framework.exceptions import APIException
 
-from care.utils.jwks.token_generator import generate_jwt
+from care.utils.assetintegration.client import (
+    MiddlewareUnavailableError,
+    middleware_request,
+)
+from care.utils.jwks.token_generator import get_cached_jwt
 
 
 class BaseAssetIntegration:
@@ -30,7 +34,7 @@ class BaseAssetIntegration:
 
     def get_headers(self):
         return {
-            "Authorization": (self.auth_header_type + generate_jwt()),
+            "Authorization": (self.auth_header_type + get_cached_jwt()),
             "Accept": "application/json",
         }
 
@@ -48,16 +52,18 @@ class BaseAssetIntegration:
                 {"error": "Invalid Response"}, response.status_code
             ) from e
 
-    def api_post(self, url, data=None):
-        return self._validate_response(
-            requests.post(
-                url, json=data, headers=self.get_headers(), timeout=self.timeout
+    def _request(self, method, url, **kwargs):
+        try:
+            return middleware_request(
+                method, url, headers=self.get_headers(), timeout=self.timeout, **kwargs
             )
-        )
+        except requests.Timeout as e:
+            raise APIException({"error": "Request Timeout"}, 504) from e
+        except MiddlewareUnavailableError as e:
+            raise APIException({"error": "Middleware Unavailable"}, 503) from e
+
+    def api_post(self, url, data=None):
+        return self._validate_response(self._request("POST", url, json=data))
 
     def api_get(self, url, data=None):
-        return self._validate_response(
-            requests.get(
-                url, params=data, headers=self.get_headers(), timeout=self.timeout
-            )
-        )
+        return self._validate_response(self._request("GET", url, params=data))
@@ -0,0 +1,156 @@
+import json
+import logging
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic, perf_counter
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class MiddlewareUnavailableError(requests.ConnectionError):
+    """
+    Raised instead of making a request to a middleware whose recent requests
+    failed, until `MIDDLEWARE_CIRCUIT_BREAKER_TIMEOUT` seconds have passed.
+    """
+
+
+@dataclass
+class MiddlewareHost:
+    session: requests.Session
+    lock: Lock = field(default_factory=Lock)
+    consecutive_failures: int = 0
+    open_until: float = 0
+    requests: int = 0
+    failures: int = 0
+    total_latency: float = 0
+    max_latency: float = 0
+
+    def check_circuit(self, hostname):
+        with self.lock:
+            if self.open_until > monotonic():
+                msg = f"Middleware {hostname} is unavailable"
+                raise MiddlewareUnavailableError(msg)
+
+    def record(self, hostname, latency, failed):
+        with self.lock:
+            self.requests += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            if not failed:
+                self.consecutive_failures = 0
+                return
+            self.failures += 1
+            self.consecutive_failures += 1
+            if (
+                self.consecutive_failures
+                >= settings.MIDDLEWARE_CIRCUIT_BREAKER_THRESHOLD
+            ):
+                # after the timeout a single failed request opens it again
+                self.open_until = (
+                    monotonic() + settings.MIDDLEWARE_CIRCUIT_BREAKER_TIMEOUT
+                )
+                logger.warning(
+                    "Failing requests to middleware %s for %s seconds after %s failures",
+                    hostname,
+                    settings.MIDDLEWARE_CIRCUIT_BREAKER_TIMEOUT,
+                    self.consecutive_failures,
+                )
+
+
+_hosts: dict[str, MiddlewareHost] = {}
+_hosts_lock = Lock()
+
+
+def create_session() -> requests.Session:
+    # connection errors are retried for all methods as nothing was sent, and
+    # gateway errors only for idempotent methods, so camera moves are not
+    # repeated
+    retry = Retry(
+        total=settings.MIDDLEWARE_REQUEST_RETRIES,
+        read=0,
+        status_forcelist=(502, 503, 504),
+        backoff_factor=0.1,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=settings.MIDDLEWARE_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_host(hostname: str) -> MiddlewareHost:
+    with _hosts_lock:
+        if hostname not in _hosts:
+            _hosts[hostname] = MiddlewareHost(session=create_session())
+        return _hosts[hostname]
+
+
+def middleware_request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Makes a request to a middleware through a session shared by all requests
+    to its host in the process, which keeps connections to it alive.
+
+    Requests fail fast with `MiddlewareUnavailableError` for a while after
+    `MIDDLEWARE_CIRCUIT_BREAKER_THRESHOLD` consecutive requests to the host
+    failed to connect, timed out or got a server error.
+    """
+    hostname = urlsplit(url).netloc
+    host = get_host(hostname)
+    host.check_circuit(hostname)
+
+    kwargs.setdefault("timeout", settings.MIDDLEWARE_REQUEST_TIMEOUT)
+    start = perf_counter()
+    try:
+        response = host.session.request(method, url, **kwargs)
+    except requests.RequestException:
+        host.record(hostname, perf_counter() - start, failed=True)
+        raise
+    latency = perf_counter() - start
+    host.record(hostname, latency, failed=response.status_code >= 500)  # noqa: PLR2004
+    logger.debug("%s %s: %s in %.3fs", method, url, response.status_code, latency)
+    return response
+
+
+def get_middleware_stats() -> dict[str, dict]:
+    """
+    Returns the number of requests made to each middleware by this process,
+    how many of them failed, their mean and max latency in seconds and
+    whether requests to it are currently failed fast.
+    """
+    stats = {}
+    with _hosts_lock:
+        hosts = dict(_hosts)
+    for hostname, host in hosts.items():
+        with host.lock:
+            stats[hostname] = {
+                "requests": host.requests,
+                "failures": host.failures,
+                "mean_latency": host.total_latency / host.requests
+                if host.requests
+                else None,
+                "max_latency": host.max_latency,
+                "circuit_open": host.open_until > monotonic(),
+            }
+    return stats
+
+
+def log_middleware_stats() -> None:
+    """
+    Logs the stats of the middleware requests made by this process, one
+    record per host with the stats as JSON and in `extra` for log handlers
+    that keep structured fields.
+    """
+    for hostname, stats in get_middleware_stats().items():
+        logger.info(
+            "Middleware %s stats: %s",
+            hostname,
+            json.dumps(stats),
+            extra={"middleware_hostname": hostname, "middleware_stats": stats},
+        )
@@ -0,0 +1,39 @@
+import logging
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def poll_middlewares[K: Hashable](
+    fetch: Callable[[K], Any], middlewares: Iterable[K]
+) -> dict[K, Any]:
+    """
+    Calls `fetch` for every middleware concurrently, with at most
+    `MIDDLEWARE_POLL_CONCURRENCY` requests in flight, so that unreachable
+    middlewares only hold up a worker each until they time out.
+
+    The result of a middleware is None if `fetch` raised.
+    """
+
+    def safe_fetch(middleware: K):
+        try:
+            return fetch(middleware)
+        except Exception as e:
+            logger.warning("Middleware %s is down: %s", middleware, e)
+            return None
+
+    middlewares = list(middlewares)
+    if not middlewares:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(settings.MIDDLEWARE_POLL_CONCURRENCY, len(middlewares)),
+        thread_name_prefix="middleware-poller",
+    ) as executor:
+        return dict(
+            zip(middlewares, executor.map(safe_fetch, middlewares), strict=True)
+        )
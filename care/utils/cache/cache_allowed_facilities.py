@@ -1,18 +1,21 @@
-from django.core.cache import cache
-
 from care.facility.models.facility import FacilityUser
+from care.utils.cache.request_cache import get_cached, invalidate_cached
+
+
+def get_accessible_facilities_key(user_id) -> str:
+    return f"user_facilities:{user_id}"
 
 
 def get_accessible_facilities(user):
-    user_id = str(user.id)
-    key = "user_facilities:" + user_id
-    hit = cache.get(key)
-    if not hit:
-        facility_ids = list(
-            FacilityUser.objects.filter(user_id=user_id).values_list(
+    return get_cached(
+        get_accessible_facilities_key(user.id),
+        lambda: list(
+            FacilityUser.objects.filter(user_id=user.id).values_list(
                 "facility__id", flat=True
             )
-        )
-        cache.set(key, facility_ids)
-        return facility_ids
-    return hit
+        ),
+    )
+
+
+def invalidate_accessible_facilities(user_id) -> None:
+    invalidate_cached(get_accessible_facilities_key(user_id))
@@ -0,0 +1,67 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class RequestCacheMiddleware:
+    """
+    Provides a cache that lives for the duration of a request, so that values
+    looked up several times while serving a request are only fetched once.
+    """
+
+    thread = threading.local()
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        RequestCacheMiddleware.thread.cache = {}
+        try:
+            return self.get_response(request)
+        finally:
+            RequestCacheMiddleware.thread.cache = None
+
+
+def get_request_cache() -> dict | None:
+    """
+    Returns the cache of the current request, or None outside of a request.
+    """
+    return getattr(RequestCacheMiddleware.thread, "cache", None)
+
+
+def get_cached(key: str, fetch: Callable[[], Any], timeout: int | None = None):
+    """
+    Returns the value cached under `key`, looking it up in the cache of the
+    current request first and in the shared cache next. On a miss, the value
+    is fetched with `fetch` and cached in both for `timeout` seconds
+    (`ACCESS_CACHE_TIMEOUT` by default). `fetch` must not return None.
+    """
+    request_cache = get_request_cache()
+    if request_cache is not None and key in request_cache:
+        return request_cache[key]
+    value = cache.get(key)
+    if value is None:
+        value = fetch()
+        cache.set(
+            key, value, settings.ACCESS_CACHE_TIMEOUT if timeout is None else timeout
+        )
+    if request_cache is not None:
+        request_cache[key] = value
+    return value
+
+
+def invalidate_cached(key: str) -> None:
+    """
+    Removes the value cached under `key` from both caches. The shared cache
+    is cleared again once the current transaction commits, so that a value
+    fetched by a concurrent request before the commit does not outlive it.
+    """
+    request_cache = get_request_cache()
+    if request_cache is not None:
+        request_cache.pop(key, None)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,64 @@
+from functools import cache
+
+import boto3
+from django.conf import settings
+from django.core.cache import cache as django_cache
+
+from care.utils.csp.config import BucketName, BucketType, get_client_config
+
+SIGNED_URL_CACHE_KEY = "signed_url:{bucket_type}:{duration}:{key}"
+
+
+@cache
+def _get_client(config: tuple):
+    return boto3.client("s3", **dict(config))
+
+
+def get_client(bucket_type: BucketType, external=False) -> tuple[object, BucketName]:
+    """
+    Returns an S3 client for the bucket along with its name. Clients are
+    thread safe and expensive to create, so one client is kept per process
+    for each distinct bucket configuration.
+    """
+    config, bucket_name = get_client_config(bucket_type, external=external)
+    return _get_client(tuple(sorted(config.items()))), bucket_name
+
+
+def get_read_signed_urls(
+    keys: list[str], duration: int, bucket_type: BucketType
+) -> dict[str, str]:
+    """
+    Returns presigned read URLs of the objects with the given keys, valid for
+    `duration` seconds, keyed by object key.
+
+    URLs are cached for `SIGNED_URL_CACHE_TIMEOUT` seconds but never for more
+    than half of their validity, so a cached URL is always valid for at least
+    half of `duration`. The cache is looked up and filled once for all keys.
+    """
+    cache_keys = {
+        key: SIGNED_URL_CACHE_KEY.format(
+            bucket_type=bucket_type.value, duration=duration, key=key
+        )
+        for key in keys
+    }
+    cached = django_cache.get_many(cache_keys.values())
+    urls = {
+        key: cached[cache_key]
+        for key, cache_key in cache_keys.items()
+        if cache_key in cached
+    }
+
+    missing = [key for key in keys if key not in urls]
+    if missing:
+        s3, bucket_name = get_client(bucket_type, external=True)
+        for key in missing:
+            urls[key] = s3.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": bucket_name, "Key": key},
+                ExpiresIn=duration,  # seconds
+            )
+        django_cache.set_many(
+            {cache_keys[key]: urls[key] for key in missing},
+            min(settings.SIGNED_URL_CACHE_TIMEOUT, duration // 2),
+        )
+    return urls
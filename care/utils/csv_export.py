@@ -0,0 +1,119 @@
+import csv
+import datetime
+import logging
+from collections.abc import Callable, Iterator
+from typing import IO, Any
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils.text import slugify
+
+logger = logging.getLogger(__name__)
+
+# byte order mark, for the exports to open as UTF-8 in MS Excel
+BOM = "\ufeff"
+
+
+class Echo:
+    """
+    Implements just the write method of a file, returning the value instead of
+    storing it, so that rows can be streamed as they are written.
+    """
+
+    def write(self, value):
+        return value
+
+
+def serialize_value(value) -> str:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class CSVExport:
+    """
+    Exports a values queryset as CSV in chunks of `CSV_EXPORT_CHUNK_SIZE`
+    objects, each fetched after the primary key of the previous chunk, so
+    that memory stays bounded however many rows are exported.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        field_header_map: dict[str, str],
+        field_serializer_map: dict[str, Callable[[Any], Any]] | None = None,
+        filename: str | None = None,
+        prepare_chunk: Callable[[list[dict]], Any] | None = None,
+    ):
+        self.queryset = queryset
+        self.field_header_map = field_header_map
+        self.field_serializer_map = field_serializer_map or {}
+        # called with each chunk before it is serialized, eg. to look up the
+        # values the serializers need for the whole chunk at once
+        self.prepare_chunk = prepare_chunk
+        self.filename = (
+            filename or f"{slugify(queryset.model.__name__)}_export"
+        ) + ".csv"
+        self.fields = [
+            *queryset.query.values_select,
+            *queryset.query.extra_select,
+            *queryset.query.annotation_select,
+        ]
+
+    def iter_chunks(self) -> Iterator[list[dict]]:
+        chunk_size = settings.CSV_EXPORT_CHUNK_SIZE
+        pks = self.queryset.order_by("pk").values_list("pk", flat=True).distinct()
+        last_pk = None
+        while True:
+            chunk_pks = list(
+                (pks if last_pk is None else pks.filter(pk__gt=last_pk))[:chunk_size]
+            )
+            if not chunk_pks:
+                return
+            # related rows of the objects (eg. the doctors of a facility) are
+            # exported along with them
+            yield list(self.queryset.filter(pk__in=chunk_pks).order_by("pk"))
+            last_pk = chunk_pks[-1]
+
+    def serialize_record(self, record: dict) -> dict[str, str]:
+        row = {}
+        for field, value in record.items():
+            if value is None:
+                continue
+            serializer = self.field_serializer_map.get(field, serialize_value)
+            row[field] = str(serializer(value))
+        return row
+
+    def iter_csv(self, file: IO[str]) -> Iterator:
+        writer = csv.DictWriter(file, self.fields, extrasaction="ignore")
+        yield file.write(BOM)
+        yield writer.writerow(
+            {field: self.field_header_map.get(field, field) for field in self.fields}
+        )
+
+        rows = chunks = 0
+        for chunk in self.iter_chunks():
+            chunks += 1
+            rows += len(chunk)
+            if self.prepare_chunk:
+                self.prepare_chunk(chunk)
+            for record in chunk:
+                yield writer.writerow(self.serialize_record(record))
+        logger.info(
+            "Exported %s rows of %s in %s chunks of at most %s objects",
+            rows,
+            self.queryset.model.__name__,
+            chunks,
+            settings.CSV_EXPORT_CHUNK_SIZE,
+        )
+
+    def write(self, file: IO[str]):
+        for _ in self.iter_csv(file):
+            pass
+
+    def streaming_response(self) -> StreamingHttpResponse:
+        response = StreamingHttpResponse(self.iter_csv(Echo()), content_type="text/csv")
+        response["Content-Disposition"] = f"attachment; filename={self.filename};"
+        response["Cache-Control"] = "no-cache"
+        return response
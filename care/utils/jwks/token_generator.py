@@ -1,3 +1,6 @@
+from threading import Lock
+from time import monotonic
+
 from authlib.jose import jwt
 from django.conf import settings
 from django.utils.timezone import now
@@ -16,3 +19,26 @@ def generate_jwt(claims=None, exp=60, jwks=None):
         **claims,
     }
     return jwt.encode(header, payload, jwks).decode("utf-8")
+
+
+# seconds before its expiry after which a cached token is no longer handed out,
+# leaving it time to reach the middleware and be verified
+TOKEN_EXPIRY_MARGIN = 10
+
+_cached_tokens = {}
+_cached_tokens_lock = Lock()
+
+
+def get_cached_jwt(exp=60):
+    """
+    Returns a token signed with `settings.JWKS` without claims, like
+    `generate_jwt`, reusing the last one generated until shortly before it
+    expires rather than signing a token for every request.
+    """
+    key = (id(settings.JWKS), exp)
+    with _cached_tokens_lock:
+        token, expires_at = _cached_tokens.get(key, (None, 0))
+        if monotonic() >= expires_at:
+            token = generate_jwt(exp=exp)
+            _cached_tokens[key] = (token, monotonic() + exp - TOKEN_EXPIRY_MARGIN)
+        return token
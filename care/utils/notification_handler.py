@@ -4,10 +4,11 @@ import logging
 from celery import shared_task
 from django.apps import apps
 from django.conf import settings
-from pywebpush import WebPushException, webpush
+from django.db import transaction
+from django.db.models import Q
 
 from care.facility.models.daily_round import DailyRound
-from care.facility.models.facility import Facility, FacilityUser
+from care.facility.models.facility import Facility
 from care.facility.models.notification import Notification
 from care.facility.models.patient import PatientNotes, PatientRegistration
 from care.facility.models.patient_consultation import PatientConsultation
@@ -18,6 +19,7 @@ from care.facility.models.patient_investigation import (
 from care.facility.models.shifting import ShiftingRequest
 from care.users.models import User
 from care.utils.sms.send_sms import send_sms
+from care.utils.webpush.send_webpush import send_webpush_messages
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +37,37 @@ def notification_task_generator(**kwargs):
 def send_webpush(**kwargs):
     user = User.objects.get(username=kwargs.get("username"))
     message = kwargs.get("message")
-    NotificationGenerator.send_webpush_user(None, user, message)
+    send_webpush_messages([(user, message)])
+
+
+@shared_task
+def send_notification_webpush(notification_ids):
+    notifications = (
+        Notification.objects.filter(id__in=notification_ids)
+        .select_related("intended_for")
+        .only(
+            "external_id",
+            "event",
+            "message",
+            "intended_for__pf_endpoint",
+            "intended_for__pf_p256dh",
+            "intended_for__pf_auth",
+        )
+    )
+    send_webpush_messages(
+        (
+            notification.intended_for,
+            json.dumps(
+                {
+                    "external_id": str(notification.external_id),
+                    "message": notification.message,
+                    "type": Notification.Event(notification.event).name,
+                }
+            ),
+        )
+        for notification in notifications
+        if notification.intended_for
+    )
 
 
 def get_model_class(model_name):
@@ -304,64 +336,32 @@ class NotificationGenerator:
         return True
 
     def generate_system_users(self):
-        users = []
-        extra_users = self.extra_users
-        caused_user = self.caused_by
-        facility_users = FacilityUser.objects.filter(facility_id=self.facility.id)
-        if self.event != Notification.Event.MESSAGE:
-            facility_users.exclude(
-                user__user_type__in=(
-                    User.TYPE_VALUE_MAP["Staff"],
-                    User.TYPE_VALUE_MAP["StaffReadOnly"],
-                )
+        # the users of the facility and the extra users are fetched together,
+        # with only the fields needed to notify them
+        return list(
+            User.objects.filter(
+                Q(facilityuser__facility_id=self.facility.id)
+                | Q(id__in=self.extra_users)
             )
-        for facility_user in facility_users:
-            if facility_user.user.id != caused_user.id:
-                users.append(facility_user.user)
-        for user_id in extra_users:
-            user_obj = User.objects.get(id=user_id)
-            if user_obj.id != caused_user.id:
-                users.append(user_obj)
-        return users
+            .exclude(id=self.caused_by.id)
+            .distinct()
+            .select_related(None)
+            .only("id", "pf_endpoint", "pf_p256dh", "pf_auth")
+        )
 
     def generate_message_for_user(self, user, message, medium):
-        notification = Notification()
-        notification.intended_for = user
-        notification.caused_objects = self.caused_objects
-        notification.message = message
-        notification.medium_sent = medium
-        notification.event = self.event
-        notification.event_type = self.event_type
-        notification.caused_by = self.caused_by
-        notification.save()
-        return notification
+        return Notification(
+            intended_for=user,
+            caused_objects=self.caused_objects,
+            message=message,
+            medium_sent=medium,
+            event=self.event,
+            event_type=self.event_type,
+            caused_by=self.caused_by,
+        )
 
     def send_webpush_user(self, user, message):
-        try:
-            if user.pf_endpoint and user.pf_p256dh and user.pf_auth:
-                webpush(
-                    subscription_info={
-                        "endpoint": user.pf_endpoint,
-                        "keys": {"p256dh": user.pf_p256dh, "auth": user.pf_auth},
-                    },
-                    data=message,
-                    vapid_private_key=settings.VAPID_PRIVATE_KEY,
-                    vapid_claims={
-                        "sub": "mailto:info@ohc.network",
-                    },
-                )
-        except WebPushException as ex:
-            logger.info("Web Push Failed with Exception: %s", repr(ex))
-            if ex.response and ex.response.json():
-                extra = ex.response.json()
-                logger.info(
-                    "Remote service replied with a %s:%s, %s",
-                    extra.code,
-                    extra.errno,
-                    extra.message,
-                )
-        except Exception as e:
-            logger.info("Error When Doing WebPush: %s", e)
+        send_webpush_messages([(user, message)])
 
     def generate(self):
         if not self.worker_initiated:
@@ -379,20 +379,20 @@ class NotificationGenerator:
             elif medium == Notification.Medium.SYSTEM.value:
                 if not self.message:
                     self.message = self.generate_system_message()
-                for user in self.generate_system_users():
-                    notification_obj = self.generate_message_for_user(
-                        user, self.message, Notification.Medium.SYSTEM.value
-                    )
-                    if not self.defer_notifications:
-                        self.send_webpush_user(
-                            user,
-                            json.dumps(
-                                {
-                                    "external_id": str(notification_obj.external_id),
-                                    "message": self.message,
-                                    "type": Notification.Event(
-                                        notification_obj.event
-                                    ).name,
-                                }
-                            ),
+                notifications = Notification.objects.bulk_create(
+                    [
+                        self.generate_message_for_user(
+                            user, self.message, Notification.Medium.SYSTEM.value
                         )
+                        for user in self.generate_system_users()
+                    ]
+                )
+                if notifications and not self.defer_notifications:
+                    notification_ids = [
+                        notification.id for notification in notifications
+                    ]
+                    transaction.on_commit(
+                        lambda ids=notification_ids: send_notification_webpush.delay(
+                            notification_ids=ids
+                        )
+                    )
@@ -0,0 +1,162 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    Cursor,
+    CursorPagination,
+    LimitOffsetPagination,
+)
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination over the `cursor_ordering` of the view, a field and a
+    unique field breaking its ties, eg. ("-created_date", "-id"). Pages are
+    fetched by seeking past the (field, key) position of the cursor instead
+    of skipping `offset` rows, and the rows are not counted.
+
+    Rows without a value for the field are paginated too, ordered as the
+    database orders them, after the rows with a value in ascending order and
+    before them in descending order.
+    """
+
+    page_size_query_param = "limit"
+    max_page_size = 100
+
+    next_link = None
+    previous_link = None
+
+    def get_ordering(self, request, queryset, view):
+        ordering = view.cursor_ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def decode_position(self, model, position):
+        try:
+            value, key_value = json.loads(position)
+            if value is not None:
+                value = model._meta.get_field(self.field).to_python(value)  # noqa: SLF001
+            key_value = model._meta.get_field(self.key).to_python(key_value)  # noqa: SLF001
+        except (TypeError, ValueError, ValidationError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+        return value, key_value
+
+    def encode_position(self, instance, reverse):
+        position = json.dumps(
+            [getattr(instance, self.field), getattr(instance, self.key)],
+            # keeps the microseconds of datetimes, unlike DjangoJSONEncoder
+            default=str,
+        )
+        return self.encode_cursor(Cursor(offset=0, reverse=reverse, position=position))
+
+    def get_seek_filter(self, value, key_value, ascending):
+        # nulls compare greater than any value, as in the ordering of the
+        # database
+        lookup = "gt" if ascending else "lt"
+        if value is None:
+            after = Q(
+                **{f"{self.field}__isnull": True, f"{self.key}__{lookup}": key_value}
+            )
+            return after if ascending else after | Q(**{f"{self.field}__isnull": False})
+        after = Q(**{f"{self.field}__{lookup}": value}) | Q(
+            **{self.field: value, f"{self.key}__{lookup}": key_value}
+        )
+        return after | Q(**{f"{self.field}__isnull": True}) if ascending else after
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.field, self.key = (name.lstrip("-") for name in self.ordering)
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+        # previous pages are fetched in the opposite order and flipped
+        ascending = self.ordering[0].startswith("-") == reverse
+
+        if self.cursor and self.cursor.position is not None:
+            queryset = queryset.filter(
+                self.get_seek_filter(
+                    *self.decode_position(queryset.model, self.cursor.position),
+                    ascending,
+                )
+            )
+        ordering = (F(self.field), F(self.key))
+        results = list(
+            queryset.order_by(
+                *(
+                    expression.asc() if ascending else expression.desc()
+                    for expression in ordering
+                )
+            )[: self.page_size + 1]
+        )
+        has_following = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        has_cursor = bool(self.cursor and self.cursor.position is not None)
+        has_next, has_previous = (
+            (has_cursor, has_following) if reverse else (has_following, has_cursor)
+        )
+        self.next_link = self.previous_link = None
+        if self.page and has_next:
+            self.next_link = self.encode_position(self.page[-1], reverse=False)
+        if self.page and has_previous:
+            self.previous_link = self.encode_position(self.page[0], reverse=True)
+        return self.page
+
+    def get_next_link(self):
+        return self.next_link
+
+    def get_previous_link(self):
+        return self.previous_link
+
+
+class LimitOffsetOrCursorPagination(LimitOffsetPagination):
+    """
+    Limit offset pagination, unless the request has a `cursor` parameter in
+    which case the list is paginated with `KeysetPagination`. An empty cursor
+    requests the first page.
+
+    Views using this pagination must define `cursor_ordering`, the ordering
+    of the list in cursor mode, a field and a unique field breaking its ties.
+    """
+
+    cursor_query_param = "cursor"
+    keyset_pagination_class = KeysetPagination
+
+    keyset_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self.keyset_paginator = self.keyset_pagination_class()
+            return self.keyset_paginator.paginate_queryset(queryset, request, view)
+        self.keyset_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset_paginator:
+            return self.keyset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "The pagination cursor value. Pass an empty cursor to "
+                    "paginate the list by cursor instead of offset."
+                ),
+                "schema": {"type": "string"},
+            },
+        ]
@@ -0,0 +1,170 @@
+import hashlib
+import logging
+from collections.abc import Iterable
+from itertools import batched
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import QuerySet, TextField, Value
+from django.db.models.functions import MD5, Cast, Coalesce, Concat
+from redis.exceptions import ResponseError
+from redis_om.model.encoders import jsonable_encoder
+from redis_om.model.migrations.migrator import schema_hash_key
+
+from care.utils.static_data.models.base import BaseRedisModel
+
+logger = logging.getLogger(__name__)
+
+STATIC_DATA_BATCH_SIZE = 5000
+
+# seconds for which the keys of a retired generation are kept around for
+# workers that have not yet noticed the alias swap
+RETIRED_GENERATION_TIMEOUT = 60 * 5
+
+
+def queryset_checksum(queryset: QuerySet, fields: list[str]) -> str:
+    """
+    Computes a checksum of the given fields of a queryset in the database,
+    without fetching the rows.
+    """
+    row = Concat(
+        *(
+            part
+            for field in fields
+            for part in (
+                Coalesce(Cast(field, TextField()), Value("", TextField())),
+                Value("\x1f", TextField()),
+            )
+        ),
+        output_field=TextField(),
+    )
+    checksum = queryset.order_by().aggregate(
+        checksum=MD5(StringAgg(row, delimiter="\n", ordering=fields[0]))
+    )["checksum"]
+    return checksum or ""
+
+
+def model_checksum(model: type[BaseRedisModel], source_checksum: str) -> str:
+    """
+    Includes the search schema of the model in the checksum so that schema
+    changes trigger a rebuild even when the source data is unchanged.
+    """
+    schema = " ".join(model.schema_for_fields())
+    return hashlib.sha1(  # noqa: S324
+        f"{schema}\n{source_checksum}".encode()
+    ).hexdigest()
+
+
+def _live_index_exists(model: type[BaseRedisModel]) -> bool:
+    try:
+        model.db().ft(model.Meta.index_name).info()
+    except ResponseError:
+        return False
+    return True
+
+
+def _to_document(obj: BaseRedisModel) -> dict:
+    # mirrors HashModel.save, values that are None are not valid in a HSET
+    document = jsonable_encoder(obj.dict())
+    return {k: v for k, v in document.items() if v is not None}
+
+
+def _drop_stale_generations(model: type[BaseRedisModel], live_version: int | None):
+    """
+    Drops generations left behind by interrupted loads along with their keys.
+    """
+    conn = model.db()
+    live_index = live_version and model.versioned_index_name(live_version)
+    model_prefix = model._meta.model_key_prefix.strip(":")  # noqa: SLF001
+    global_prefix = model._meta.global_key_prefix.strip(":")  # noqa: SLF001
+    for index_name in conn.execute_command("FT._LIST"):
+        if (
+            index_name.startswith(f"{global_prefix}:v")
+            and index_name.endswith(f":{model_prefix}:index")
+            and index_name != live_index
+        ):
+            logger.info("Dropping stale static data index %s", index_name)
+            conn.ft(index_name).dropindex(delete_documents=True)
+
+
+def _retire_generation(model: type[BaseRedisModel], version: int | None):
+    conn = model.db()
+    pipeline = conn.pipeline(transaction=False)
+    for keys in batched(
+        conn.scan_iter(
+            match=f"{model.key_prefix(version)}*",
+            count=STATIC_DATA_BATCH_SIZE,
+            _type="HASH",
+        ),
+        STATIC_DATA_BATCH_SIZE,
+    ):
+        for key in keys:
+            pipeline.expire(key, RETIRED_GENERATION_TIMEOUT)
+        pipeline.execute()
+
+
+def load_static_data_index(
+    model: type[BaseRedisModel],
+    objects: Iterable[BaseRedisModel],
+    checksum: str,
+    force: bool = False,
+) -> bool:
+    """
+    Loads the objects into a new generation of the model's search index and
+    swaps the model's index alias to it once the generation is complete.
+
+    The load is skipped if the checksum of the live generation matches the
+    given checksum, unless `force` is set. Returns whether a load happened.
+    """
+    conn = model.db()
+    meta_key = model.meta_key()
+    checksum = model_checksum(model, checksum)
+    meta = conn.hgetall(meta_key)
+    live_version = int(meta["version"]) if meta.get("version") else None
+
+    if not force and meta.get("checksum") == checksum and _live_index_exists(model):
+        logger.info("%s is up to date, skipping", model.__name__)
+        return False
+
+    _drop_stale_generations(model, live_version)
+
+    version = conn.hincrby(meta_key, "last_version", 1)
+    index_name = model.versioned_index_name(version)
+    schema = model.versioned_redisearch_schema(version)
+    # the index is created before the documents are written so that it is
+    # complete by the time the alias is swapped
+    conn.execute_command(f"FT.CREATE {index_name} {schema}")
+
+    count = 0
+    for batch in batched(objects, STATIC_DATA_BATCH_SIZE):
+        pipeline = conn.pipeline(transaction=False)
+        for obj in batch:
+            pipeline.hset(obj.versioned_key(version), mapping=_to_document(obj))
+        pipeline.execute()
+        count += len(batch)
+
+    alias = model.Meta.index_name
+    legacy_index_exists = alias in conn.execute_command("FT._LIST")
+    pipeline = conn.pipeline(transaction=True)
+    if legacy_index_exists:
+        # indexes created before versioning used the alias name, the documents
+        # of the legacy index are expired along with the retired generation
+        pipeline.execute_command("FT.DROPINDEX", alias)
+    pipeline.execute_command("FT.ALIASUPDATE", alias, index_name)
+    pipeline.hset(meta_key, mapping={"version": version, "checksum": checksum})
+    # keeps redis_om's Migrator from recreating the index under the alias name
+    pipeline.set(
+        schema_hash_key(alias),
+        hashlib.sha1(schema.encode("utf-8")).hexdigest(),  # noqa: S324
+    )
+    pipeline.execute()
+    model.set_live_version(version)
+
+    if live_version:
+        conn.ft(model.versioned_index_name(live_version)).dropindex(
+            delete_documents=False
+        )
+    if live_version or legacy_index_exists:
+        _retire_generation(model, live_version)
+
+    logger.info("Loaded %s %s objects into %s", count, model.__name__, index_name)
+    return True
@@ -1,15 +1,91 @@
+import time
 from abc import ABC
 
 from django.conf import settings
 from redis_om import HashModel, get_redis_connection
 from redis_om.model.migrations.migrator import schema_hash_key
 
+# seconds for which a worker trusts its copy of the live index version
+LIVE_VERSION_CACHE_TIMEOUT = 30
+
+_live_versions: dict[str, tuple[int | None, float]] = {}
+
 
 class BaseRedisModel(HashModel, ABC):
+    """
+    Static data models are loaded in versioned generations, each with its own
+    key namespace (``care_static_data:v{n}:...``) and search index. The index
+    name of the model (``Meta.index_name``) is an alias that points to the live
+    generation, so searches keep working while the next generation is built.
+    """
+
     class Meta:
         database = get_redis_connection(url=settings.REDIS_URL)
         global_key_prefix = "care_static_data"
 
+    @classmethod
+    def meta_key(cls) -> str:
+        global_prefix = cls._meta.global_key_prefix.strip(":")
+        model_prefix = cls._meta.model_key_prefix.strip(":")
+        return f"{global_prefix}:meta:{model_prefix}"
+
+    @classmethod
+    def live_version(cls) -> int | None:
+        """
+        Returns the live generation of the model, or None if the model was
+        never loaded in versioned mode (legacy unversioned keys).
+        """
+        cache_key = cls.meta_key()
+        version, expires_at = _live_versions.get(cache_key, (None, 0))
+        if expires_at > time.monotonic():
+            return version
+
+        version = cls.db().hget(cache_key, "version")
+        version = int(version) if version else None
+        _live_versions[cache_key] = (
+            version,
+            time.monotonic() + LIVE_VERSION_CACHE_TIMEOUT,
+        )
+        return version
+
+    @classmethod
+    def set_live_version(cls, version: int | None):
+        _live_versions[cls.meta_key()] = (
+            version,
+            time.monotonic() + LIVE_VERSION_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def key_prefix(cls, version: int | None) -> str:
+        global_prefix = cls._meta.global_key_prefix.strip(":")
+        model_prefix = cls._meta.model_key_prefix.strip(":")
+        if version is None:
+            return f"{global_prefix}:{model_prefix}:"
+        return f"{global_prefix}:v{version}:{model_prefix}:"
+
+    @classmethod
+    def make_key(cls, part: str):
+        return f"{cls.key_prefix(cls.live_version())}{part}"
+
+    def versioned_key(self, version: int | None) -> str:
+        pk = getattr(self, self._meta.primary_key.field.name)
+        return (
+            f"{self.key_prefix(version)}{self._meta.primary_key_pattern.format(pk=pk)}"
+        )
+
+    @classmethod
+    def versioned_index_name(cls, version: int) -> str:
+        return f"{cls.key_prefix(version)}index"
+
+    @classmethod
+    def versioned_redisearch_schema(cls, version: int) -> str:
+        return " ".join(
+            [
+                f"ON HASH PREFIX 1 {cls.key_prefix(version)} SCHEMA",
+                *cls.schema_for_fields(),
+            ]
+        )
+
 
 def index_exists(model: HashModel = None):
     """
@@ -0,0 +1,276 @@
+"""
+A compact, array backed prefix index over labelled entries.
+
+The index is serialized into a single file that is memory-mapped by every
+worker, so all processes on a host share one copy of it through the page
+cache. Entries are stored ordered by label length so that the entry order is
+also the rank order of search results (shorter, more specific labels first).
+
+File layout: a header followed by 8-byte aligned sections, see `SECTIONS`.
+"""
+
+import heapq
+import mmap
+import re
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+MAGIC = b"CAREPIX1"
+
+SECTIONS = (
+    ("ids", "q"),  # id of each entry
+    ("flags", "B"),  # flag of each entry (eg. has_code)
+    ("groups", "H"),  # index of the group of each entry (eg. chapter)
+    ("label_offsets", "I"),  # offsets of entry labels in `labels`
+    ("labels", "B"),  # utf-8 encoded labels
+    ("group_offsets", "I"),  # offsets of group names in `group_names`
+    ("group_names", "B"),  # utf-8 encoded group names
+    ("token_offsets", "I"),  # offsets of the sorted vocabulary in `tokens`
+    ("tokens", "B"),  # utf-8 encoded vocabulary
+    ("posting_offsets", "I"),  # offsets of each token's entries in `postings`
+    ("postings", "I"),  # entry indices, ascending for every token
+    ("id_order", "I"),  # entry indices ordered by id, for lookups by id
+)
+
+HEADER = struct.Struct(f"<8sI{len(SECTIONS) * 2}Q")
+
+TOKEN_PATTERN = re.compile(r"\w+(?:\.\w+)*")
+
+# mirrors the default stopwords of redisearch, these are never matched
+STOPWORDS = frozenset(
+    "a is the an and are as at be but by for if in into it no not of on or "
+    "such that their then there these they this to was will with".split()
+)
+
+# candidate sets smaller than this are verified against the labels instead of
+# merging the postings of every token matching a prefix
+VERIFY_THRESHOLD = 256
+
+
+class PrefixIndexEntry(NamedTuple):
+    id: int
+    label: str
+    flag: int
+    group: str
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def build_prefix_index(path: Path, entries: Iterable[PrefixIndexEntry]):
+    """
+    Builds the index file at `path`. The file is written next to its final
+    location and moved into place atomically.
+    """
+    entries = sorted(entries, key=lambda entry: (len(entry.label), entry.id))
+
+    group_lookup: dict[str, int] = {}
+    postings: defaultdict[bytes, list[int]] = defaultdict(list)
+    sections = {name: array(typecode) for name, typecode in SECTIONS}
+    labels = bytearray()
+
+    for index, entry in enumerate(entries):
+        sections["ids"].append(entry.id)
+        sections["flags"].append(entry.flag)
+        sections["groups"].append(
+            group_lookup.setdefault(entry.group, len(group_lookup))
+        )
+        sections["label_offsets"].append(len(labels))
+        labels += entry.label.encode()
+        for token in set(tokenize(entry.label)):
+            postings[token.encode()].append(index)
+    sections["label_offsets"].append(len(labels))
+    sections["labels"].frombytes(labels)
+
+    group_names = bytearray()
+    for group in group_lookup:
+        sections["group_offsets"].append(len(group_names))
+        group_names += group.encode()
+    sections["group_offsets"].append(len(group_names))
+    sections["group_names"].frombytes(group_names)
+
+    tokens = bytearray()
+    for token in sorted(postings):
+        sections["token_offsets"].append(len(tokens))
+        sections["posting_offsets"].append(len(sections["postings"]))
+        tokens += token
+        sections["postings"].extend(postings[token])
+    sections["token_offsets"].append(len(tokens))
+    sections["posting_offsets"].append(len(sections["postings"]))
+    sections["tokens"].frombytes(tokens)
+
+    sections["id_order"].extend(
+        sorted(range(len(entries)), key=lambda index: entries[index].id)
+    )
+
+    layout = []
+    offset = _align(HEADER.size)
+    for name, _ in SECTIONS:
+        size = len(sections[name]) * sections[name].itemsize
+        layout += [offset, size]
+        offset = _align(offset + size)
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+        file.write(HEADER.pack(MAGIC, len(entries), *layout))
+        for (name, _), section_offset in zip(SECTIONS, layout[::2], strict=True):
+            file.seek(section_offset)
+            sections[name].tofile(file)
+        file.truncate(offset)
+    Path(file.name).replace(path)
+
+
+class _Tokens:
+    """Sequence view over the sorted vocabulary for bisecting."""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.blob[self.offsets[index] : self.offsets[index + 1]].tobytes()
+
+
+class PrefixIndex:
+    def __init__(self, path: Path):
+        with path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.size, *layout = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            msg = f"{path} is not a prefix index"
+            raise ValueError(msg)
+
+        view = memoryview(self._mmap)
+        for (name, typecode), offset, size in zip(
+            SECTIONS, layout[::2], layout[1::2], strict=True
+        ):
+            setattr(self, name, view[offset : offset + size].cast(typecode))
+        self._tokens = _Tokens(self.token_offsets, self.tokens)
+
+    def _label(self, index: int) -> str:
+        return bytes(
+            self.labels[self.label_offsets[index] : self.label_offsets[index + 1]]
+        ).decode()
+
+    def _group(self, index: int) -> str:
+        group = self.groups[index]
+        return bytes(
+            self.group_names[self.group_offsets[group] : self.group_offsets[group + 1]]
+        ).decode()
+
+    def _group_index(self, group: str) -> int | None:
+        encoded = group.encode()
+        for index in range(len(self.group_offsets) - 1):
+            if (
+                self.group_names[
+                    self.group_offsets[index] : self.group_offsets[index + 1]
+                ]
+                == encoded
+            ):
+                return index
+        return None
+
+    def _prefix_postings(self, prefix: str) -> set[int]:
+        encoded = prefix.encode()
+        start = bisect_left(self._tokens, encoded)
+        end = bisect_left(self._tokens, encoded + b"\xff", lo=start)
+        matches = set()
+        for token in range(start, end):
+            matches.update(
+                self.postings[
+                    self.posting_offsets[token] : self.posting_offsets[token + 1]
+                ]
+            )
+        return matches
+
+    def _has_prefix(self, index: int, prefix: str) -> bool:
+        return any(token.startswith(prefix) for token in tokenize(self._label(index)))
+
+    def entry(self, index: int) -> PrefixIndexEntry:
+        return PrefixIndexEntry(
+            self.ids[index], self._label(index), self.flags[index], self._group(index)
+        )
+
+    def get(self, id: int) -> PrefixIndexEntry | None:
+        position = bisect_left(self.id_order, id, key=lambda index: self.ids[index])
+        if position < self.size and self.ids[self.id_order[position]] == id:
+            return self.entry(self.id_order[position])
+        return None
+
+    def search(
+        self,
+        query: str | None,
+        limit: int,
+        flag: int | None = None,
+        group: str | None = None,
+    ) -> list[PrefixIndexEntry]:
+        """
+        Returns up to `limit` entries whose labels contain a token starting
+        with every word of the query, optionally filtered by flag and group.
+        """
+        group_index = None
+        if group is not None:
+            group_index = self._group_index(group)
+            if group_index is None:
+                return []
+
+        def matches_filters(index):
+            return (flag is None or self.flags[index] == flag) and (
+                group_index is None or self.groups[index] == group_index
+            )
+
+        prefixes = sorted(
+            {word for word in tokenize(query or "") if word not in STOPWORDS},
+            key=len,
+            reverse=True,
+        )
+        if not prefixes:
+            results = []
+            for index in range(self.size):
+                if matches_filters(index):
+                    results.append(self.entry(index))
+                    if len(results) == limit:
+                        break
+            return results
+
+        # longer prefixes are more selective, narrow down with them first
+        candidates = self._prefix_postings(prefixes[0])
+        for prefix in prefixes[1:]:
+            if len(candidates) < VERIFY_THRESHOLD:
+                candidates = {
+                    index for index in candidates if self._has_prefix(index, prefix)
+                }
+            else:
+                candidates &= self._prefix_postings(prefix)
+            if not candidates:
+                return []
+
+        return [
+            self.entry(index)
+            for index in heapq.nsmallest(
+                limit, (index for index in candidates if matches_filters(index))
+            )
+        ]
+
+
+def remove_stale_index_files(directory: Path, pattern: str, keep: Path):
+    for path in directory.glob(pattern):
+        if path != keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
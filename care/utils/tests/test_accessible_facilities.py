@@ -0,0 +1,66 @@
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from care.facility.models import FacilityUser
+from care.utils.cache.cache_allowed_facilities import get_accessible_facilities
+from care.utils.cache.request_cache import RequestCacheMiddleware
+from care.utils.tests.test_utils import TestUtils
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class AccessibleFacilitiesCacheTestCase(TestUtils, APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.state = cls.create_state()
+        cls.district = cls.create_district(cls.state)
+        cls.local_body = cls.create_local_body(cls.district)
+        cls.super_user = cls.create_super_user("su", cls.district)
+        cls.facility = cls.create_facility(cls.super_user, cls.district, cls.local_body)
+        cls.other_facility = cls.create_facility(
+            cls.super_user, cls.district, cls.local_body
+        )
+        cls.user = cls.create_user(
+            "staff", cls.district, home_facility=cls.facility, user_type=15
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_authenticate(user=self.user)
+
+    def get_facility_ids(self):
+        response = self.client.get("/api/v1/facility/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {facility["id"] for facility in response.data["results"]}
+
+    def test_facilities_are_looked_up_once_per_request(self):
+        def get_response(request):
+            with self.assertNumQueries(1):
+                for _ in range(3):
+                    self.assertEqual(
+                        get_accessible_facilities(self.user), [self.facility.id]
+                    )
+
+        RequestCacheMiddleware(get_response)(RequestFactory().get("/"))
+        with self.assertNumQueries(0):
+            get_accessible_facilities(self.user)
+
+    def test_cache_is_invalidated_when_facility_users_change(self):
+        self.assertEqual(self.get_facility_ids(), {str(self.facility.external_id)})
+
+        facility_user = FacilityUser.objects.create(
+            facility=self.other_facility, user=self.user, created_by=self.super_user
+        )
+        self.assertEqual(
+            self.get_facility_ids(),
+            {str(self.facility.external_id), str(self.other_facility.external_id)},
+        )
+
+        facility_user.delete()
+        self.assertEqual(self.get_facility_ids(), {str(self.facility.external_id)})
+
+        FacilityUser.objects.filter(user=self.user).delete()
+        self.assertEqual(self.get_facility_ids(), set())
@@ -0,0 +1,82 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from django.test import SimpleTestCase, override_settings
+
+from care.utils.assetintegration.client import (
+    MiddlewareUnavailableError,
+    get_middleware_stats,
+    log_middleware_stats,
+    middleware_request,
+)
+from care.utils.jwks.token_generator import get_cached_jwt
+
+
+class MiddlewareHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.server.requests.append((self.path, self.client_address))
+        status = 500 if self.path == "/fail" else 200
+        body = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MiddlewareClientTestCase(SimpleTestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MiddlewareHandler)
+        self.server.requests = []
+        self.hostname = f"127.0.0.1:{self.server.server_port}"
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def get(self, path):
+        return middleware_request("GET", f"http://{self.hostname}{path}")
+
+    def test_connections_are_kept_alive(self):
+        for _ in range(3):
+            self.assertEqual(self.get("/status").status_code, 200)
+
+        self.assertEqual(len({address for _, address in self.server.requests}), 1)
+        stats = get_middleware_stats()[self.hostname]
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["failures"], 0)
+        self.assertFalse(stats["circuit_open"])
+
+    @override_settings(MIDDLEWARE_CIRCUIT_BREAKER_THRESHOLD=2)
+    def test_requests_fail_fast_after_consecutive_failures(self):
+        self.assertEqual(self.get("/fail").status_code, 500)
+        self.assertEqual(self.get("/status").status_code, 200)
+        self.assertEqual(self.get("/fail").status_code, 500)
+        self.assertEqual(self.get("/fail").status_code, 500)
+
+        with self.assertRaises(MiddlewareUnavailableError):
+            self.get("/status")
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertTrue(get_middleware_stats()[self.hostname]["circuit_open"])
+
+    def test_stats_are_logged_per_host(self):
+        self.get("/status")
+
+        with self.assertLogs("care.utils.assetintegration.client", "INFO") as logs:
+            log_middleware_stats()
+
+        (record,) = (
+            record
+            for record in logs.records
+            if record.middleware_hostname == self.hostname
+        )
+        self.assertEqual(record.middleware_stats["requests"], 1)
+        self.assertIn('"failures": 0', record.getMessage())
+
+    def test_tokens_are_reused_until_they_expire(self):
+        self.assertEqual(get_cached_jwt(), get_cached_jwt())
+        self.assertNotEqual(get_cached_jwt(), get_cached_jwt(exp=120))
@@ -0,0 +1,53 @@
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from care.utils.static_data.prefix_index import (
+    PrefixIndex,
+    PrefixIndexEntry,
+    build_prefix_index,
+)
+
+ENTRIES = [
+    PrefixIndexEntry(5, "ME24.A1 Haemorrhage of anus and rectum", 1, "Digestive"),
+    PrefixIndexEntry(3, "1A00 Cholera", 1, "Infection"),
+    PrefixIndexEntry(9, "13 Diseases of the digestive system", 0, "Digestive"),
+    PrefixIndexEntry(1, "ME24.A0 Haemorrhage of anus", 1, "Digestive"),
+    PrefixIndexEntry(7, "1A01 Intestinal infection due to other Vibrio", 1, ""),
+]
+
+
+class PrefixIndexTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "test.idx"
+        build_prefix_index(path, ENTRIES)
+        self.index = PrefixIndex(path)
+
+    def search_ids(self, query, limit=10, **kwargs):
+        return [entry.id for entry in self.index.search(query, limit, **kwargs)]
+
+    def test_prefix_search_matches_all_words(self):
+        self.assertEqual(self.search_ids("haem rect"), [5])
+        self.assertEqual(self.search_ids("HAEMORRHAGE"), [1, 5])
+        self.assertEqual(self.search_ids("me24.a1"), [5])
+        self.assertEqual(self.search_ids("cholera haem"), [])
+
+    def test_stopwords_are_ignored(self):
+        self.assertEqual(self.search_ids("haemorrhage of the anus"), [1, 5])
+
+    def test_results_are_ranked_by_label_length(self):
+        self.assertEqual(self.search_ids("1a0"), [3, 7])
+        self.assertEqual(self.search_ids("", limit=2), [3, 1])
+
+    def test_filters(self):
+        self.assertEqual(self.search_ids("d", flag=0), [9])
+        self.assertEqual(self.search_ids("", group="Digestive", flag=1), [1, 5])
+        self.assertEqual(self.search_ids("", group="Unknown"), [])
+
+    def test_get(self):
+        self.assertEqual(self.index.get(3), ENTRIES[1])
+        self.assertEqual(self.index.get(7), ENTRIES[4])
+        self.assertIsNone(self.index.get(4))
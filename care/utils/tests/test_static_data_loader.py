@@ -0,0 +1,58 @@
+from django.test import TestCase
+
+from care.facility.models import MedibaseMedicine as MedibaseMedicineModel
+from care.facility.static_data.icd11 import ICD11
+from care.utils.static_data.loader import model_checksum, queryset_checksum
+
+MEDIBASE_FIELDS = ["external_id", "name", "type", "generic"]
+
+
+class StaticDataLoaderTestCase(TestCase):
+    def test_checksum_is_stable_for_unchanged_data(self):
+        queryset = MedibaseMedicineModel.objects.all()
+        self.assertEqual(
+            queryset_checksum(queryset, MEDIBASE_FIELDS),
+            queryset_checksum(queryset, MEDIBASE_FIELDS),
+        )
+
+    def test_checksum_changes_with_source_data(self):
+        queryset = MedibaseMedicineModel.objects.all()
+        initial = queryset_checksum(queryset, MEDIBASE_FIELDS)
+
+        medicine = MedibaseMedicineModel.objects.create(
+            name="Checksum Test Medicine", type="brand"
+        )
+        created = queryset_checksum(queryset, MEDIBASE_FIELDS)
+        self.assertNotEqual(initial, created)
+
+        medicine.generic = "checksum-generic"
+        medicine.save()
+        updated = queryset_checksum(queryset, MEDIBASE_FIELDS)
+        self.assertNotEqual(created, updated)
+
+        medicine.delete()
+        self.assertEqual(initial, queryset_checksum(queryset, MEDIBASE_FIELDS))
+
+    def test_model_checksum_includes_schema(self):
+        self.assertNotEqual(model_checksum(ICD11, "abc"), "abc")
+        self.assertEqual(model_checksum(ICD11, "abc"), model_checksum(ICD11, "abc"))
+
+    def test_versioned_key_namespace(self):
+        prefix = "care_static_data:v3:care.facility.static_data.icd11.ICD11:"
+        self.assertEqual(ICD11.key_prefix(3), prefix)
+        self.assertEqual(ICD11.versioned_index_name(3), f"{prefix}index")
+        self.assertTrue(
+            ICD11.versioned_redisearch_schema(3).startswith(
+                f"ON HASH PREFIX 1 {prefix} SCHEMA"
+            )
+        )
+        self.assertEqual(
+            ICD11(
+                id=1, label="label", chapter="null", has_code=0, vec="label"
+            ).versioned_key(3),
+            f"{prefix}1",
+        )
+        self.assertEqual(
+            ICD11.key_prefix(None),
+            "care_static_data:care.facility.static_data.icd11.ICD11:",
+        )
@@ -0,0 +1,106 @@
+import logging
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+import requests
+from django.conf import settings
+from pywebpush import WebPushException, webpush
+from requests.adapters import HTTPAdapter
+
+from care.users.models import User
+
+logger = logging.getLogger(__name__)
+
+# push services reply with these when a subscription has expired or was revoked
+GONE_STATUS_CODES = (404, 410)
+
+
+class WebPushResult(Enum):
+    SENT = "sent"
+    GONE = "gone"
+    FAILED = "failed"
+
+
+def has_subscription(user: User) -> bool:
+    return bool(user.pf_endpoint and user.pf_p256dh and user.pf_auth)
+
+
+def push_message(
+    user: User, message: str, session: requests.Session | None = None
+) -> WebPushResult:
+    try:
+        webpush(
+            subscription_info={
+                "endpoint": user.pf_endpoint,
+                "keys": {"p256dh": user.pf_p256dh, "auth": user.pf_auth},
+            },
+            data=message,
+            vapid_private_key=settings.VAPID_PRIVATE_KEY,
+            vapid_claims={
+                "sub": "mailto:info@ohc.network",
+            },
+            timeout=settings.WEBPUSH_REQUEST_TIMEOUT,
+            requests_session=session,
+        )
+    except WebPushException as ex:
+        logger.info("Web Push Failed with Exception: %s", repr(ex))
+        if ex.response is not None and ex.response.status_code in GONE_STATUS_CODES:
+            return WebPushResult.GONE
+        return WebPushResult.FAILED
+    except Exception as e:
+        logger.info("Error When Doing WebPush: %s", e)
+        return WebPushResult.FAILED
+    return WebPushResult.SENT
+
+
+def send_webpush_messages(
+    messages: Iterable[tuple[User, str]],
+) -> dict[str, WebPushResult]:
+    """
+    Pushes the messages to the subscriptions of their users concurrently,
+    with at most `WEBPUSH_CONCURRENCY` requests in flight over a shared
+    connection pool, and prunes the subscriptions that no longer exist.
+
+    Returns the outcome of the last message pushed to each endpoint.
+    """
+    messages = [(user, message) for user, message in messages if has_subscription(user)]
+    if not messages:
+        return {}
+
+    concurrency = min(settings.WEBPUSH_CONCURRENCY, len(messages))
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="webpush"
+        ) as executor:
+            outcomes = list(
+                executor.map(
+                    lambda item: push_message(*item, session=session), messages
+                )
+            )
+
+    results = {}
+    for (user, _), outcome in zip(messages, outcomes, strict=True):
+        results[user.pf_endpoint] = outcome
+
+    if gone := [
+        endpoint
+        for endpoint, outcome in results.items()
+        if outcome == WebPushResult.GONE
+    ]:
+        User.objects.filter(pf_endpoint__in=gone).update(
+            pf_endpoint=None, pf_p256dh=None, pf_auth=None
+        )
+
+    counts = Counter(outcome.value for outcome in outcomes)
+    logger.info(
+        "Web Push: %s sent, %s failed, %s subscriptions pruned",
+        counts[WebPushResult.SENT.value],
+        counts[WebPushResult.FAILED.value],
+        len(gone),
+    )
+    return results
@@ -93,6 +93,7 @@ from care.facility.api.viewsets.summary import (
     TestsSummaryViewSet,
     TriageSummaryViewSet,
 )
+from care.facility.api.viewsets.vitals import VitalsViewSet
 from care.users.api.viewsets.lsg import (
     DistrictViewSet,
     LocalBodyViewSet,
@@ -310,6 +311,9 @@ consultation_nested_router.register(
 consultation_nested_router.register(
     r"consents", PatientConsentViewSet, basename="consultation-consents"
 )
+consultation_nested_router.register(
+    r"vitals", VitalsViewSet, basename="consultation-vitals"
+)
 
 router.register("event_types", EventTypeViewSet, basename="event-types")
 
@@ -3,6 +3,7 @@ Base settings to build other settings files upon.
 """
 
 import logging
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -196,6 +197,7 @@ MIDDLEWARE = [
     "simple_history.middleware.HistoryRequestMiddleware",
     "maintenance_mode.middleware.MaintenanceModeMiddleware",
     "care.audit_log.middleware.AuditLogMiddleware",
+    "care.utils.cache.request_cache.RequestCacheMiddleware",
 ]
 
 # add RequestTimeLoggingMiddleware based on the environment variable
@@ -462,6 +464,8 @@ HEALTHY_DJANGO = [
 # Audit logs
 # ------------------------------------------------------------------------------
 AUDIT_LOG_ENABLED = env.bool("AUDIT_LOG_ENABLED", default=False)
+# write audit log records from a background thread instead of the request
+AUDIT_LOG_ASYNC = env.bool("AUDIT_LOG_ASYNC", default=True)
 AUDIT_LOG = {
     "globals": {
         "exclude": {
@@ -507,6 +511,16 @@ ICD_SCRAPER_ROOT_CONCEPTS_URL = (
 ICD_SCRAPER_CHILD_CONCEPTS_URL = (
     "https://icd.who.int/browse11/l-m/en/JsonGetChildrenConcepts"
 )
+# backend for the ICD11 diagnosis search, either "redis" (redisearch) or
+# "memory" (memory-mapped prefix index shared by the workers of a host)
+ICD11_SEARCH_BACKEND = env("ICD11_SEARCH_BACKEND", default="redis")
+ICD11_SEARCH_INDEX_DIR = env(
+    "ICD11_SEARCH_INDEX_DIR", default=str(Path(tempfile.gettempdir()) / "care")
+)
+# seconds after which a worker looks for a newer ICD11 search index
+ICD11_SEARCH_INDEX_REFRESH_INTERVAL = env.int(
+    "ICD11_SEARCH_INDEX_REFRESH_INTERVAL", default=60
+)
 
 # Rate Limiting
 # ------------------------------------------------------------------------------
@@ -531,6 +545,10 @@ VAPID_PRIVATE_KEY = env(
 )
 SEND_SMS_NOTIFICATION = False
 NOTIFICATION_RETENTION_DAYS = env.int("NOTIFICATION_RETENTION_DAYS", default=30)
+# Number of web push notifications delivered at once
+WEBPUSH_CONCURRENCY = env.int("WEBPUSH_CONCURRENCY", default=16)
+# Timeout for a web push request (in seconds)
+WEBPUSH_REQUEST_TIMEOUT = env.int("WEBPUSH_REQUEST_TIMEOUT", default=10)
 
 # Cloud and Buckets
 # ------------------------------------------------------------------------------
@@ -627,6 +645,34 @@ MIN_ENCOUNTER_DATE = env(
 
 # for exporting csv
 CSV_REQUEST_PARAMETER = "csv"
+# Number of objects fetched at a time while exporting a CSV
+CSV_EXPORT_CHUNK_SIZE = env.int("CSV_EXPORT_CHUNK_SIZE", default=1000)
+# Size (in bytes) up to which background CSV exports are kept in memory
+CSV_EXPORT_SPOOL_SIZE = env.int("CSV_EXPORT_SPOOL_SIZE", default=10 * 1024 * 1024)
+
+# Minimum trigram similarity of the names matched by the patient search
+PATIENT_SEARCH_SIMILARITY_THRESHOLD = env.float(
+    "PATIENT_SEARCH_SIMILARITY_THRESHOLD", default=0.2
+)
+
+# Seconds for which the facilities and other access scopes of users are cached
+ACCESS_CACHE_TIMEOUT = env.int("ACCESS_CACHE_TIMEOUT", default=60 * 60)
+
+# Seconds for which presigned read URLs of uploaded files are reused
+SIGNED_URL_CACHE_TIMEOUT = env.int("SIGNED_URL_CACHE_TIMEOUT", default=5 * 60)
+
+# Number of external tests above which uploads are imported in the background
+EXTERNAL_TEST_IMPORT_SYNC_LIMIT = env.int(
+    "EXTERNAL_TEST_IMPORT_SYNC_LIMIT", default=5000
+)
+# Number of external tests inserted and matched against patients per query
+EXTERNAL_TEST_IMPORT_BATCH_SIZE = env.int(
+    "EXTERNAL_TEST_IMPORT_BATCH_SIZE", default=1000
+)
+# Most readings of a vital stored in a single chunk, an hour at one per 5 seconds
+VITALS_CHUNK_SIZE = env.int("VITALS_CHUNK_SIZE", default=720)
+# Most readings of vitals accepted in a single batch from middleware
+VITALS_INGEST_MAX_READINGS = env.int("VITALS_INGEST_MAX_READINGS", default=5000)
 
 # current hosted domain
 CURRENT_DOMAIN = env("CURRENT_DOMAIN", default="localhost:8000")
@@ -653,3 +699,16 @@ TASK_SUMMARIZE_DISTRICT_PATIENT = env.bool(
 
 # Timeout for middleware request (in seconds)
 MIDDLEWARE_REQUEST_TIMEOUT = env.int("MIDDLEWARE_REQUEST_TIMEOUT", 20)
+# Number of middlewares polled at once by the asset and location monitors
+MIDDLEWARE_POLL_CONCURRENCY = env.int("MIDDLEWARE_POLL_CONCURRENCY", 16)
+# Number of keep-alive connections kept open to each middleware by a process
+MIDDLEWARE_POOL_SIZE = env.int("MIDDLEWARE_POOL_SIZE", 10)
+# Number of retries of middleware requests that failed to connect or, for
+# idempotent requests, got a gateway error
+MIDDLEWARE_REQUEST_RETRIES = env.int("MIDDLEWARE_REQUEST_RETRIES", 2)
+# Number of consecutive failed requests after which requests to a middleware
+# fail fast, and for how long (in seconds)
+MIDDLEWARE_CIRCUIT_BREAKER_THRESHOLD = env.int(
+    "MIDDLEWARE_CIRCUIT_BREAKER_THRESHOLD", 5
+)
+MIDDLEWARE_CIRCUIT_BREAKER_TIMEOUT = env.int("MIDDLEWARE_CIRCUIT_BREAKER_TIMEOUT", 30)
@@ -9,6 +9,7 @@ cd /app
 echo "running collectstatic..."
 python manage.py collectstatic --noinput
 python manage.py compilemessages
+python manage.py build_icd11_search_index
 
 echo "starting server..."
 if [ "${DJANGO_DEBUG:-false}" = "true" ]; then
@@ -33,4 +33,5 @@ done
 
 python manage.py collectstatic --noinput
 python manage.py compilemessages
+python manage.py build_icd11_search_index
 gunicorn config.wsgi:application --bind 0.0.0.0:9000 --chdir=/app --workers 2
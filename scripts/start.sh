@@ -35,4 +35,5 @@ python manage.py collectstatic --noinput
 export NEW_RELIC_CONFIG_FILE=/etc/newrelic.ini
 
 python manage.py compilemessages
+python manage.py build_icd11_search_index
 newrelic-admin run-program gunicorn config.wsgi:application --bind 0.0.0.0:9000 --chdir=/app